@@ -0,0 +1,79 @@
+"""
+Requests/sec on GET /containers with a per-call Docker client vs the pooled one.
+
+Needs a reachable Docker daemon. Run from the Backend directory:
+
+    python -m Benchmarks.bench_containers_endpoint --requests 200 --concurrency 16
+"""
+import argparse
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import docker
+import uvicorn
+
+from Utils import getDocker
+
+
+def _per_call_client() -> docker.DockerClient:
+    return docker.from_env()
+
+
+def _swap_client_factory(factory) -> None:
+    # Route modules import get_docker_client by name, so patch every reference.
+    for module in list(sys.modules.values()):
+        if getattr(module, "get_docker_client", None) in (getDocker.get_docker_client, _per_call_client):
+            setattr(module, "get_docker_client", factory)
+
+
+def _start_server(port: int) -> uvicorn.Server:
+    from main import app
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def _run(url: str, total: int, concurrency: int) -> float:
+    def hit(_):
+        with urllib.request.urlopen(url) as response:
+            response.read()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(hit, range(min(concurrency, total))))  # warm-up
+        started = time.perf_counter()
+        list(pool.map(hit, range(total)))
+        return total / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = _start_server(args.port)
+    url = f"http://127.0.0.1:{args.port}/containers?all=true"
+
+    try:
+        _swap_client_factory(_per_call_client)
+        before = _run(url, args.requests, args.concurrency)
+
+        _swap_client_factory(getDocker.get_docker_client)
+        after = _run(url, args.requests, args.concurrency)
+    finally:
+        server.should_exit = True
+
+    print(f"per-call client : {before:8.1f} req/s")
+    print(f"pooled client   : {after:8.1f} req/s")
+    print(f"speedup         : {after / before:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
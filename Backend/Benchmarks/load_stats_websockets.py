@@ -0,0 +1,180 @@
+"""
+HTTP latency while many stats websockets are open.
+
+Measures GET latency (p50/p99) with no sockets open, then again with
+`--sockets` concurrent /ws/containers/{id}/stats subscribers reading frames.
+With the stats pipeline off the event loop the two runs should match.
+
+Against a real daemon, pass a running container:
+
+    python -m Benchmarks.load_stats_websockets --container web --sockets 200
+
+`--simulate` replaces the daemon side of the stats pipeline with a
+synthetic 1 Hz stream, which isolates the server's own event loop:
+
+    python -m Benchmarks.load_stats_websockets --simulate --sockets 200
+"""
+import argparse
+import asyncio
+import base64
+import os
+import statistics
+import threading
+import time
+from typing import List
+
+import uvicorn
+
+HTTP_PATH = "/docker/query-stats"
+
+
+def _start_server(port: int) -> uvicorn.Server:
+    from main import app
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", lifespan="off"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def _simulate_daemon() -> str:
+    """Swap the container lookup and upstream stats stream for synthetic ones."""
+    import main
+    from Utils.stats_hub import stats_hub
+
+    async def fake_container(container_id: str) -> dict:
+        return {"Id": container_id, "State": {"StartedAt": "2024-01-01T00:00:00Z"}}
+
+    class FakeApi:
+        @staticmethod
+        def stats(container_id, stream, decode):
+            total = 0
+            while True:
+                total += 10_000_000
+                yield {
+                    "cpu_stats": {"cpu_usage": {"total_usage": total, "percpu_usage": [total]},
+                                  "system_cpu_usage": total * 4},
+                    "precpu_stats": {"cpu_usage": {"total_usage": total - 10_000_000},
+                                     "system_cpu_usage": (total - 10_000_000) * 4},
+                    "memory_stats": {"usage": 50 << 20, "limit": 1 << 30},
+                }
+                time.sleep(1)
+
+    class FakeClient:
+        api = FakeApi()
+
+    main.get_container_async = fake_container
+    stats_hub._client_factory = lambda: FakeClient()
+    return "simulated"
+
+
+async def _http_get(reader, writer) -> None:
+    writer.write(f"GET {HTTP_PATH} HTTP/1.1\r\nHost: 127.0.0.1\r\n\r\n".encode())
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = 0
+    for line in head.split(b"\r\n"):
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":", 1)[1])
+    await reader.readexactly(length)
+
+
+async def _measure(port: int, duration: float, concurrency: int) -> List[float]:
+    latencies: List[float] = []
+    deadline = time.monotonic() + duration
+
+    async def worker():
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                await _http_get(reader, writer)
+                latencies.append(time.perf_counter() - started)
+        finally:
+            writer.close()
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+async def _stats_socket(port: int, container: str, frames: List[int], index: int, stop: asyncio.Event) -> None:
+    """Minimal RFC 6455 client: handshake, then read (unmasked) server frames until told to stop."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    key = base64.b64encode(os.urandom(16)).decode()
+    writer.write((
+        f"GET /ws/containers/{container}/stats HTTP/1.1\r\nHost: 127.0.0.1\r\n"
+        f"Upgrade: websocket\r\nConnection: Upgrade\r\nSec-WebSocket-Key: {key}\r\n"
+        f"Sec-WebSocket-Version: 13\r\n\r\n"
+    ).encode())
+    await writer.drain()
+    await reader.readuntil(b"\r\n\r\n")
+
+    try:
+        while not stop.is_set():
+            header = await reader.readexactly(2)
+            length = header[1] & 0x7F
+            if length == 126:
+                length = int.from_bytes(await reader.readexactly(2), "big")
+            elif length == 127:
+                length = int.from_bytes(await reader.readexactly(8), "big")
+            await reader.readexactly(length)
+            if header[0] & 0x0F == 0x8:
+                break
+            frames[index] += 1
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def _report(label: str, latencies: List[float]) -> None:
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(f"{label:<24} {len(ordered):7d} req   p50 {statistics.median(ordered) * 1000:7.2f} ms"
+          f"   p99 {p99 * 1000:7.2f} ms")
+
+
+async def _run(args) -> None:
+    baseline = await _measure(args.port, args.duration, args.concurrency)
+
+    stop = asyncio.Event()
+    frames = [0] * args.sockets
+    sockets = [asyncio.create_task(_stats_socket(args.port, args.container, frames, i, stop))
+               for i in range(args.sockets)]
+    await asyncio.sleep(2)
+    loaded = await _measure(args.port, args.duration, args.concurrency)
+    stop.set()
+    for task in sockets:
+        task.cancel()
+    await asyncio.gather(*sockets, return_exceptions=True)
+
+    _report("HTTP, no websockets", baseline)
+    _report(f"HTTP, {args.sockets} websockets", loaded)
+    print(f"stats frames received    {sum(frames):7d} ({sum(1 for f in frames if f)} sockets got data)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--container", default=None, help="Running container to watch")
+    parser.add_argument("--simulate", action="store_true", help="Use a synthetic stats stream instead of Docker")
+    parser.add_argument("--sockets", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent HTTP clients")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per measurement phase")
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    if args.simulate:
+        args.container = _simulate_daemon()
+    elif not args.container:
+        parser.error("--container is required unless --simulate is given")
+
+    server = _start_server(args.port)
+    try:
+        asyncio.run(_run(args))
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
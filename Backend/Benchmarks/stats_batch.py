@@ -0,0 +1,114 @@
+"""
+Scalar vs vectorized stats math for one sampler sweep.
+
+Builds `--containers` synthetic Engine API samples and times, per sweep:
+
+* scalar: `_calculate_cpu_percent`, memory%, `_extract_network_io` and
+  `_extract_blk_io` plus counter rates, one container at a time
+* batch:  `Utils.stats_batch.flatten` + `compute` + `rates`
+* `MetricsStore.record` per container vs `MetricsStore.record_batch`
+
+    python -m Benchmarks.stats_batch --containers 1000
+"""
+import argparse
+import random
+import statistics
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from Utils.metrics_store import MetricsStore
+from Utils.stats import _calculate_cpu_percent, _extract_network_io, _extract_blk_io
+from Utils.stats_batch import SweepTracker, flatten, compute, rates
+from Utils.stats_sampler import StatsSample
+
+
+def _sample(rng: random.Random, tick: int) -> dict:
+    total = 10 ** 12 + tick * rng.randint(10 ** 6, 10 ** 9)
+    system = 10 ** 15 + tick * 4 * 10 ** 9
+    return {
+        "cpu_stats": {"cpu_usage": {"total_usage": total, "percpu_usage": [0] * 4}, "system_cpu_usage": system},
+        "precpu_stats": {"cpu_usage": {"total_usage": total - 10 ** 8}, "system_cpu_usage": system - 4 * 10 ** 9},
+        "memory_stats": {"usage": rng.randint(1 << 20, 1 << 30), "limit": 1 << 32},
+        "networks": {"eth0": {"rx_bytes": tick * 1000, "tx_bytes": tick * 500}},
+        "blkio_stats": {"io_service_bytes_recursive": [{"op": "Read", "value": tick * 4096},
+                                                       {"op": "Write", "value": tick * 8192}]},
+    }
+
+
+def _time(fn: Callable[[], None], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def _report(label: str, timings: List[float]) -> float:
+    median = statistics.median(timings)
+    print(f"{label:<28} median {median * 1000:8.3f} ms   min {min(timings) * 1000:8.3f} ms")
+    return median
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--containers", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    previous = [_sample(rng, 1) for _ in range(args.containers)]
+    current = [_sample(rng, 2) for _ in range(args.containers)]
+
+    def scalar():
+        for stats, before in zip(current, previous):
+            _calculate_cpu_percent(stats)
+            memory = stats["memory_stats"]
+            memory["usage"] / (memory.get("limit") or 1) * 100
+            now_net, now_blk = _extract_network_io(stats), _extract_blk_io(stats)
+            old_net, old_blk = _extract_network_io(before), _extract_blk_io(before)
+            [max(0, a - b) / 1.0 for a, b in zip(
+                (now_net["rx"], now_net["tx"], now_blk["read"], now_blk["write"]),
+                (old_net["rx"], old_net["tx"], old_blk["read"], old_blk["write"]),
+            )]
+
+    previous_counters = flatten(previous).counters
+    elapsed = np.ones(args.containers)
+
+    def batch():
+        result = compute(flatten(current))
+        rates(result.counters, previous_counters, elapsed)
+
+    columns = flatten(current)
+
+    print(f"{args.containers} containers, {args.repeat} runs")
+    slow = _report("scalar", _time(scalar, args.repeat))
+    fast = _report("batch (flatten + math)", _time(batch, args.repeat))
+    _report("batch math only", _time(lambda: rates(compute(columns).counters, previous_counters, elapsed),
+                                     args.repeat))
+    print(f"{'speed-up':<28} {slow / fast:8.1f}x")
+
+    ids = [f"c{i}" for i in range(args.containers)]
+    scalar_store, batch_store, tracker = MetricsStore(), MetricsStore(), SweepTracker()
+    for cid, stats in zip(ids, previous):
+        scalar_store.record(cid, stats, 0.0)
+    batch_store.record_batch(tracker.build({cid: StatsSample(stats, 0.0) for cid, stats in zip(ids, previous)}))
+    ticks = iter(range(1, 10 ** 9))
+
+    def store_scalar():
+        timestamp = float(next(ticks))
+        for cid, stats in zip(ids, current):
+            scalar_store.record(cid, stats, timestamp)
+
+    def store_batch():
+        timestamp = float(next(ticks))
+        sweep = {cid: StatsSample(stats, timestamp) for cid, stats in zip(ids, current)}
+        batch_store.record_batch(tracker.build(sweep))
+
+    _report("MetricsStore.record x N", _time(store_scalar, args.repeat))
+    _report("MetricsStore.record_batch", _time(store_batch, args.repeat))
+
+if __name__ == "__main__":
+    main()
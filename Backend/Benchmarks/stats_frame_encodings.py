@@ -0,0 +1,69 @@
+"""
+Encode cost and size of each stats websocket frame format.
+
+Times `--frames` encodes of a per-container frame (with `--cores` entries in
+`per_cpu_usage`) and of a host feed frame with `--rows` containers, for every
+available codec in `Utils.frame_codec` (json is byte-for-byte what
+`send_json` sent before).
+
+    python -m Benchmarks.stats_frame_encodings --cores 64 --rows 500
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timezone
+
+from Utils.frame_codec import CODECS
+from Utils.stats import build_stats_frame
+
+
+def _container_frame(cores: int) -> dict:
+    rng = random.Random(1)
+    per_cpu = [rng.randint(10 ** 12, 10 ** 13) for _ in range(cores)]
+    stats = {
+        "cpu_stats": {"cpu_usage": {"total_usage": sum(per_cpu), "percpu_usage": per_cpu},
+                      "system_cpu_usage": 10 ** 16},
+        "precpu_stats": {"cpu_usage": {"total_usage": sum(per_cpu) - 10 ** 9}, "system_cpu_usage": 10 ** 16 - 10 ** 10},
+        "memory_stats": {"usage": 734_003_200, "limit": 8 << 30},
+        "networks": {"eth0": {"rx_bytes": 123_456_789, "tx_bytes": 98_765_432}},
+        "blkio_stats": {"io_service_bytes_recursive": [{"op": "Read", "value": 4_096_000},
+                                                       {"op": "Write", "value": 8_192_000}]},
+    }
+    return build_stats_frame(stats, datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+
+def _host_frame(rows: int) -> dict:
+    rng = random.Random(2)
+    return {
+        "type": "stats",
+        "sampled_at": time.time(),
+        "rows": {f"{i:012x}": (round(rng.uniform(0, 400), 2), rng.randint(1 << 20, 1 << 32), 8 << 30,
+                               round(rng.uniform(0, 1e6), 1), round(rng.uniform(0, 1e6), 1), 0.0, 0.0)
+                 for i in range(rows)},
+    }
+
+
+def _bench(label: str, frame: dict, count: int) -> None:
+    print(label)
+    for name, codec in CODECS.items():
+        started = time.perf_counter()
+        for _ in range(count):
+            payload = codec.encode(frame)
+        per_frame = (time.perf_counter() - started) / count
+        size = len(payload if isinstance(payload, bytes) else payload.encode())
+        print(f"  {name:<10} {size:8d} bytes   {per_frame * 1e6:9.2f} us/frame")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cores", type=int, default=64)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--frames", type=int, default=20000)
+    args = parser.parse_args()
+
+    _bench(f"container frame, {args.cores} cores", _container_frame(args.cores), args.frames)
+    _bench(f"host frame, {args.rows} rows", _host_frame(args.rows), max(1, args.frames // args.rows))
+
+
+if __name__ == "__main__":
+    main()
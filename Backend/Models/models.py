@@ -71,6 +71,7 @@ class ContainerDetails(ContainerSummary):
     memory_usage: int = Field(..., description="Current memory usage in bytes")
     memory_limit: int = Field(..., description="Memory limit in bytes")
     cpu_limit: Optional[float] = Field(None, description="CPU quota limit, if set (in cores)")
+    stats_sampled_at: Optional[str] = Field(None, description="When the CPU/memory figures were sampled (ISO 8601)")
     mounts: List[MountInfo] = Field(default_factory=list, description="List of mounted volumes/binds")
     labels: Dict[str, str] = Field(default_factory=dict, description="User-defined metadata labels")
 
@@ -132,13 +133,58 @@ class DockerOverview(BaseModel):
     is_swarm_active: bool
 
 
+class DockerStateInfo(BaseModel):
+    ready: bool = Field(..., description="Whether the state cache has been seeded")
+    revision: int = Field(..., description="Monotonically increasing revision of the cached state")
+    containers: int
+    images: int
+    volumes: int
+    networks: int
+    last_reconciled_at: Optional[float] = Field(None, description="Unix timestamp of the last full reconcile")
+
+
+class StatsHubInfo(BaseModel):
+    streams: int = Field(..., description="Open upstream stats streams (one per watched container)")
+    subscribers: int = Field(..., description="Websocket subscribers across all streams")
+    streams_opened: int = Field(..., description="Upstream streams opened since startup")
+    dropped: int = Field(..., description="Samples dropped for slow subscribers still connected")
+
+
+class QueryCoalescingStats(BaseModel):
+    calls: int = Field(..., description="Total coalesced query calls")
+    executions: int = Field(..., description="Calls that actually ran against the daemon")
+    deduplicated: int = Field(..., description="Calls served by another caller's in-flight or cached result")
+    cache_hits: int = Field(..., description="Calls served from the short-lived result cache")
+    in_flight: int = Field(..., description="Queries currently executing")
+
+
 # ------------------ Container Stats ------------------ #
 
 class ContainerStats(BaseModel):
     id: str
     name: str
-    cpu: float = Field(..., ge=0.0, le=100.0, description="CPU usage in percent")
-    memory: float = Field(..., ge=0.0, le=100.0, description="Memory usage in percent")
+    cpu: float = Field(..., ge=0.0, description="CPU usage in percent of one core (above 100 on multi-core load)")
+    memory: float = Field(..., ge=0.0, le=100.0, description="Memory usage in percent of the limit")
+    network_io: float = Field(0.0, ge=0.0, description="Network rx + tx in bytes per second")
+    block_io: float = Field(0.0, ge=0.0, description="Block device read + write in bytes per second")
+
+
+class ContainerMetricPoint(BaseModel):
+    timestamp: float = Field(..., description="Bucket start (unix seconds)")
+    cpu_percent: float
+    memory_usage: float = Field(..., description="Mean memory usage in bytes")
+    network_rx: float = Field(..., description="Received bytes per second")
+    network_tx: float = Field(..., description="Transmitted bytes per second")
+    blk_read: float = Field(..., description="Block device reads in bytes per second")
+    blk_write: float = Field(..., description="Block device writes in bytes per second")
+
+
+class ContainerMetrics(BaseModel):
+    container_id: str
+    start: float
+    end: float
+    step: float = Field(..., description="Seconds between points")
+    points: List[ContainerMetricPoint] = Field(default_factory=list)
 
 
 # ------------------ Logging & Alerts ------------------ #
@@ -150,6 +196,18 @@ class LogInfo(BaseModel):
 
 class PerformanceWarning(BaseModel):
     message: str
+    container_id: Optional[str] = None
+    container_name: Optional[str] = None
+    rule: Optional[str] = Field(None, description="Rule that raised the warning, e.g. high_cpu or oom_killed")
+    severity: Optional[Literal["critical", "warning", "info"]] = None
+    value: Optional[float] = Field(None, description="Metric value when the warning was raised")
+    since: Optional[float] = Field(None, description="Unix time the condition started")
+    resolved_at: Optional[float] = Field(None, description="Unix time the condition cleared (recent warnings only)")
+
+
+class PerformanceWarnings(BaseModel):
+    active: List[PerformanceWarning] = Field(default_factory=list, description="Most severe first")
+    recent: List[PerformanceWarning] = Field(default_factory=list, description="Resolved warnings, newest first")
 
 
 class NetworkContainerInfo(BaseModel):
@@ -276,3 +334,12 @@ class DockerNetworkSelectItem(BaseModel):
     name: str
     gateway: Optional[str] = None  # from IPAM config
 
+
+class ContainerDetailsBatchRequest(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=100, description="Container IDs, ID prefixes or names")
+
+class ContainerDetailsBatchItem(BaseModel):
+    ref: str = Field(..., description="ID or name as given in the request")
+    details: Optional[ContainerDetails] = None
+    error: Optional[str] = Field(None, description="Why the details could not be loaded")
+    status_code: Optional[int] = Field(None, description="HTTP status the single-item endpoint would have returned")
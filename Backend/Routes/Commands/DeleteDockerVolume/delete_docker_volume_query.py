@@ -2,6 +2,7 @@ from docker.errors import NotFound, APIError, DockerException
 from fastapi import HTTPException
 
 from Models.models import GenericMessageResponse
+from Utils.containers import list_containers, container_name
 from Utils.getDocker import get_docker_client
 from Utils.logger import logger
 
@@ -16,13 +17,12 @@ def delete_docker_volume_query(volume_name: str) -> GenericMessageResponse:
             raise HTTPException(status_code=404, detail=f"Volume '{volume_name}' not found")
 
         # Check if the volume is used by any container
-        for container in client.containers.list(all=True):
-            for mount in container.attrs.get("Mounts", []):
-                if mount.get("Name") == volume_name:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Cannot delete volume '{volume_name}': in use by container '{container.name}'"
-                    )
+        using = list_containers(client, all=True, filters={"volume": volume_name})
+        if using:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Cannot delete volume '{volume_name}': in use by container '{container_name(using[0])}'"
+            )
 
         volume.remove()
         return GenericMessageResponse(
@@ -4,6 +4,7 @@ from fastapi import HTTPException
 from Models.models import (
     GenericMessageResponse
 )
+from Utils.containers import list_containers, container_name, container_image_id
 from Utils.getDocker import get_docker_client
 from Utils.logger import logger
 
@@ -22,10 +23,10 @@ def delete_docker_image_command(image_id: str):
 
     # Check for containers using this image
     try:
-        all_containers = client.containers.list(all=True)
+        all_containers = list_containers(client, all=True)
         using = [
-            c.name for c in all_containers
-            if c.image.id == image.id
+            container_name(c) for c in all_containers
+            if container_image_id(c) == image.id
         ]
         if using:
             names = ", ".join(using)
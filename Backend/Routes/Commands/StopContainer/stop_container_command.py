@@ -1,17 +1,20 @@
 from fastapi import HTTPException
 from docker.errors import NotFound
 from Models.models import GenericMessageResponse
-from Utils.getDocker import get_container
+from Utils.async_docker import get_async_docker_client, get_container_async
 from Utils.logger import logger
 import traceback
 
-def stop_container_command(container_id: str) -> GenericMessageResponse:
+async def stop_container_command_async(container_id: str) -> GenericMessageResponse:
     try:
         logger.info(f"Stopping container: {container_id}")
-        container = get_container(container_id)
-        container.stop()
-        logger.info(f"Container stopped: {container.name} ({container.id})")
-        return GenericMessageResponse(success=True, code=200, message=f"Container '{container.name}' stopped.")
+        container = await get_container_async(container_id)
+        await get_async_docker_client().stop_container(container["Id"])
+        name = container["Name"].lstrip("/")
+        logger.info(f"Container stopped: {name} ({container['Id']})")
+        return GenericMessageResponse(success=True, code=200, message=f"Container '{name}' stopped.")
+    except HTTPException:
+        raise
     except NotFound:
         logger.warning(f"Container not found when stopping: {container_id}")
         raise HTTPException(status_code=404, detail=f"Container '{container_id}' not found")
@@ -1,5 +1,9 @@
-from typing import List, Any, Optional, Dict
-from fastapi import Query
+import base64
+import binascii
+import json
+import re
+from typing import List, Any, Optional, Dict, FrozenSet, Literal, Sequence, Tuple
+from fastapi import HTTPException, Query
 import datetime
 
 from Models.models import (
@@ -8,65 +12,226 @@ from Models.models import (
     ContainerStatusEnum,
     map_status_to_enum,
 )
+from Utils.containers import (
+    list_containers,
+    container_name,
+    container_command,
+    container_created,
+    container_ports,
+    container_mounts,
+    container_image_id,
+)
 from Utils.getDocker import get_docker_client, detect_container_errors
+from Utils.image_index import ImageIndex, build_image_index, image_tags
+from Utils.projection import Fields, build, wants
+from Utils.single_flight import single_flight
+
+
+SortKey = Literal["name", "created", "uptime", "error_count"]
+
+COMPOSE_PROJECT_LABEL = "com.docker.compose.project"
 
+# ContainerStatusEnum -> daemon states, so status filters can be pushed down
+DOCKER_STATES: Dict[ContainerStatusEnum, List[str]] = {
+    ContainerStatusEnum.running: ["running"],
+    ContainerStatusEnum.stopped: ["exited"],
+    ContainerStatusEnum.restarted: ["restarting"],
+    ContainerStatusEnum.failed: ["created", "paused", "removing", "dead"],
+}
 
+
+@single_flight("containers")
 def get_containers_list_query(
-    all: bool = Query(True, description="Show all containers, including stopped")
+    all: bool = Query(True, description="Show all containers, including stopped"),
+    status: Optional[Sequence[ContainerStatusEnum]] = None,
+    name: Optional[str] = None,
+    image: Optional[str] = None,
+    label: Optional[Sequence[str]] = None,
+    project: Optional[str] = None,
+    network: Optional[str] = None,
+    sort_by: Optional[SortKey] = None,
+    order: Literal["asc", "desc"] = "asc",
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Fields = None,
 ) -> List[ContainerSummary]:
-    containers = get_docker_client().containers.list(all=all)
+    client = get_docker_client()
+    containers = list_containers(client, all=all, filters=build_docker_filters(status, name, label, project, network))
+    images = build_image_index(client) if image or wants(fields, "image") else None
+
+    if image:
+        needle = image.lower()
+        containers = [
+            c for c in containers
+            if needle in (container_image_id(c) or "").lower()
+            or any(needle in tag.lower() for tag in image_tags(images, container_image_id(c)))
+        ]
+
+    # Errors are only needed up front when they drive the ordering
+    errors: Dict[str, Tuple[int, Optional[str]]] = {}
+    if sort_by == "error_count":
+        errors = {c.id: detect_container_errors(c) for c in containers}
+
+    if sort_by is None and (limit is not None or cursor is not None):
+        sort_by = "created"
+
+    if sort_by is not None:
+        keyed = [(sort_key(c, sort_by, errors), c) for c in containers]
+        keyed.sort(key=lambda pair: pair[0], reverse=order == "desc")
+        if cursor is not None:
+            after = decode_cursor(cursor, sort_by)
+            keyed = [pair for pair in keyed if (pair[0] < after if order == "desc" else pair[0] > after)]
+        containers = [c for _, c in keyed]
+
+    if limit is not None:
+        containers = containers[:limit]
+
+    with_errors = wants(fields, "error_count", "latest_error_message")
     return [
         enrich_container_summary(
             c,
             map_status_to_enum(c.status),
-            *detect_container_errors(c)
+            *(errors.get(c.id) or (detect_container_errors(c) if with_errors else (0, None))),
+            images=images,
+            fields=fields
         )
         for c in containers
     ]
 
 
+def build_docker_filters(
+    status: Optional[Sequence[ContainerStatusEnum]] = None,
+    name: Optional[str] = None,
+    label: Optional[Sequence[str]] = None,
+    project: Optional[str] = None,
+    network: Optional[str] = None,
+) -> Optional[Dict[str, List[str]]]:
+    """Translate list filters into the daemon's `filters=` query (None when unfiltered)."""
+    filters: Dict[str, List[str]] = {}
+    if status:
+        filters["status"] = [state for s in status for state in DOCKER_STATES[ContainerStatusEnum(s)]]
+    if name:
+        filters["name"] = [re.escape(name)]
+    labels = list(label or [])
+    if project:
+        labels.append(f"{COMPOSE_PROJECT_LABEL}={project}")
+    if labels:
+        filters["label"] = labels
+    if network:
+        filters["network"] = [network]
+    return filters or None
+
+
+def sort_key(container: Any, sort_by: SortKey, errors: Dict[str, Tuple[int, Optional[str]]]) -> tuple:
+    """Stable keyset ordering; the short ID breaks ties so cursors never skip or repeat rows."""
+    if sort_by == "name":
+        value: tuple = (container_name(container).lower(),)
+    elif sort_by == "created":
+        value = (container_created(container).timestamp(),)
+    elif sort_by == "uptime":
+        # Uptime is derived from the creation time; containers that are not running sort lowest
+        running = container.status == "running"
+        value = (int(running), -container_created(container).timestamp() if running else 0.0)
+    else:
+        value = (errors[container.id][0],)
+    return value + (container.short_id,)
+
+
+def encode_cursor(sort_by: SortKey, key: tuple) -> str:
+    payload = {"sort_by": sort_by, "key": list(key)}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: SortKey) -> tuple:
+    """Key stored in `cursor`; 400 when it is malformed or was issued for another ordering."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        cursor_sort_by, key = payload["sort_by"], payload["key"]
+    except (binascii.Error, ValueError, UnicodeDecodeError, TypeError, KeyError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+    if cursor_sort_by != sort_by:
+        raise HTTPException(status_code=400, detail=f"Pagination cursor was issued for sort_by={cursor_sort_by}")
+    return tuple(key)
+
+
+def cursor_fields(sort_by: Optional[SortKey]) -> FrozenSet[str]:
+    """Summary fields `next_cursor` reads, which a projected page must still carry."""
+    return frozenset({
+        "name": {"id", "name"},
+        "created": {"id", "created_at"},
+        "uptime": {"id", "created_at", "uptime_seconds"},
+        "error_count": {"id", "error_count"},
+    }[sort_by or "created"])
+
+
+def next_cursor(page: List[ContainerSummary], sort_by: Optional[SortKey], limit: Optional[int]) -> Optional[str]:
+    """Cursor for the page after `page`, or None when the page was not full."""
+    if limit is None or not page or len(page) < limit:
+        return None
+    last = page[-1]
+    sort_by = sort_by or "created"
+    if sort_by == "name":
+        value: tuple = (last.name.lower(),)
+    elif sort_by == "created":
+        value = (datetime.datetime.fromisoformat(last.created_at).timestamp(),)
+    elif sort_by == "uptime":
+        running = last.uptime_seconds is not None
+        value = (int(running), -datetime.datetime.fromisoformat(last.created_at).timestamp() if running else 0.0)
+    else:
+        value = (last.error_count,)
+    return encode_cursor(sort_by, value + (last.id,))
+
+
 def enrich_container_summary(
     container: Any,
     status_enum: ContainerStatusEnum,
     error_count: int,
-    latest_error: Optional[str]
+    latest_error: Optional[str],
+    images: Optional[ImageIndex] = None,
+    fields: Fields = None
 ) -> ContainerSummary:
-    ports: List[PortBinding] = []
-    raw_ports = container.attrs.get("NetworkSettings", {}).get("Ports") or {}
-
-    for port, bindings in raw_ports.items():
-        if bindings:
-            for bind in bindings:
-                ports.append(PortBinding(
-                    container_port=port,
-                    host_ip=bind.get("HostIp"),
-                    host_port=bind.get("HostPort")
-                ))
-        else:
-            ports.append(PortBinding(container_port=port))
-
-    created_at = datetime.datetime.fromisoformat(
-        container.attrs["Created"].replace("Z", "+00:00")
-    ).astimezone(datetime.timezone.utc)
-
-    uptime_seconds = (
-        int((datetime.datetime.now(datetime.timezone.utc) - created_at).total_seconds())
-        if container.status == "running" else None
-    )
-
-    mounts = container.attrs.get("Mounts", [])
-    volume_count = len(mounts)
-
-    return ContainerSummary(
-        id=container.short_id,
-        name=container.name,
-        status=status_enum,
-        image=container.image.tags,
-        command=" ".join(container.attrs["Config"].get("Cmd") or []),
-        created_at=created_at.isoformat(),
-        uptime_seconds=uptime_seconds,
-        ports=ports,
-        error_count=error_count,
-        latest_error_message=latest_error,
-        volumes=volume_count
-    )
+    values: Dict[str, Any] = {
+        "id": container.short_id,
+        "status": status_enum,
+        "error_count": error_count,
+        "latest_error_message": latest_error,
+    }
+
+    if wants(fields, "name"):
+        values["name"] = container_name(container)
+
+    if wants(fields, "ports"):
+        ports: List[PortBinding] = []
+        for port, bindings in container_ports(container).items():
+            if bindings:
+                for bind in bindings:
+                    ports.append(PortBinding(
+                        container_port=port,
+                        host_ip=bind.get("HostIp"),
+                        host_port=bind.get("HostPort")
+                    ))
+            else:
+                ports.append(PortBinding(container_port=port))
+        values["ports"] = ports
+
+    if wants(fields, "created_at", "uptime_seconds"):
+        created_at = container_created(container)
+        values["created_at"] = created_at.isoformat()
+        values["uptime_seconds"] = (
+            int((datetime.datetime.now(datetime.timezone.utc) - created_at).total_seconds())
+            if container.status == "running" else None
+        )
+
+    if wants(fields, "image"):
+        values["image"] = (
+            image_tags(images, container_image_id(container)) if images is not None else container.image.tags
+        )
+
+    if wants(fields, "command"):
+        values["command"] = container_command(container)
+
+    if wants(fields, "volumes"):
+        values["volumes"] = len(container_mounts(container))
+
+    return build(ContainerSummary, fields, values)
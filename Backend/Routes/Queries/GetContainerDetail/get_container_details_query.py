@@ -1,6 +1,7 @@
-import docker
+import datetime
+
 from fastapi import HTTPException
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from Models.models import (
     ContainerDetails,
@@ -9,21 +10,37 @@ from Models.models import (
 )
 
 from Routes.Queries.GetConainersList.get_containers_list_query import enrich_container_summary
-from Utils.getDocker import get_container, detect_container_errors
-
-
-def get_container_details_query(container_id: str) -> ContainerDetails:
+from Utils.getDocker import get_container, detect_container_errors, get_docker_client
+from Utils.image_index import ImageIndex
+from Utils.network_cache import network_cache
+from Utils.projection import Fields, build, wants
+from Utils.stats import _calculate_cpu_percent
+from Utils.stats_sampler import stats_sampler
+
+
+def get_container_details_query(
+    container_id: str,
+    fields: Fields = None,
+    images: Optional[ImageIndex] = None
+) -> ContainerDetails:
     try:
         container = get_container(container_id)
         if container is None:
             raise HTTPException(status_code=404, detail=f"Container '{container_id}' not found")
 
         is_running = container.status.lower() == "running"
-        stats = container.stats(stream=False) if is_running else None
+        with_stats = wants(fields, "cpu_percent", "memory_usage", "memory_limit", "stats_sampled_at")
+        sample = stats_sampler.latest_or_fetch(container) if is_running and with_stats else None
+        stats = sample.stats if sample else None
 
         status_enum = map_status_to_enum(container.status)
-        error_count, latest_error = detect_container_errors(container)
-        base_summary = enrich_container_summary(container, status_enum, error_count, latest_error)
+        error_count, latest_error = (
+            detect_container_errors(container)
+            if wants(fields, "error_count", "latest_error_message") else (0, None)
+        )
+        base_summary = enrich_container_summary(
+            container, status_enum, error_count, latest_error, images=images, fields=fields
+        )
 
         attrs = container.attrs
 
@@ -32,15 +49,20 @@ def get_container_details_query(container_id: str) -> ContainerDetails:
         state = attrs.get("State", {})
         network_settings = attrs.get("NetworkSettings", {})
 
-        return ContainerDetails(
-            **base_summary.model_dump(),
-            networks=_extract_networks(network_settings),
+        return build(ContainerDetails, fields, dict(
+            # a projected summary is partial, so copy its attributes rather than re-dumping it
+            base_summary.model_dump() if fields is None else dict(base_summary),
+            networks=_extract_networks(network_settings) if wants(fields, "networks") else [],
             created=attrs.get("Created", "N/A"),
             platform=attrs.get("Platform", "unknown"),
-            cpu_percent=_calculate_cpu_percent(stats) if stats else 0.0,
+            cpu_percent=round(_calculate_cpu_percent(stats), 2) if stats else 0.0,
             memory_usage=stats["memory_stats"].get("usage", 0) if stats else 0,
             memory_limit=stats["memory_stats"].get("limit", 0) if stats else 0,
             cpu_limit=_get_cpu_limit(container),
+            stats_sampled_at=(
+                datetime.datetime.fromtimestamp(sample.sampled_at, tz=datetime.timezone.utc).isoformat()
+                if sample else None
+            ),
             mounts=_parse_mounts(container),
             labels=config.get("Labels", {}),
             env=config.get("Env", []),
@@ -51,7 +73,7 @@ def get_container_details_query(container_id: str) -> ContainerDetails:
             pid=state.get("Pid"),
             exit_code=state.get("ExitCode"),
             state=state.get("Status"),
-        )
+        ))
 
     except HTTPException:
         raise
@@ -59,18 +81,6 @@ def get_container_details_query(container_id: str) -> ContainerDetails:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve container details: {str(e)}")
 
 
-def _calculate_cpu_percent(stats: Dict[str, Any]) -> float:
-    try:
-        cpu_delta = stats["cpu_stats"]["cpu_usage"]["total_usage"] - stats["precpu_stats"]["cpu_usage"]["total_usage"]
-        system_delta = stats["cpu_stats"]["system_cpu_usage"] - stats["precpu_stats"]["system_cpu_usage"]
-        if system_delta > 0:
-            cpu_count = len(stats["cpu_stats"]["cpu_usage"].get("percpu_usage", [])) or 1
-            return round((cpu_delta / system_delta) * cpu_count * 100.0, 2)
-    except (KeyError, ZeroDivisionError, TypeError):
-        pass
-    return 0.0
-
-
 def _get_cpu_limit(container: Any) -> float | None:
     host_config = container.attrs.get("HostConfig", {})
     cpu_quota = host_config.get("CpuQuota")
@@ -112,7 +122,7 @@ def _extract_ip_address(network_settings: Dict[str, Any]) -> str:
 
 
 def _extract_networks(network_settings: Dict[str, Any]) -> list[NetworkInfo]:
-    client = docker.from_env()
+    client = get_docker_client()
     result = []
 
     networks = network_settings.get("Networks", {})
@@ -124,25 +134,28 @@ def _extract_networks(network_settings: Dict[str, Any]) -> list[NetworkInfo]:
         ip_address = net_data.get("IPAddress")
 
         try:
-            network = client.networks.get(network_id)
-            ipam = (network.attrs.get("IPAM") or {}).get("Config", [{}])[0]
-
-            result.append(NetworkInfo(
-                name=name,
-                id=network_id or "",
-                ip_address=ip_address,
-                driver=network.attrs.get("Driver"),
-                gateway=ipam.get("Gateway"),
-                subnet=ipam.get("Subnet"),
-                internal=network.attrs.get("Internal"),
-                attachable=network.attrs.get("Attachable"),
-            ))
+            network = network_cache.get(client, network_id) if network_id else None
         except Exception:
+            network = None
+
+        if network is None:
             # fallback: include minimal data
             result.append(NetworkInfo(
                 name=name,
                 id=network_id or "",
                 ip_address=ip_address
             ))
+            continue
+
+        result.append(NetworkInfo(
+            name=name,
+            id=network_id,
+            ip_address=ip_address,
+            driver=network.driver,
+            gateway=network.gateway,
+            subnet=network.subnet,
+            internal=network.internal,
+            attachable=network.attachable,
+        ))
 
     return result
@@ -0,0 +1,49 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Union
+
+from fastapi import HTTPException
+
+from Models.models import ContainerDetails, ContainerDetailsBatchItem
+from Routes.Queries.GetContainerDetail.get_container_details_query import get_container_details_query
+from Utils.container_index import container_index
+from Utils.getDocker import get_docker_client
+from Utils.image_index import build_image_index
+
+# Upper bound on concurrent per-container inspect/log calls for one batch
+DETAILS_BATCH_WORKERS = int(os.getenv("DETAILS_BATCH_WORKERS", "8"))
+
+
+def get_container_details_batch_query(refs: List[str]) -> List[ContainerDetailsBatchItem]:
+    client = get_docker_client()
+    images = build_image_index(client)
+
+    # Resolve every reference up front so an ID and a name for the same container load once
+    keys: Dict[str, str] = {}
+    failures: Dict[str, HTTPException] = {}
+    for ref in refs:
+        try:
+            keys[ref] = container_index.resolve(ref.strip()) or ref.strip()
+        except HTTPException as e:
+            failures[ref] = e
+
+    def load(key: str) -> Union[ContainerDetails, HTTPException]:
+        try:
+            return get_container_details_query(key, images=images)
+        except HTTPException as e:
+            return e
+
+    unique = list(dict.fromkeys(keys.values()))
+    results: Dict[str, Union[ContainerDetails, HTTPException]] = {}
+    if unique:
+        with ThreadPoolExecutor(max_workers=min(DETAILS_BATCH_WORKERS, len(unique))) as pool:
+            results = dict(zip(unique, pool.map(load, unique)))
+
+    items = []
+    for ref in refs:
+        result = failures.get(ref) or results[keys[ref]]
+        if isinstance(result, HTTPException):
+            items.append(ContainerDetailsBatchItem(ref=ref, error=str(result.detail), status_code=result.status_code))
+        else:
+            items.append(ContainerDetailsBatchItem(ref=ref, details=result))
+    return items
@@ -0,0 +1,34 @@
+import time
+from typing import Optional
+
+from fastapi import HTTPException
+
+from Models.models import ContainerMetrics, ContainerMetricPoint
+from Utils.container_index import container_index
+from Utils.getDocker import get_container
+from Utils.metrics_store import metrics_store
+
+DEFAULT_RANGE_SECONDS = 15 * 60
+
+
+def get_container_metrics_query(
+    container_id: str,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    step: Optional[float] = None,
+) -> ContainerMetrics:
+    end = time.time() if end is None else end
+    start = end - DEFAULT_RANGE_SECONDS if start is None else start
+    if start >= end:
+        raise HTTPException(status_code=400, detail="'from' must be earlier than 'to'")
+
+    full_id = container_index.resolve(container_id.strip()) or get_container(container_id).id
+    step, points = metrics_store.query(full_id, start, end, step)
+
+    return ContainerMetrics(
+        container_id=full_id,
+        start=start,
+        end=end,
+        step=step,
+        points=[ContainerMetricPoint(**point._asdict()) for point in points],
+    )
@@ -1,42 +1,61 @@
-from typing import List
+from collections import defaultdict
+from typing import Dict, List, Literal, Optional
 from docker.errors import DockerException
 from docker.models.images import Image
 from fastapi import HTTPException
 
+from Utils.containers import list_containers, container_name, container_image_id
 from Utils.getDocker import get_docker_client
 from Models.models import DockerImageSummary, ImageContainerInfo, map_status_to_enum
 from Utils.logger import logger
-
-
-def get_docker_images_query() -> List[DockerImageSummary]:
+from Utils.single_flight import single_flight
+from Utils.state_cache import list_images
+
+
+@single_flight("images")
+def get_docker_images_query(
+    sort_by: Optional[Literal["size", "created"]] = None,
+    order: Literal["asc", "desc"] = "desc",
+    dangling: Optional[bool] = None,
+    in_use: Optional[bool] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> List[DockerImageSummary]:
     try:
         client = get_docker_client()
-        images: List[Image] = client.images.list()
-        containers = client.containers.list(all=True)
-
-        summaries = []
-
-        for img in images:
-            used_by = []
-            for container in containers:
-                if container.image.id == img.id:
-                    used_by.append(ImageContainerInfo(
-                        id=container.id,
-                        name=container.name,
-                        status=map_status_to_enum(container.status)
-                    ))
+        images: List[Image] = list_images(client)
+        containers = list_containers(client, all=True)
+
+        # Single pass over containers, then an O(1) lookup per image
+        used_by: Dict[str, List[ImageContainerInfo]] = defaultdict(list)
+        for container in containers:
+            used_by[container_image_id(container)].append(ImageContainerInfo(
+                id=container.id,
+                name=container_name(container),
+                status=map_status_to_enum(container.status)
+            ))
 
-            summaries.append(DockerImageSummary(
+        if dangling is not None:
+            images = [img for img in images if (not img.tags) == dangling]
+        if in_use is not None:
+            images = [img for img in images if (img.id in used_by) == in_use]
+        if sort_by is not None:
+            key = "Size" if sort_by == "size" else "Created"
+            images = sorted(images, key=lambda img: img.attrs.get(key) or 0, reverse=order == "desc")
+
+        end = offset + limit if limit is not None else None
+        return [
+            DockerImageSummary(
                 id=img.short_id,
                 tags=img.tags,
                 size=img.attrs.get("Size", 0),
                 created=img.attrs.get("Created", ""),
                 architecture=img.attrs.get("Architecture", ""),
                 os=img.attrs.get("Os", ""),
-                containers=used_by
-            ))
-
-        return summaries
+                containers=used_by.get(img.id, [])
+            )
+            for img in images[offset:end]
+        ]
 
     except DockerException as e:
         logger.error(f"Failed to fetch Docker images: {str(e)}")
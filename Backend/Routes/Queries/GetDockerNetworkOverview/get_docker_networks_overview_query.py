@@ -3,16 +3,20 @@ from docker.errors import DockerException
 from fastapi import HTTPException
 
 from Models.models import NetworkContainerInfo, DockerNetworkOverview
+from Utils.containers import list_containers, container_name, container_networks
 from Utils.getDocker import get_docker_client
 from Utils.logger import logger
+from Utils.single_flight import single_flight
+from Utils.state_cache import list_networks
 
 PROTECTED_NETWORKS = {"bridge", "host", "none"}
 
+@single_flight("networks_overview")
 def get_docker_networks_overview_query() -> List[DockerNetworkOverview]:
     try:
         client = get_docker_client()
-        networks = client.networks.list()
-        containers = client.containers.list(all=True)
+        networks = list_networks(client)
+        containers = list_containers(client, all=True)
 
         results: List[DockerNetworkOverview] = []
 
@@ -27,14 +31,13 @@ def get_docker_networks_overview_query() -> List[DockerNetworkOverview]:
             container_infos: List[NetworkContainerInfo] = []
 
             for container in containers:
-                container_attrs = container.attrs
-                network_settings = container_attrs.get("NetworkSettings", {}).get("Networks", {})
+                network_settings = container_networks(container)
 
                 if net_name in network_settings:
                     net_data = network_settings[net_name]
                     container_infos.append(NetworkContainerInfo(
                         id=container.id,
-                        name=container.name,
+                        name=container_name(container),
                         status=container.status,
                         ipv4_address=net_data.get("IPAddress")
                     ))
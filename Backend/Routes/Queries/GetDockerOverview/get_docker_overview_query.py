@@ -2,23 +2,27 @@ from docker.errors import DockerException
 from fastapi import HTTPException
 
 from Models.models import DockerOverview
+from Utils.containers import list_containers
 from Utils.getDocker import get_docker_client
 from Utils.logger import logger
+from Utils.single_flight import single_flight
+from Utils.state_cache import list_images, list_volumes, docker_version, docker_info
 
 
+@single_flight("overview")
 def get_docker_overview_query():
     try:
         client = get_docker_client()
-        all_containers = client.containers.list(all=True)
-        running = client.containers.list(filters={"status": "running"})
-        exited = client.containers.list(filters={"status": "exited"})
-        images = client.images.list()
-        volumes = client.volumes.list()
+        all_containers = list_containers(client, all=True)
+        running = [c for c in all_containers if c.status == "running"]
+        exited = [c for c in all_containers if c.status == "exited"]
+        images = list_images(client)
+        volumes = list_volumes(client)
 
-        # Swarm status from client.info()
+        # Swarm status from docker info
         try:
-            docker_info = client.info()
-            swarm_state = docker_info.get("Swarm", {}).get("LocalNodeState", "inactive")
+            info = docker_info(client)
+            swarm_state = info.get("Swarm", {}).get("LocalNodeState", "inactive")
             is_swarm_active = swarm_state == "active"
         except Exception:
             is_swarm_active = False
@@ -32,7 +36,7 @@ def get_docker_overview_query():
                 continue
 
         return DockerOverview(
-            version=client.version()["Version"],
+            version=docker_version(client)["Version"],
             total_containers=len(all_containers),
             running_containers=len(running),
             failed_containers=len(exited),
@@ -2,16 +2,20 @@ from typing import List
 
 from docker.errors import DockerException
 from fastapi import HTTPException
+from Utils.containers import list_containers, container_name, container_mounts
 from Utils.getDocker import get_docker_client
 from Models.models import DockerVolumeSummary, VolumeContainerInfo, ContainerStatusEnum, map_status_to_enum
 from Utils.logger import logger
+from Utils.single_flight import single_flight
+from Utils.state_cache import list_volumes
 
 
+@single_flight("volumes")
 def get_docker_volumes_query() -> List[DockerVolumeSummary]:
     try:
         client = get_docker_client()
-        volumes = client.volumes.list()
-        containers = client.containers.list(all=True)
+        volumes = list_volumes(client)
+        containers = list_containers(client, all=True)
 
         summaries = []
 
@@ -21,13 +25,11 @@ def get_docker_volumes_query() -> List[DockerVolumeSummary]:
 
             using_containers = []
             for container in containers:
-                container_info = container.attrs
-                mounts = container_info.get("Mounts", [])
-                for mount in mounts:
+                for mount in container_mounts(container):
                     if mount.get("Name") == v.name:
                         using_containers.append(VolumeContainerInfo(
                             id=container.id,
-                            name=container.name,
+                            name=container_name(container),
                             status=map_status_to_enum(container.status),
                             mountpoint=mount.get("Destination", "")
                         ))
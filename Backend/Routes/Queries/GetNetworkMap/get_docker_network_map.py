@@ -1,12 +1,16 @@
 from Models.NetworkMapModel import DockerNetworkGraphResponse
+from Utils.containers import list_containers, container_name, container_networks
 from Utils.getDocker import get_docker_client
+from Utils.single_flight import single_flight
+from Utils.state_cache import list_networks
 
 
+@single_flight("network_map")
 def get_docker_network_map() -> DockerNetworkGraphResponse:
     client = get_docker_client()
 
-    networks = {n.id[:12]: n for n in client.networks.list()}
-    containers = client.containers.list(all=True)
+    networks = {n.id[:12]: n for n in list_networks(client)}
+    containers = list_containers(client, all=True)
 
     graph = {
         "nodes": [],
@@ -18,20 +22,20 @@ def get_docker_network_map() -> DockerNetworkGraphResponse:
 
     for container in containers:
         container_id = container.id[:12]
-        container_name = container.name
+        name = container_name(container)
         status = container.status
 
         if container_id not in added_containers:
             graph["nodes"].append({
                 "id": container_id,
-                "label": container_name,
+                "label": name,
                 "type": "container",
                 "status": status,
                 "clusterId": None
             })
             added_containers.add(container_id)
 
-        net_info = container.attrs.get("NetworkSettings", {}).get("Networks", {})
+        net_info = container_networks(container)
         for net_name, net_data in net_info.items():
             net_id = net_data.get("NetworkID", "")[:12]
             if not net_id:
@@ -6,17 +6,17 @@ from Models.models import (
 )
 from Utils.getDocker import get_docker_client
 from Utils.logger import logger
+from Utils.state_cache import list_networks
 
 
 def list_docker_networks_lite_query():
     try:
         client = get_docker_client()
-        networks = client.networks.list()
+        networks = list_networks(client)
 
         result = []
         for network in networks:
-            inspect = client.api.inspect_network(network.id)
-            ipam_config = inspect.get("IPAM", {}).get("Config", [])
+            ipam_config = (network.attrs.get("IPAM") or {}).get("Config") or []
             gateway = ipam_config[0].get("Gateway") if ipam_config else None
 
             result.append(DockerNetworkSelectItem(
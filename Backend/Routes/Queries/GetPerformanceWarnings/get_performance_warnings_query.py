@@ -0,0 +1,25 @@
+from Models.models import PerformanceWarning, PerformanceWarnings
+from Utils.warning_engine import warning_engine, WarningRecord
+
+NO_WARNINGS_MESSAGE = "No performance issues detected"
+
+
+def _to_model(warning: WarningRecord) -> PerformanceWarning:
+    fields = warning._asdict()
+    fields["message"] = f"{warning.message} in container '{warning.container_name}'"
+    return PerformanceWarning(**fields)
+
+
+def get_performance_warning_query() -> PerformanceWarning:
+    """The most severe active warning, or an all-clear message."""
+    active = warning_engine.active()
+    if not active:
+        return PerformanceWarning(message=NO_WARNINGS_MESSAGE)
+    return _to_model(active[0])
+
+
+def get_performance_warnings_query() -> PerformanceWarnings:
+    return PerformanceWarnings(
+        active=[_to_model(w) for w in warning_engine.active()],
+        recent=[_to_model(w) for w in warning_engine.recent()],
+    )
@@ -1,15 +1,71 @@
+import heapq
+import re
+from typing import List, Literal, Optional
+
 from fastapi import HTTPException
 
 from Models.models import ContainerStats
+from Utils.containers import list_containers, container_name
 from Utils.getDocker import get_docker_client
 from Utils.logger import logger
+from Utils.metrics_store import ContainerLoad, metrics_store
+
+RankBy = Literal["cpu", "memory", "network", "block_io"]
+
+_WINDOW = re.compile(r"^(\d+(?:\.\d+)?)([smh]?)$")
+_WINDOW_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600}
+
+
+def parse_window(window: Optional[str]) -> Optional[float]:
+    """'60s', '5m', '1h' or plain seconds -> seconds."""
+    if not window:
+        return None
+    match = _WINDOW.match(window.strip().lower())
+    if match is None:
+        raise HTTPException(status_code=400, detail=f"Invalid window '{window}', expected e.g. 60s, 5m or 1h")
+    return float(match.group(1)) * _WINDOW_UNITS[match.group(2)]
+
 
-def get_top_containers_query():
+def _memory_percent(load: ContainerLoad) -> float:
+    return min(100.0, round(load.memory_usage / load.memory_limit * 100, 2)) if load.memory_limit else 0.0
+
+
+def _rank_value(load: Optional[ContainerLoad], by: RankBy) -> float:
+    if load is None:
+        return 0.0
+    if by == "cpu":
+        return load.cpu_percent
+    if by == "memory":
+        # rank by the figure the response reports, not raw bytes
+        return _memory_percent(load)
+    if by == "network":
+        return load.network
+    return load.block_io
+
+
+def get_top_containers_query(by: RankBy = "cpu", k: int = 4, window: Optional[str] = None) -> List[ContainerStats]:
+    window_seconds = parse_window(window)
     try:
         client = get_docker_client()
-        containers = client.containers.list()
-        dummy_data = [{"id": c.id[:12], "name": c.name, "cpu": 42.3, "memory": 30.4} for c in containers[:4]]
-        return [ContainerStats(**d) for d in dummy_data]
+        containers = list_containers(client, all=False)
     except Exception as e:
         logger.error("Docker connection error: %s", str(e))
         raise HTTPException(status_code=503, detail="Docker is not running or unreachable.")
+
+    # Samples were already taken by the background sampler, so nothing here calls the daemon for stats.
+    # The latest figures are a lookup per container; a window averages that container's buckets in the
+    # finest tier covering it, so its cost grows with the window (bounded by the tier size)
+    loads = ((c, metrics_store.load(c.id, window_seconds)) for c in containers)
+    top = heapq.nlargest(k, loads, key=lambda pair: _rank_value(pair[1], by))
+
+    return [
+        ContainerStats(
+            id=c.id[:12],
+            name=container_name(c),
+            cpu=round(load.cpu_percent, 2) if load else 0.0,
+            memory=_memory_percent(load) if load else 0.0,
+            network_io=round(load.network, 2) if load else 0.0,
+            block_io=round(load.block_io, 2) if load else 0.0,
+        )
+        for c, load in top
+    ]
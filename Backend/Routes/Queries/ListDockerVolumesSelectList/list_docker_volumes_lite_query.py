@@ -4,12 +4,13 @@ from fastapi import HTTPException
 from Models.models import VolumeSelectListItem, VolumeSelectList
 from Utils.getDocker import get_docker_client
 from Utils.logger import logger
+from Utils.state_cache import list_volumes
 
 
 def list_docker_volumes_lite_query():
     try:
         client = get_docker_client()
-        volumes = client.volumes.list()
+        volumes = list_volumes(client)
 
         volume_items = [
             VolumeSelectListItem(
@@ -45,7 +45,7 @@ def test_delete_image_used_by_containers(mock_get_client):
 
     mock_container = MagicMock()
     mock_container.name = "my_container"
-    mock_container.image.id = "sha256:abc"
+    mock_container.attrs = {"Image": "sha256:abc"}
 
     mock_client = MagicMock()
     mock_client.images.get.return_value = mock_image
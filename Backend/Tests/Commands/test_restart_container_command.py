@@ -1,48 +1,74 @@
-from unittest.mock import patch, MagicMock
+import asyncio
+
 import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
 from fastapi import HTTPException
+from docker.errors import NotFound
+
+from Routes.Commands.RestartContainer.restart_container_command import restart_container_command_async
+from Models.models import GenericMessageResponse
+
+MODULE = "Routes.Commands.RestartContainer.restart_container_command"
+
+
+def mock_async_client(mock_get_async_client, **kwargs):
+    mock_client = MagicMock()
+    mock_client.restart_container = AsyncMock(**kwargs)
+    mock_get_async_client.return_value = mock_client
+    return mock_client
+
+
+@patch(f"{MODULE}.get_async_docker_client")
+@patch(f"{MODULE}.get_container_async", new_callable=AsyncMock)
+def test_restart_container_success(mock_get_container_async, mock_get_async_client):
+    mock_get_container_async.return_value = {"Id": "abc123full", "Name": "/my_container"}
+    mock_client = mock_async_client(mock_get_async_client)
 
-from Routes.Commands.RestartContainer.restart_container_command import restart_container_command
+    response = asyncio.run(restart_container_command_async("abc123"))
 
+    mock_client.restart_container.assert_awaited_once_with("abc123full")
+    assert isinstance(response, GenericMessageResponse)
+    assert response.success is True
+    assert response.code == 200
+    assert "restarted" in response.message.lower()
+    assert "my_container" in response.message
 
-@patch("Routes.Commands.RestartContainer.restart_container_command.get_container")
-def test_restart_container_command_success(mock_get_container):
-    mock_container = MagicMock()
-    mock_container.name = "webapp"
-    mock_get_container.return_value = mock_container
 
-    result = restart_container_command("abc123")
+@patch(f"{MODULE}.get_async_docker_client")
+@patch(f"{MODULE}.get_container_async", new_callable=AsyncMock)
+def test_restart_container_not_found(mock_get_container_async, mock_get_async_client):
+    mock_get_container_async.side_effect = HTTPException(status_code=404, detail="Container 'missing_id' not found")
+    mock_client = mock_async_client(mock_get_async_client)
 
-    mock_container.restart.assert_called_once()
-    assert result.success is True
-    assert result.code == 200
-    assert "restarted" in result.message.lower()
-    assert "webapp" in result.message
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(restart_container_command_async("missing_id"))
 
+    assert exc.value.status_code == 404
+    mock_client.restart_container.assert_not_awaited()
 
-@patch("Routes.Commands.RestartContainer.restart_container_command.get_container")
-def test_restart_container_command_container_not_found(mock_get_container):
-    from docker.errors import NotFound
 
-    mock_get_container.side_effect = NotFound("No such container")
+@patch(f"{MODULE}.get_async_docker_client")
+@patch(f"{MODULE}.get_container_async", new_callable=AsyncMock)
+def test_restart_container_removed_before_restart(mock_get_container_async, mock_get_async_client):
+    mock_get_container_async.return_value = {"Id": "abc123full", "Name": "/my_container"}
+    mock_async_client(mock_get_async_client, side_effect=NotFound("No such container"))
 
-    with pytest.raises(HTTPException) as excinfo:
-        restart_container_command("does-not-exist")
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(restart_container_command_async("abc123"))
 
-    assert excinfo.value.status_code == 404
-    assert "Container 'does-not-exist' not found" in excinfo.value.detail
+    assert exc.value.status_code == 404
+    assert "Container 'abc123' not found" in exc.value.detail
 
 
-@patch("Routes.Commands.RestartContainer.restart_container_command.get_container")
-def test_restart_container_command_raises_generic_exception(mock_get_container):
-    mock_container = MagicMock()
-    mock_container.restart.side_effect = Exception("Docker failure")
-    mock_container.name = "webapp"
-    mock_get_container.return_value = mock_container
+@patch(f"{MODULE}.get_async_docker_client")
+@patch(f"{MODULE}.get_container_async", new_callable=AsyncMock)
+def test_restart_container_unexpected_error(mock_get_container_async, mock_get_async_client):
+    mock_get_container_async.return_value = {"Id": "abc123full", "Name": "/my_container"}
+    mock_async_client(mock_get_async_client, side_effect=Exception("Docker failure"))
 
-    with pytest.raises(HTTPException) as excinfo:
-        restart_container_command("abc123")
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(restart_container_command_async("abc123"))
 
-    assert excinfo.value.status_code == 500
-    assert "Failed to restart container" in excinfo.value.detail
-    assert "Docker failure" in excinfo.value.detail
+    assert exc.value.status_code == 500
+    assert "failed to restart" in str(exc.value.detail).lower()
+    assert "Docker failure" in exc.value.detail
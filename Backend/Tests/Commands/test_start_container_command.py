@@ -1,45 +1,74 @@
+import asyncio
+
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from fastapi import HTTPException
 from docker.errors import NotFound
 
-from Routes.Commands.StartContainer.start_container_command import start_container_command
+from Routes.Commands.StartContainer.start_container_command import start_container_command_async
 from Models.models import GenericMessageResponse
 
+MODULE = "Routes.Commands.StartContainer.start_container_command"
+
+
+def mock_async_client(mock_get_async_client, **kwargs):
+    mock_client = MagicMock()
+    mock_client.start_container = AsyncMock(**kwargs)
+    mock_get_async_client.return_value = mock_client
+    return mock_client
 
-@patch("Routes.Commands.StartContainer.start_container_command.get_container")
-def test_start_container_success(mock_get_container):
-    mock_container = MagicMock()
-    mock_container.id = "abc123"
-    mock_container.name = "my_container"
-    mock_get_container.return_value = mock_container
 
-    response = start_container_command("abc123")
+@patch(f"{MODULE}.get_async_docker_client")
+@patch(f"{MODULE}.get_container_async", new_callable=AsyncMock)
+def test_start_container_success(mock_get_container_async, mock_get_async_client):
+    mock_get_container_async.return_value = {"Id": "abc123full", "Name": "/my_container"}
+    mock_client = mock_async_client(mock_get_async_client)
 
-    mock_container.start.assert_called_once()
+    response = asyncio.run(start_container_command_async("abc123"))
+
+    mock_client.start_container.assert_awaited_once_with("abc123full")
     assert isinstance(response, GenericMessageResponse)
     assert response.success is True
     assert response.code == 200
     assert "started" in response.message.lower()
+    assert "my_container" in response.message
+
+
+@patch(f"{MODULE}.get_async_docker_client")
+@patch(f"{MODULE}.get_container_async", new_callable=AsyncMock)
+def test_start_container_not_found(mock_get_container_async, mock_get_async_client):
+    mock_get_container_async.side_effect = HTTPException(status_code=404, detail="Container 'missing_id' not found")
+    mock_client = mock_async_client(mock_get_async_client)
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(start_container_command_async("missing_id"))
+
+    assert exc.value.status_code == 404
+    mock_client.start_container.assert_not_awaited()
 
 
-@patch("Routes.Commands.StartContainer.start_container_command.get_container")
-def test_start_container_not_found(mock_get_container):
-    mock_get_container.side_effect = NotFound("Container not found")
+@patch(f"{MODULE}.get_async_docker_client")
+@patch(f"{MODULE}.get_container_async", new_callable=AsyncMock)
+def test_start_container_removed_before_start(mock_get_container_async, mock_get_async_client):
+    mock_get_container_async.return_value = {"Id": "abc123full", "Name": "/my_container"}
+    mock_async_client(mock_get_async_client, side_effect=NotFound("No such container"))
 
     with pytest.raises(HTTPException) as exc:
-        start_container_command("missing_id")
+        asyncio.run(start_container_command_async("abc123"))
 
     assert exc.value.status_code == 404
-    assert "not found" in str(exc.value.detail).lower()
+    assert "Container 'abc123' not found" in exc.value.detail
 
 
-@patch("Routes.Commands.StartContainer.start_container_command.get_container")
-def test_start_container_unexpected_error(mock_get_container):
-    mock_get_container.side_effect = Exception("Something went wrong")
+@patch(f"{MODULE}.get_async_docker_client")
+@patch(f"{MODULE}.get_container_async", new_callable=AsyncMock)
+def test_start_container_unexpected_error(mock_get_container_async, mock_get_async_client):
+    mock_get_container_async.return_value = {"Id": "abc123full", "Name": "/my_container"}
+    mock_async_client(mock_get_async_client, side_effect=Exception("Docker failure"))
 
     with pytest.raises(HTTPException) as exc:
-        start_container_command("crash_id")
+        asyncio.run(start_container_command_async("abc123"))
 
     assert exc.value.status_code == 500
     assert "failed to start" in str(exc.value.detail).lower()
+    assert "Docker failure" in exc.value.detail
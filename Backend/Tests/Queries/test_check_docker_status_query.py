@@ -1,16 +1,18 @@
-from unittest.mock import patch, MagicMock
+import asyncio
+
+from unittest.mock import patch, MagicMock, AsyncMock
 
 from Models.models import GenericMessageResponse
-from Routes.Queries.GetDockerStatus.check_docker_status_query import check_docker_status_query
+from Routes.Queries.GetDockerStatus.check_docker_status_query import check_docker_status_query_async
 
 @patch("Routes.Queries.GetDockerStatus.check_docker_status_query.logger")
-@patch("Routes.Queries.GetDockerStatus.check_docker_status_query.get_docker_client")
-def test_check_docker_status_success(mock_get_docker_client, mock_logger):
+@patch("Routes.Queries.GetDockerStatus.check_docker_status_query.get_async_docker_client")
+def test_check_docker_status_success(mock_get_async_client, mock_logger):
     mock_client = MagicMock()
-    mock_client.ping.return_value = True
-    mock_get_docker_client.return_value = mock_client
+    mock_client.ping = AsyncMock(return_value=True)
+    mock_get_async_client.return_value = mock_client
 
-    response = check_docker_status_query()
+    response = asyncio.run(check_docker_status_query_async())
 
     assert isinstance(response, GenericMessageResponse)
     assert response.success is True
@@ -19,13 +21,13 @@ def test_check_docker_status_success(mock_get_docker_client, mock_logger):
 
 
 @patch("Routes.Queries.GetDockerStatus.check_docker_status_query.logger")
-@patch("Routes.Queries.GetDockerStatus.check_docker_status_query.get_docker_client")
-def test_check_docker_status_failure(mock_get_docker_client, mock_logger):
+@patch("Routes.Queries.GetDockerStatus.check_docker_status_query.get_async_docker_client")
+def test_check_docker_status_failure(mock_get_async_client, mock_logger):
     mock_client = MagicMock()
-    mock_client.ping.side_effect = Exception("Docker unreachable")
-    mock_get_docker_client.return_value = mock_client
+    mock_client.ping = AsyncMock(side_effect=Exception("Docker unreachable"))
+    mock_get_async_client.return_value = mock_client
 
-    response = check_docker_status_query()
+    response = asyncio.run(check_docker_status_query_async())
 
     assert isinstance(response, GenericMessageResponse)
     assert response.success is False
@@ -0,0 +1,50 @@
+from unittest.mock import patch, MagicMock
+
+from fastapi import HTTPException
+
+from Routes.Queries.GetContainerDetailsBatch.get_container_details_batch_query import get_container_details_batch_query
+
+MODULE = "Routes.Queries.GetContainerDetailsBatch.get_container_details_batch_query"
+
+
+@patch(f"{MODULE}.get_docker_client")
+@patch(f"{MODULE}.build_image_index")
+@patch(f"{MODULE}.container_index")
+@patch(f"{MODULE}.get_container_details_query")
+def test_batch_returns_partial_results_with_per_item_errors(mock_details, mock_index, mock_build_index,
+                                                            mock_get_docker_client):
+    mock_index.resolve.side_effect = lambda ref: {"web": "abc123", "abc": "abc123", "db": "def456"}.get(ref)
+    details = {"abc123": MagicMock(name="web-details")}
+
+    def load(key, images=None):
+        if key not in details:
+            raise HTTPException(status_code=404, detail=f"Container '{key}' not found")
+        return details[key]
+
+    mock_details.side_effect = load
+
+    with patch(f"{MODULE}.ContainerDetailsBatchItem", side_effect=lambda **kw: kw):
+        items = get_container_details_batch_query(["web", "abc", "db"])
+
+    assert [item["ref"] for item in items] == ["web", "abc", "db"]
+    assert items[0]["details"] is details["abc123"]
+    assert items[1]["details"] is details["abc123"]
+    assert items[2] == {"ref": "db", "error": "Container 'def456' not found", "status_code": 404}
+    # "web" and "abc" resolve to the same container, which is loaded once with the shared image index
+    assert sorted(call.args[0] for call in mock_details.call_args_list) == ["abc123", "def456"]
+    assert all(call.kwargs["images"] is mock_build_index.return_value for call in mock_details.call_args_list)
+    mock_build_index.assert_called_once()
+
+
+@patch(f"{MODULE}.get_docker_client")
+@patch(f"{MODULE}.build_image_index")
+@patch(f"{MODULE}.container_index")
+@patch(f"{MODULE}.get_container_details_query")
+def test_batch_reports_ambiguous_references(mock_details, mock_index, mock_build_index, mock_get_docker_client):
+    mock_index.resolve.side_effect = HTTPException(status_code=409, detail="Ambiguous container reference 'a'")
+
+    items = get_container_details_batch_query(["a"])
+
+    assert items[0].status_code == 409
+    assert items[0].details is None
+    mock_details.assert_not_called()
@@ -2,9 +2,10 @@ import pytest
 from unittest.mock import patch
 
 from Models.models import ContainerDetails, ContainerStatusEnum
-from Routes.Queries.GetContainerDetail.get_container_details_query import get_container_details_query
+from Routes.Queries.GetContainerDetail.get_container_details_query import get_container_details_query, _extract_networks
 from Tests.utils.Builders.DockerContainerBuilder import DockerContainerBuilder
 from Tests.utils.Builders.DockerImageBuilder import DockerImageBuilder
+from Utils.network_cache import NetworkMetadata
 
 
 @pytest.fixture
@@ -79,3 +80,58 @@ def test_get_container_details_raises_internal_error(mock_get_container):
         get_container_details_query("abc123")
     assert exc.value.status_code == 500
     assert "failed to retrieve container details" in str(exc.value.detail).lower()
+
+
+@patch("Routes.Queries.GetContainerDetail.get_container_details_query.get_container")
+@patch("Routes.Queries.GetContainerDetail.get_container_details_query.detect_container_errors")
+@patch("Routes.Queries.GetContainerDetail.get_container_details_query._extract_networks")
+def test_get_container_details_projection_skips_stats_logs_and_networks(mock_extract_networks, mock_detect_errors,
+                                                                        mock_get_container, mock_container):
+    mock_get_container.return_value = mock_container
+
+    result = get_container_details_query(mock_container.short_id, fields=frozenset({"id", "name", "labels"}))
+
+    assert result.model_dump(include={"id", "name", "labels"}) == {
+        "id": mock_container.short_id,
+        "name": mock_container.name,
+        "labels": {"service": "web"},
+    }
+    mock_container.stats.assert_not_called()
+    mock_detect_errors.assert_not_called()
+    mock_extract_networks.assert_not_called()
+
+
+@patch("Routes.Queries.GetContainerDetail.get_container_details_query.get_container")
+@patch("Routes.Queries.GetContainerDetail.get_container_details_query.detect_container_errors", return_value=(0, None))
+@patch("Routes.Queries.GetContainerDetail.get_container_details_query._extract_networks", return_value=[])
+@patch("Routes.Queries.GetContainerDetail.get_container_details_query.stats_sampler")
+def test_get_container_details_reads_sampled_stats(mock_sampler, mock_extract_networks, mock_detect_errors,
+                                                   mock_get_container, mock_container):
+    mock_get_container.return_value = mock_container
+    mock_sampler.latest_or_fetch.return_value.stats = {"memory_stats": {"usage": 7, "limit": 10}}
+    mock_sampler.latest_or_fetch.return_value.sampled_at = 1704110400.0
+
+    result = get_container_details_query(mock_container.short_id)
+
+    assert result.memory_usage == 7
+    assert result.stats_sampled_at == "2024-01-01T12:00:00+00:00"
+    mock_container.stats.assert_not_called()
+
+
+@patch("Routes.Queries.GetContainerDetail.get_container_details_query.get_docker_client")
+@patch("Routes.Queries.GetContainerDetail.get_container_details_query.network_cache")
+def test_extract_networks_uses_network_cache(mock_network_cache, mock_get_docker_client):
+    mock_network_cache.get.side_effect = lambda client, network_id: (
+        NetworkMetadata(network_id, "backend", "bridge", "172.20.0.1", "172.20.0.0/16", False, True)
+        if network_id == "net1" else None
+    )
+
+    networks = _extract_networks({"Networks": {
+        "backend": {"NetworkID": "net1", "IPAddress": "172.20.0.5"},
+        "gone": {"NetworkID": "net2", "IPAddress": "10.0.0.5"},
+    }})
+
+    assert networks[0].gateway == "172.20.0.1"
+    assert networks[0].ip_address == "172.20.0.5"
+    assert networks[1].driver is None
+    mock_get_docker_client.return_value.networks.get.assert_not_called()
@@ -0,0 +1,45 @@
+import pytest
+from unittest.mock import patch
+
+from fastapi import HTTPException
+
+from Routes.Queries.GetContainerMetrics.get_container_metrics_query import get_container_metrics_query
+from Utils.metrics_store import MetricPoint
+
+MODULE = "Routes.Queries.GetContainerMetrics.get_container_metrics_query"
+
+
+@patch(f"{MODULE}.metrics_store")
+@patch(f"{MODULE}.container_index")
+def test_get_container_metrics_resolves_and_maps_points(mock_index, mock_store):
+    mock_index.resolve.return_value = "abc123full"
+    mock_store.query.return_value = (10.0, [MetricPoint(1000.0, 12.5, 2048.0, 1.0, 2.0, 3.0, 4.0)])
+
+    result = get_container_metrics_query("web", start=900.0, end=1100.0, step=10.0)
+
+    mock_store.query.assert_called_once_with("abc123full", 900.0, 1100.0, 10.0)
+    assert result.container_id == "abc123full"
+    assert result.step == 10.0
+    assert result.points[0].cpu_percent == 12.5
+    assert result.points[0].blk_write == 4.0
+
+
+@patch(f"{MODULE}.metrics_store")
+@patch(f"{MODULE}.get_container")
+@patch(f"{MODULE}.container_index")
+def test_get_container_metrics_defaults_to_last_fifteen_minutes(mock_index, mock_get_container, mock_store):
+    mock_index.resolve.return_value = None
+    mock_get_container.return_value.id = "abc123full"
+    mock_store.query.return_value = (3.0, [])
+
+    result = get_container_metrics_query("abc")
+
+    assert result.end - result.start == 15 * 60
+    assert result.points == []
+    mock_get_container.assert_called_once_with("abc")
+
+
+def test_get_container_metrics_rejects_inverted_range():
+    with pytest.raises(HTTPException) as exc:
+        get_container_metrics_query("abc", start=200.0, end=100.0)
+    assert exc.value.status_code == 400
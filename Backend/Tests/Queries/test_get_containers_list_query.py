@@ -2,7 +2,9 @@ import pytest
 from unittest.mock import patch, MagicMock
 
 from Models.models import ContainerSummary, ContainerStatusEnum
-from Routes.Queries.GetConainersList.get_containers_list_query import get_containers_list_query
+from fastapi import HTTPException
+
+from Routes.Queries.GetConainersList.get_containers_list_query import get_containers_list_query, next_cursor
 from Tests.utils.Builders.DockerContainerBuilder import DockerContainerBuilder
 from Tests.utils.Builders.DockerImageBuilder import DockerImageBuilder
 
@@ -69,6 +71,136 @@ def test_get_containers_list_success(mock_detect_errors, mock_get_docker_client,
     assert c2.latest_error_message == "crashed"
 
 
+@patch("Routes.Queries.GetConainersList.get_containers_list_query.get_docker_client")
+@patch("Routes.Queries.GetConainersList.get_containers_list_query.detect_container_errors")
+def test_get_containers_list_joins_image_tags(mock_detect_errors, mock_get_docker_client, mock_container_running):
+    mock_detect_errors.return_value = (0, None)
+
+    docker_client_mock = MagicMock()
+    docker_client_mock.containers.list.return_value = [mock_container_running]
+    docker_client_mock.api.images.return_value = [
+        {"Id": mock_container_running.attrs["Image"], "RepoTags": ["nginx:1.27"]}
+    ]
+    mock_get_docker_client.return_value = docker_client_mock
+
+    result = get_containers_list_query(all=True)
+
+    assert result[0].image == ["nginx:1.27"]
+    docker_client_mock.api.images.assert_called_once()
+
+
+def make_named(name, created, status="running"):
+    return (
+        DockerContainerBuilder()
+        .with_id(name[:6])
+        .with_name(name)
+        .with_status(status)
+        .with_created(created)
+        .build()
+    )
+
+
+@patch("Routes.Queries.GetConainersList.get_containers_list_query.get_docker_client")
+@patch("Routes.Queries.GetConainersList.get_containers_list_query.detect_container_errors")
+def test_get_containers_list_pushes_filters_down(mock_detect_errors, mock_get_docker_client):
+    docker_client_mock = MagicMock()
+    docker_client_mock.containers.list.return_value = []
+    mock_get_docker_client.return_value = docker_client_mock
+
+    get_containers_list_query(
+        all=True,
+        status=(ContainerStatusEnum.stopped,),
+        name="web.1",
+        label=("tier=frontend",),
+        project="shop",
+        network="backend",
+    )
+
+    docker_client_mock.containers.list.assert_called_once_with(all=True, sparse=True, filters={
+        "status": ["exited"],
+        "name": ["web\\.1"],
+        "label": ["tier=frontend", "com.docker.compose.project=shop"],
+        "network": ["backend"],
+    })
+
+
+@patch("Routes.Queries.GetConainersList.get_containers_list_query.get_docker_client")
+@patch("Routes.Queries.GetConainersList.get_containers_list_query.detect_container_errors")
+def test_get_containers_list_paginates_with_cursor(mock_detect_errors, mock_get_docker_client):
+    mock_detect_errors.return_value = (0, None)
+    containers = [make_named(name, f"2024-01-0{day}T12:00:00+00:00")
+                  for day, name in enumerate(["delta", "alpha", "charlie", "bravo"], start=1)]
+    docker_client_mock = MagicMock()
+    docker_client_mock.containers.list.return_value = containers
+    mock_get_docker_client.return_value = docker_client_mock
+
+    first = get_containers_list_query(all=True, sort_by="name", limit=3)
+    cursor = next_cursor(first, "name", 3)
+    second = get_containers_list_query(all=True, sort_by="name", limit=3, cursor=cursor)
+
+    assert [c.name for c in first] == ["alpha", "bravo", "charlie"]
+    assert [c.name for c in second] == ["delta"]
+    assert next_cursor(second, "name", 3) is None
+    # only rows on the returned pages are enriched
+    assert mock_detect_errors.call_count == 4
+
+
+@patch("Routes.Queries.GetConainersList.get_containers_list_query.get_docker_client")
+@patch("Routes.Queries.GetConainersList.get_containers_list_query.detect_container_errors")
+def test_get_containers_list_sorts_by_error_count_and_uptime(mock_detect_errors, mock_get_docker_client):
+    old = make_named("old", "2024-01-01T12:00:00+00:00")
+    new = make_named("new", "2024-02-01T12:00:00+00:00")
+    down = make_named("down", "2024-03-01T12:00:00+00:00", status="exited")
+    errors = {old.id: (1, "boom"), new.id: (5, "bang"), down.id: (0, None)}
+    mock_detect_errors.side_effect = lambda c: errors[c.id]
+    docker_client_mock = MagicMock()
+    docker_client_mock.containers.list.return_value = [old, new, down]
+    mock_get_docker_client.return_value = docker_client_mock
+
+    by_errors = get_containers_list_query(all=True, sort_by="error_count", order="desc")
+    by_uptime = get_containers_list_query(all=True, sort_by="uptime", order="desc")
+
+    assert [c.name for c in by_errors] == ["new", "old", "down"]
+    assert [c.name for c in by_uptime] == ["old", "new", "down"]
+
+
+@patch("Routes.Queries.GetConainersList.get_containers_list_query.get_docker_client")
+def test_get_containers_list_rejects_bad_cursor(mock_get_docker_client):
+    mock_get_docker_client.return_value.containers.list.return_value = []
+    with pytest.raises(HTTPException) as exc:
+        get_containers_list_query(all=True, limit=10, cursor="not-a-cursor!")
+    assert exc.value.status_code == 400
+
+
+@patch("Routes.Queries.GetConainersList.get_containers_list_query.get_docker_client")
+@patch("Routes.Queries.GetConainersList.get_containers_list_query.detect_container_errors")
+def test_get_containers_list_paging_defaults_sort_but_keeps_order(mock_detect_errors, mock_get_docker_client):
+    mock_detect_errors.return_value = (0, None)
+    containers = [make_named(name, f"2024-01-0{day}T12:00:00+00:00")
+                  for day, name in enumerate(["first", "second", "third"], start=1)]
+    mock_get_docker_client.return_value.containers.list.return_value = containers
+
+    oldest = get_containers_list_query(all=True, order="asc", limit=2)
+    newest = get_containers_list_query(all=True, order="desc", limit=2)
+
+    assert [c.name for c in oldest] == ["first", "second"]
+    assert [c.name for c in newest] == ["third", "second"]
+
+
+@patch("Routes.Queries.GetConainersList.get_containers_list_query.get_docker_client")
+@patch("Routes.Queries.GetConainersList.get_containers_list_query.detect_container_errors")
+def test_get_containers_list_rejects_cursor_from_another_sort(mock_detect_errors, mock_get_docker_client):
+    mock_detect_errors.return_value = (0, None)
+    containers = [make_named(name, f"2024-01-0{day}T12:00:00+00:00")
+                  for day, name in enumerate(["alpha", "bravo"], start=1)]
+    mock_get_docker_client.return_value.containers.list.return_value = containers
+    cursor = next_cursor(get_containers_list_query(all=True, sort_by="name", limit=1), "name", 1)
+
+    with pytest.raises(HTTPException) as exc:
+        get_containers_list_query(all=True, sort_by="created", limit=1, cursor=cursor)
+    assert exc.value.status_code == 400
+
+
 @patch("Routes.Queries.GetConainersList.get_containers_list_query.get_docker_client")
 def test_get_containers_list_empty(mock_get_docker_client):
     docker_client_mock = MagicMock()
@@ -86,3 +218,22 @@ def test_get_containers_list_raises(mock_get_docker_client):
     with pytest.raises(Exception) as exc:
         get_containers_list_query()
     assert "Docker connection error" in str(exc.value)
+
+
+@patch("Routes.Queries.GetConainersList.get_containers_list_query.get_docker_client")
+@patch("Routes.Queries.GetConainersList.get_containers_list_query.detect_container_errors")
+def test_get_containers_list_projection_skips_unrequested_enrichment(mock_detect_errors, mock_get_docker_client,
+                                                                     mock_container_running):
+    docker_client_mock = MagicMock()
+    docker_client_mock.containers.list.return_value = [mock_container_running]
+    mock_get_docker_client.return_value = docker_client_mock
+
+    result = get_containers_list_query(all=True, fields=frozenset({"id", "name", "status"}))
+
+    assert result[0].model_dump(include={"id", "name", "status"}) == {
+        "id": mock_container_running.short_id,
+        "name": mock_container_running.name,
+        "status": ContainerStatusEnum.running,
+    }
+    mock_detect_errors.assert_not_called()
+    docker_client_mock.api.images.assert_not_called()
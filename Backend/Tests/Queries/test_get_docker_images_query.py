@@ -87,3 +87,55 @@ def test_get_docker_images_docker_unavailable(mock_get_docker_client):
 
     assert exc.value.status_code == 503
     assert "docker is unreachable" in str(exc.value.detail).lower()
+
+
+@pytest.fixture
+def catalog():
+    images = [
+        DockerImageBuilder().with_id("sha256:small").with_tags(["alpine:3"]).with_size(5).with_created("2024-01-01T00:00:00Z").build(),
+        DockerImageBuilder().with_id("sha256:large").with_tags(["node:20"]).with_size(900).with_created("2024-03-01T00:00:00Z").build(),
+        DockerImageBuilder().with_id("sha256:dangling").with_tags([]).with_size(50).with_created("2024-02-01T00:00:00Z").build(),
+    ]
+    containers = [
+        DockerContainerBuilder().with_image(images[1]).with_name(f"api-{i}").build()
+        for i in range(3)
+    ]
+    return images, containers
+
+
+@patch("Routes.Queries.GetDockerImages.get_docker_images_query.get_docker_client")
+def test_get_docker_images_groups_containers_by_image(mock_get_docker_client, catalog):
+    images, containers = catalog
+    client_mock = MagicMock()
+    client_mock.images.list.return_value = images
+    client_mock.containers.list.return_value = containers
+    mock_get_docker_client.return_value = client_mock
+
+    result = get_docker_images_query()
+
+    by_tag = {tuple(r.tags): r for r in result}
+    assert [c.name for c in by_tag[("node:20",)].containers] == ["api-0", "api-1", "api-2"]
+    assert by_tag[("alpine:3",)].containers == []
+    client_mock.containers.list.assert_called_once()
+
+
+@patch("Routes.Queries.GetDockerImages.get_docker_images_query.get_docker_client")
+def test_get_docker_images_sort_filter_and_paginate(mock_get_docker_client, catalog):
+    images, containers = catalog
+    client_mock = MagicMock()
+    client_mock.images.list.return_value = images
+    client_mock.containers.list.return_value = containers
+    mock_get_docker_client.return_value = client_mock
+
+    by_size = get_docker_images_query(sort_by="size", order="asc")
+    assert [r.size for r in by_size] == [5, 50, 900]
+
+    by_created = get_docker_images_query(sort_by="created", order="desc")
+    assert [r.size for r in by_created] == [900, 50, 5]
+
+    assert [r.size for r in get_docker_images_query(dangling=True)] == [50]
+    assert [r.size for r in get_docker_images_query(in_use=True)] == [900]
+    assert sorted(r.size for r in get_docker_images_query(in_use=False)) == [5, 50]
+
+    page = get_docker_images_query(sort_by="size", order="asc", limit=1, offset=1)
+    assert [r.size for r in page] == [50]
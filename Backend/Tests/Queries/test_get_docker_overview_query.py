@@ -10,15 +10,13 @@ from Models.models import DockerOverview
 def test_get_docker_overview_success(mock_get_docker_client):
     mock_container_1 = MagicMock()
     mock_container_2 = MagicMock()
+    mock_container_1.status = "running"
+    mock_container_2.status = "exited"
     mock_container_1.logs.return_value = b"line1\nline2\n"
     mock_container_2.logs.return_value = b"line1\n"
 
-    all_containers = [mock_container_1, mock_container_2]
-    running = [mock_container_1]
-    exited = [mock_container_2]
-
     mock_client = MagicMock()
-    mock_client.containers.list.side_effect = [all_containers, running, exited]
+    mock_client.containers.list.return_value = [mock_container_1, mock_container_2]
     mock_client.images.list.return_value = [MagicMock(), MagicMock()]
     mock_client.volumes.list.return_value = [MagicMock()]
     mock_client.version.return_value = {"Version": "24.0.7"}
@@ -36,6 +34,7 @@ def test_get_docker_overview_success(mock_get_docker_client):
     assert overview.volumes == 1
     assert overview.logs_count == 3
     assert overview.is_swarm_active is True
+    mock_client.containers.list.assert_called_once_with(all=True, filters=None, sparse=True)
 
 
 @patch("Routes.Queries.GetDockerOverview.get_docker_overview_query.get_docker_client")
@@ -43,11 +42,13 @@ def test_get_docker_overview_handles_log_errors(mock_get_docker_client):
     # One container has working logs, another raises an error
     good_container = MagicMock()
     bad_container = MagicMock()
+    good_container.status = "running"
+    bad_container.status = "exited"
     good_container.logs.return_value = b"log1\nlog2\nlog3\n"
     bad_container.logs.side_effect = Exception("Log access denied")
 
     mock_client = MagicMock()
-    mock_client.containers.list.side_effect = [[good_container, bad_container], [good_container], [bad_container]]
+    mock_client.containers.list.return_value = [good_container, bad_container]
     mock_client.images.list.return_value = []
     mock_client.volumes.list.return_value = []
     mock_client.version.return_value = {"Version": "25.0.0"}
@@ -0,0 +1,44 @@
+from unittest.mock import patch
+
+from Routes.Queries.GetPerformanceWarnings.get_performance_warnings_query import (
+    get_performance_warning_query, get_performance_warnings_query, NO_WARNINGS_MESSAGE,
+)
+from Utils.warning_engine import WarningRecord
+
+MODULE = "Routes.Queries.GetPerformanceWarnings.get_performance_warnings_query"
+
+
+def record(rule="high_cpu", severity="warning", resolved_at=None):
+    return WarningRecord("abc123", "db", rule, severity, "CPU above 90% for over a minute", 97.5, 1000.0, resolved_at)
+
+
+@patch(f"{MODULE}.warning_engine")
+def test_get_performance_warning_returns_most_severe_active(mock_engine):
+    mock_engine.active.return_value = [record("memory_near_limit", "critical"), record()]
+
+    result = get_performance_warning_query()
+
+    assert result.rule == "memory_near_limit"
+    assert result.severity == "critical"
+    assert result.message == "CPU above 90% for over a minute in container 'db'"
+
+
+@patch(f"{MODULE}.warning_engine")
+def test_get_performance_warning_all_clear(mock_engine):
+    mock_engine.active.return_value = []
+
+    result = get_performance_warning_query()
+
+    assert result.message == NO_WARNINGS_MESSAGE
+    assert result.rule is None
+
+
+@patch(f"{MODULE}.warning_engine")
+def test_get_performance_warnings_lists_active_and_recent(mock_engine):
+    mock_engine.active.return_value = [record()]
+    mock_engine.recent.return_value = [record(resolved_at=1100.0)]
+
+    result = get_performance_warnings_query()
+
+    assert [w.container_name for w in result.active] == ["db"]
+    assert result.recent[0].resolved_at == 1100.0
@@ -4,6 +4,7 @@ from fastapi import HTTPException
 
 from Routes.Queries.GetTopContainers.get_top_containers_query import get_top_containers_query
 from Models.models import ContainerStats
+from Utils.metrics_store import ContainerLoad
 
 
 def make_mock_container(id_suffix: str, name: str):
@@ -13,8 +14,13 @@ def make_mock_container(id_suffix: str, name: str):
     return mock
 
 
+def make_load(cpu, memory, network=0.0, block_io=0.0):
+    return ContainerLoad(cpu, memory, 1000.0, network, block_io, 0.0)
+
+
+@patch("Routes.Queries.GetTopContainers.get_top_containers_query.metrics_store")
 @patch("Routes.Queries.GetTopContainers.get_top_containers_query.get_docker_client")
-def test_get_top_containers_success(mock_get_docker_client):
+def test_get_top_containers_success(mock_get_docker_client, mock_metrics_store):
     containers = [
         make_mock_container("01", "web"),
         make_mock_container("02", "db"),
@@ -22,20 +28,70 @@ def test_get_top_containers_success(mock_get_docker_client):
         make_mock_container("04", "cache"),
         make_mock_container("05", "logger"),
     ]
+    loads = {
+        containers[0].id: make_load(10.0, 100.0),
+        containers[1].id: make_load(80.0, 900.0),
+        containers[2].id: make_load(150.0, 50.0),
+        containers[3].id: make_load(5.0, 300.0),
+    }
 
     mock_client = MagicMock()
     mock_client.containers.list.return_value = containers
     mock_get_docker_client.return_value = mock_client
+    mock_metrics_store.load.side_effect = lambda container_id, window: loads.get(container_id)
 
     result = get_top_containers_query()
 
     assert isinstance(result, list)
-    assert len(result) == 4
+    assert [item.name for item in result] == ["worker", "db", "web", "cache"]
     for item in result:
         assert isinstance(item, ContainerStats)
-        assert item.cpu == 42.3
-        assert item.memory == 30.4
         assert len(item.id) == 12
+    assert result[0].cpu == 150.0
+    assert result[1].memory == 90.0
+
+
+@patch("Routes.Queries.GetTopContainers.get_top_containers_query.metrics_store")
+@patch("Routes.Queries.GetTopContainers.get_top_containers_query.get_docker_client")
+def test_get_top_containers_by_metric_k_and_window(mock_get_docker_client, mock_metrics_store):
+    containers = [make_mock_container("01", "web"), make_mock_container("02", "db"), make_mock_container("03", "idle")]
+    loads = {
+        containers[0].id: make_load(1.0, 1.0, network=5000.0),
+        containers[1].id: make_load(1.0, 1.0, network=100.0, block_io=9000.0),
+    }
+    mock_get_docker_client.return_value.containers.list.return_value = containers
+    mock_metrics_store.load.side_effect = lambda container_id, window: loads.get(container_id)
+
+    by_network = get_top_containers_query(by="network", k=1, window="2m")
+    by_block_io = get_top_containers_query(by="block_io", k=3)
+
+    assert [item.name for item in by_network] == ["web"]
+    assert by_network[0].network_io == 5000.0
+    assert mock_metrics_store.load.call_args_list[0].args == (containers[0].id, 120.0)
+    assert [item.name for item in by_block_io] == ["db", "web", "idle"]
+    assert by_block_io[2].cpu == 0.0
+
+
+@patch("Routes.Queries.GetTopContainers.get_top_containers_query.metrics_store")
+@patch("Routes.Queries.GetTopContainers.get_top_containers_query.get_docker_client")
+def test_get_top_containers_ranks_memory_by_share_of_limit(mock_get_docker_client, mock_metrics_store):
+    big, tight = make_mock_container("01", "big"), make_mock_container("02", "tight")
+    loads = {
+        big.id: ContainerLoad(0.0, 2 * 1024 ** 3, 20 * 1024 ** 3, 0.0, 0.0, 0.0),
+        tight.id: ContainerLoad(0.0, 243 * 1024 ** 2, 256 * 1024 ** 2, 0.0, 0.0, 0.0),
+    }
+    mock_get_docker_client.return_value.containers.list.return_value = [big, tight]
+    mock_metrics_store.load.side_effect = lambda container_id, window: loads[container_id]
+
+    result = get_top_containers_query(by="memory", k=2)
+
+    assert [(item.name, item.memory) for item in result] == [("tight", 94.92), ("big", 10.0)]
+
+
+def test_get_top_containers_rejects_bad_window():
+    with pytest.raises(HTTPException) as exc:
+        get_top_containers_query(window="soon")
+    assert exc.value.status_code == 400
 
 
 @patch("Routes.Queries.GetTopContainers.get_top_containers_query.get_docker_client")
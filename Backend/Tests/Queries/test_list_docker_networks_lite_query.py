@@ -7,24 +7,20 @@ from Models.models import DockerNetworkSelectItem
 from Routes.Queries.GetNetworksSmallList.list_docker_networks_lite_query import list_docker_networks_lite_query
 
 
-def make_mock_network(network_id: str, name: str):
+def make_mock_network(network_id: str, name: str, ipam_config: list):
     network = MagicMock()
     network.id = network_id
     network.name = name
+    network.attrs = {"IPAM": {"Config": ipam_config}}
     return network
 
 
 @patch("Routes.Queries.GetNetworksSmallList.list_docker_networks_lite_query.get_docker_client")
 def test_list_docker_networks_lite_success(mock_get_docker_client):
-    network = make_mock_network("abc123", "frontend")
+    network = make_mock_network("abc123", "frontend", [{"Gateway": "172.18.0.1"}])
 
     client_mock = MagicMock()
     client_mock.networks.list.return_value = [network]
-    client_mock.api.inspect_network.return_value = {
-        "IPAM": {
-            "Config": [{"Gateway": "172.18.0.1"}]
-        }
-    }
     mock_get_docker_client.return_value = client_mock
 
     result = list_docker_networks_lite_query()
@@ -35,19 +31,15 @@ def test_list_docker_networks_lite_success(mock_get_docker_client):
     assert item.id == "abc123"
     assert item.name == "frontend"
     assert item.gateway == "172.18.0.1"
+    client_mock.api.inspect_network.assert_not_called()
 
 
 @patch("Routes.Queries.GetNetworksSmallList.list_docker_networks_lite_query.get_docker_client")
 def test_list_docker_networks_lite_no_gateway(mock_get_docker_client):
-    network = make_mock_network("xyz789", "internal")
+    network = make_mock_network("xyz789", "internal", [])  # No gateway
 
     client_mock = MagicMock()
     client_mock.networks.list.return_value = [network]
-    client_mock.api.inspect_network.return_value = {
-        "IPAM": {
-            "Config": []  # No gateway
-        }
-    }
     mock_get_docker_client.return_value = client_mock
 
     result = list_docker_networks_lite_query()
@@ -22,6 +22,7 @@ class DockerContainerBuilder:
         self._platform = "linux"
         self._volumes = []
         self._image = None
+        self._image_id = f"sha256:{fake.sha256()}"
         self._ip = fake.ipv4()
         self._network_mode = "bridge"
         self._memory_usage = 0
@@ -69,6 +70,7 @@ class DockerContainerBuilder:
 
     def with_image(self, image_mock):
         self._image = image_mock
+        self._image_id = image_mock.id
         self._image_tags = image_mock.tags
         return self
 
@@ -111,6 +113,7 @@ class DockerContainerBuilder:
         mock.logs.return_value = self._logs
 
         mock.attrs = {
+            "Image": self._image_id,
             "Config": {
                 "Cmd": self._cmd,
                 "Labels": self._labels
@@ -0,0 +1,182 @@
+import asyncio
+import json
+import os
+import tempfile
+from urllib.parse import urlsplit, parse_qs
+
+import pytest
+from unittest.mock import MagicMock, patch
+from docker.errors import NotFound, APIError
+
+import Utils.async_docker as async_docker
+from Utils.async_docker import AsyncDockerClient, ThreadedDockerClient
+
+CONTAINER = {"Id": "abc123", "Name": "/web", "State": {"Status": "running"}}
+
+
+class FakeDaemon:
+    """Tiny HTTP/1.1 server on a unix socket that mimics a few Engine API routes."""
+
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self.requests = []
+        self.connections = 0
+        self._server = None
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_unix_server(self._handle, path=self.socket_path)
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode().split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b""):
+                        break
+                    key, _, value = line.decode().partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                if int(headers.get("content-length", 0)):
+                    await reader.readexactly(int(headers["content-length"]))
+                self.requests.append((method, target))
+                writer.write(self._respond(method, target))
+                await writer.drain()
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _json(status: int, payload) -> bytes:
+        body = json.dumps(payload).encode()
+        reason = {200: "OK", 404: "Not Found", 500: "Internal Server Error"}[status]
+        return f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+
+    @staticmethod
+    def _chunked(parts) -> bytes:
+        out = b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nTransfer-Encoding: chunked\r\n\r\n"
+        for part in parts:
+            out += f"{len(part):x}\r\n".encode() + part + b"\r\n"
+        return out + b"0\r\n\r\n"
+
+    def _respond(self, method: str, target: str) -> bytes:
+        path = urlsplit(target).path
+        if path == "/_ping":
+            return b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nOK"
+        if path == "/version":
+            return self._json(200, {"ApiVersion": "1.44", "Version": "26.0.0"})
+        if path == "/v1.44/containers/json":
+            return self._chunked([json.dumps([{"Id": "abc123", "Names": ["/web"]}]).encode()])
+        if path == "/v1.44/containers/web/json":
+            return self._json(200, CONTAINER)
+        if path == "/v1.44/containers/abc123/start" and method == "POST":
+            return b"HTTP/1.1 204 No Content\r\n\r\n"
+        if path == "/v1.44/containers/broken/json":
+            return self._json(500, {"message": "daemon exploded"})
+        return self._json(404, {"message": "No such container"})
+
+
+@pytest.fixture
+def socket_path():
+    directory = tempfile.mkdtemp(dir="/tmp")
+    path = os.path.join(directory, "docker.sock")
+    yield path
+    if os.path.exists(path):
+        os.unlink(path)
+    os.rmdir(directory)
+
+
+def run_with_daemon(socket_path, scenario):
+    async def main():
+        async with FakeDaemon(socket_path) as daemon:
+            client = AsyncDockerClient(socket_path=socket_path, pool_size=4)
+            try:
+                return daemon, await scenario(client)
+            finally:
+                await client.close()
+
+    return asyncio.run(main())
+
+
+def test_requests_reuse_keep_alive_connection(socket_path):
+    async def scenario(client):
+        assert await client.ping() is True
+        await client.containers(all=True)
+        return await client.inspect_container("web")
+
+    daemon, container = run_with_daemon(socket_path, scenario)
+
+    assert container["Name"] == "/web"
+    assert daemon.connections == 1
+    assert [r[0] for r in daemon.requests] == ["GET"] * 4
+
+
+def test_containers_encodes_query_and_filters(socket_path):
+    async def scenario(client):
+        return await client.containers(all=True, filters={"status": "running"})
+
+    daemon, containers = run_with_daemon(socket_path, scenario)
+
+    assert containers == [{"Id": "abc123", "Names": ["/web"]}]
+    query = parse_qs(urlsplit(daemon.requests[-1][1]).query)
+    assert query["all"] == ["1"]
+    assert json.loads(query["filters"][0]) == {"status": ["running"]}
+
+
+def test_errors_map_to_docker_exceptions(socket_path):
+    async def scenario(client):
+        with pytest.raises(NotFound):
+            await client.inspect_container("missing")
+        with pytest.raises(APIError):
+            await client.inspect_container("broken")
+        return await client.inspect_container("web")
+
+    daemon, container = run_with_daemon(socket_path, scenario)
+    assert container["Id"] == "abc123"
+    assert daemon.connections == 1
+
+
+def test_no_content_response(socket_path):
+    async def scenario(client):
+        return await client.start_container("abc123")
+
+    daemon, result = run_with_daemon(socket_path, scenario)
+
+    assert result is None
+    assert ("POST", "/v1.44/containers/abc123/start") in daemon.requests
+
+
+def test_concurrent_requests_are_bounded_by_pool(socket_path):
+    async def scenario(client):
+        return await asyncio.gather(*(client.inspect_container("web") for _ in range(20)))
+
+    daemon, results = run_with_daemon(socket_path, scenario)
+
+    assert len(results) == 20
+    assert daemon.connections <= 4
+
+
+def test_tcp_docker_host_uses_the_docker_py_client(monkeypatch):
+    monkeypatch.setenv("DOCKER_HOST", "tcp://10.0.0.5:2376")
+    monkeypatch.setattr(async_docker, "_async_client", None)
+    sync_client = MagicMock()
+    sync_client.api.ping.return_value = True
+    sync_client.api.inspect_container.side_effect = NotFound("No such container")
+
+    with patch("Utils.async_docker.get_docker_client", return_value=sync_client):
+        client = async_docker.get_async_docker_client()
+        assert isinstance(client, ThreadedDockerClient)
+        assert asyncio.run(client.ping()) is True
+        asyncio.run(client.stop_container("abc123", timeout=5))
+        with pytest.raises(NotFound):
+            asyncio.run(client.inspect_container("gone"))
+
+    sync_client.api.stop.assert_called_once_with("abc123", timeout=5)
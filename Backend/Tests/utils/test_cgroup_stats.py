@@ -0,0 +1,132 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from Utils.cgroup_stats import CgroupStatsReader, NANOS_PER_TICK
+from Utils.stats import build_stats_frame
+from Utils.stats_sampler import StatsSampler
+
+CONTAINER_ID = "a" * 64
+NET_DEV = """Inter-|   Receive                                                |  Transmit
+ face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed
+    lo:     500       5    0    0    0     0          0         0      500       5    0    0    0     0       0          0
+  eth0:    4000      40    1    2    0     0          0         0     3000      30    0    3    0     0       0          0
+"""
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    cgroup = tmp_path / "cgroup"
+    proc = tmp_path / "proc"
+    write(cgroup / "cgroup.controllers", "cpu io memory\n")
+    scope = cgroup / "system.slice" / f"docker-{CONTAINER_ID}.scope"
+    write(scope / "cpu.stat", "usage_usec 1000\nuser_usec 600\nsystem_usec 400\n")
+    write(scope / "memory.current", "2048\n")
+    write(scope / "memory.max", "max\n")
+    write(scope / "io.stat", "8:0 rbytes=100 wbytes=200 rios=1 wios=2\n8:16 rbytes=10 wbytes=20 rios=1 wios=1\n")
+    write(scope / "cgroup.procs", "4242\n")
+    write(proc / "stat", "cpu  100 0 100 800 0 0 0 0 0 0\ncpu0 50 0 50 400 0 0 0\ncpu1 50 0 50 400 0 0 0\nintr 1\n")
+    write(proc / "meminfo", "MemTotal:       16384 kB\nMemFree: 1 kB\n")
+    write(proc / "4242" / "net" / "dev", NET_DEV)
+    return CgroupStatsReader(str(cgroup), str(proc)), scope, proc
+
+
+def test_read_produces_engine_api_shape(tree):
+    reader, _, _ = tree
+
+    stats = reader.read(CONTAINER_ID)
+
+    assert reader.available()
+    assert stats["cpu_stats"] == {
+        "cpu_usage": {"total_usage": 1_000_000},
+        "system_cpu_usage": 1000 * NANOS_PER_TICK,
+        "online_cpus": 2,
+    }
+    assert stats["precpu_stats"] == {}
+    assert stats["memory_stats"] == {"usage": 2048, "limit": 16384 * 1024}
+    assert stats["networks"] == {"eth0": {
+        "rx_bytes": 4000, "rx_packets": 40, "rx_errors": 1, "rx_dropped": 2,
+        "tx_bytes": 3000, "tx_packets": 30, "tx_errors": 0, "tx_dropped": 3,
+    }}
+
+
+def test_second_read_feeds_the_same_frame_fields_as_the_daemon(tree):
+    reader, scope, proc = tree
+    first = reader.read(CONTAINER_ID)
+    write(scope / "cpu.stat", "usage_usec 251000\n")
+    write(scope / "memory.max", "4096\n")
+    write(proc / "stat", "cpu  200 0 200 1600 0 0 0\ncpu0 1\ncpu1 1\n")
+
+    stats = reader.read(CONTAINER_ID, first)
+    frame = build_stats_frame(stats, datetime.now(timezone.utc))
+
+    # 250ms of CPU over 1000 jiffies of host time
+    assert frame["cpu_percent"] == round(250_000_000 / (1000 * NANOS_PER_TICK) * 100, 2)
+    assert frame["memory_percent"] == 50.0
+    assert (frame["network_rx"], frame["network_tx"]) == (4000, 3000)
+    assert (frame["blk_read"], frame["blk_write"]) == (110, 220)
+
+
+def test_missing_cgroup_raises_and_ends_stream(tree):
+    reader, scope, _ = tree
+    reader.read(CONTAINER_ID)
+    for child in scope.iterdir():
+        child.unlink()
+    scope.rmdir()
+
+    with pytest.raises(FileNotFoundError):
+        reader.read(CONTAINER_ID)
+    assert list(reader.stream(CONTAINER_ID, interval=0)) == []
+
+
+def test_cgroupfs_driver_layout(tmp_path, tree):
+    _, scope, proc = tree
+    cgroup = tmp_path / "cgroupfs"
+    (cgroup / "docker").mkdir(parents=True)
+    scope.rename(cgroup / "docker" / CONTAINER_ID)
+
+    stats = CgroupStatsReader(str(cgroup), str(proc)).read(CONTAINER_ID)
+
+    assert stats["memory_stats"]["usage"] == 2048
+
+
+@patch("Utils.containers.state_cache", MagicMock(ready=False))
+def test_sampler_reads_cgroup_and_skips_the_stats_api(tree):
+    reader, _, _ = tree
+    client = MagicMock()
+    client.containers.list.return_value = [MagicMock(id=CONTAINER_ID)]
+    sampler = StatsSampler(interval=1, cgroup=reader)
+    sampler._client = client
+
+    sampler.sample_all()
+
+    client.api.stats.assert_not_called()
+    assert sampler.latest(CONTAINER_ID).stats["memory_stats"]["usage"] == 2048
+
+
+@patch("Utils.containers.state_cache", MagicMock(ready=False))
+def test_sampler_and_stream_keep_their_own_previous_reading(tree):
+    reader, scope, proc = tree
+    client = MagicMock()
+    client.containers.list.return_value = [MagicMock(id=CONTAINER_ID)]
+    sampler = StatsSampler(interval=1, cgroup=reader)
+    sampler._client = client
+    stream = reader.stream(CONTAINER_ID, interval=0)
+
+    sampler.sample_all()
+    next(stream)
+    write(scope / "cpu.stat", "usage_usec 251000\n")
+    write(proc / "stat", "cpu  200 0 200 1600 0 0 0\ncpu0 1\ncpu1 1\n")
+    streamed = next(stream)
+    sampler.sample_all()
+
+    # both see the change against their own last reading, not the other's
+    for stats in (streamed, sampler.latest(CONTAINER_ID).stats):
+        assert stats["precpu_stats"]["cpu_usage"]["total_usage"] == 1_000_000
+        assert stats["cpu_stats"]["system_cpu_usage"] > stats["precpu_stats"]["system_cpu_usage"]
@@ -0,0 +1,75 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+from Utils.container_index import ContainerIndex
+from Utils.docker_events import DockerEventWatcher
+
+
+def make_summary(container_id: str, name: str) -> dict:
+    return {"Id": container_id, "Names": [f"/{name}"]}
+
+
+@pytest.fixture
+def index():
+    client = MagicMock()
+    client.api.containers.return_value = [
+        make_summary("abc123" + "0" * 58, "web"),
+        make_summary("abd456" + "0" * 58, "db"),
+        make_summary("f00d00" + "0" * 58, "cache"),
+    ]
+    idx = ContainerIndex()
+    idx.seed(client)
+    return idx
+
+
+def test_resolve_by_name_and_unique_prefix(index):
+    assert index.resolve("web").startswith("abc123")
+    assert index.resolve("/db").startswith("abd456")
+    assert index.resolve("F00D").startswith("f00d00")
+
+
+def test_resolve_miss_returns_none(index):
+    assert index.resolve("nope") is None
+    assert ContainerIndex().resolve("web") is None
+
+
+def test_resolve_ambiguous_prefix(index):
+    with pytest.raises(HTTPException) as exc:
+        index.resolve("ab")
+    assert exc.value.status_code == 409
+
+
+def test_events_keep_index_current(index):
+    new_id = "beef00" + "0" * 58
+    index.handle_event({"Type": "container", "Action": "create",
+                        "Actor": {"ID": new_id, "Attributes": {"name": "worker"}}})
+    assert index.resolve("worker") == new_id
+    assert index.resolve("bee") == new_id
+
+    index.handle_event({"Type": "container", "Action": "rename",
+                        "Actor": {"ID": new_id, "Attributes": {"name": "worker-2", "oldName": "/worker"}}})
+    assert index.resolve("worker") is None
+    assert index.resolve("worker-2") == new_id
+
+    index.handle_event({"Type": "container", "Action": "destroy", "Actor": {"ID": new_id, "Attributes": {}}})
+    assert index.resolve("worker-2") is None
+    assert index.resolve("bee") is None
+    assert len(index) == 3
+
+
+def test_non_container_events_are_ignored(index):
+    index.handle_event({"Type": "network", "Action": "destroy", "Actor": {"ID": "abc123" + "0" * 58}})
+    assert index.resolve("web") is not None
+
+
+def test_event_watcher_isolates_failing_listeners():
+    watcher = DockerEventWatcher()
+    received = []
+    watcher.subscribe(MagicMock(side_effect=RuntimeError("boom")))
+    watcher.subscribe(received.append)
+
+    watcher.dispatch({"Type": "container", "Action": "start"})
+
+    assert received == [{"Type": "container", "Action": "start"}]
@@ -0,0 +1,115 @@
+from unittest.mock import MagicMock, patch
+
+from Utils.containers import (
+    list_containers,
+    inspect_container,
+    container_name,
+    container_image_id,
+    container_labels,
+    container_command,
+    container_created,
+    container_ports,
+    container_mounts,
+    container_networks,
+)
+from Tests.utils.Builders.DockerContainerBuilder import DockerContainerBuilder
+
+
+def make_sparse_container():
+    mock = MagicMock()
+    mock.attrs = {
+        "Id": "abc123",
+        "Names": ["/web"],
+        "Image": "nginx:latest",
+        "ImageID": "sha256:img1",
+        "Command": "nginx -g 'daemon off;'",
+        "Created": 1704110400,
+        "Ports": [
+            {"IP": "0.0.0.0", "PrivatePort": 80, "PublicPort": 8080, "Type": "tcp"},
+            {"IP": "::", "PrivatePort": 80, "PublicPort": 8080, "Type": "tcp"},
+            {"PrivatePort": 443, "Type": "tcp"},
+        ],
+        "Labels": {"com.docker.compose.project": "shop"},
+        "State": "running",
+        "Mounts": [{"Type": "volume", "Name": "data", "Destination": "/data"}],
+        "NetworkSettings": {"Networks": {"bridge": {"NetworkID": "net1", "IPAddress": "172.17.0.2"}}},
+    }
+    return mock
+
+
+def test_list_containers_is_sparse():
+    client = MagicMock()
+    list_containers(client, all=False, filters={"status": "running"})
+    client.containers.list.assert_called_once_with(all=False, filters={"status": "running"}, sparse=True)
+
+
+def test_accessors_read_summary_payload():
+    container = make_sparse_container()
+
+    assert container_name(container) == "web"
+    assert container_image_id(container) == "sha256:img1"
+    assert container_labels(container) == {"com.docker.compose.project": "shop"}
+    assert container_command(container) == "nginx -g 'daemon off;'"
+    assert container_created(container).isoformat() == "2024-01-01T12:00:00+00:00"
+    assert container_ports(container) == {
+        "80/tcp": [{"HostIp": "0.0.0.0", "HostPort": "8080"}, {"HostIp": "::", "HostPort": "8080"}],
+        "443/tcp": None,
+    }
+    assert container_mounts(container)[0]["Name"] == "data"
+    assert container_networks(container)["bridge"]["NetworkID"] == "net1"
+
+
+def test_accessors_read_inspect_payload():
+    container = (
+        DockerContainerBuilder()
+        .with_name("db")
+        .with_command(["postgres"])
+        .with_created("2024-01-01T12:00:00Z")
+        .with_labels({"tier": "data"})
+        .with_port_mapping("5432/tcp", "0.0.0.0", "5432")
+        .build()
+    )
+
+    assert container_name(container) == "db"
+    assert container_command(container) == "postgres"
+    assert container_labels(container) == {"tier": "data"}
+    assert container_created(container).isoformat() == "2024-01-01T12:00:00+00:00"
+    assert container_ports(container) == {"5432/tcp": [{"HostIp": "0.0.0.0", "HostPort": "5432"}]}
+
+
+def test_inspect_command_matches_the_list_command_with_an_entrypoint():
+    container = DockerContainerBuilder().with_command(["-g", "daemon off;"]).build()
+    container.attrs["Config"]["Entrypoint"] = ["nginx"]
+
+    assert container_command(container) == "nginx -g daemon off;"
+
+
+def test_inspect_container_only_reloads_sparse_objects():
+    sparse = make_sparse_container()
+    full = DockerContainerBuilder().build()
+
+    inspect_container(sparse)
+    inspect_container(full)
+
+    sparse.reload.assert_called_once()
+    full.reload.assert_not_called()
+
+
+def test_list_containers_filters_cached_snapshot_in_memory():
+    web = make_sparse_container().attrs
+    db = {"Id": "def456", "Names": ["/db"], "State": "exited", "Labels": {},
+          "NetworkSettings": {"Networks": {"backend": {"NetworkID": "net2"}}}}
+    client = MagicMock()
+    client.containers.prepare_model.side_effect = lambda attrs: attrs["Id"]
+
+    with patch("Utils.containers.state_cache") as cache:
+        cache.ready = True
+        cache.snapshot.return_value.containers = [web, db]
+
+        assert list_containers(client, filters={"status": ["running"]}) == ["abc123"]
+        assert list_containers(client, filters={"name": ["d"]}) == ["def456"]
+        assert list_containers(client, filters={"label": ["com.docker.compose.project=shop"]}) == ["abc123"]
+        assert list_containers(client, filters={"network": ["net2"]}) == ["def456"]
+        assert list_containers(client, filters={"volume": ["data"]}) is client.containers.list.return_value
+
+    client.containers.list.assert_called_once_with(all=True, filters={"volume": ["data"]}, sparse=True)
@@ -0,0 +1,91 @@
+from unittest.mock import MagicMock
+
+from Utils.error_tracker import ContainerErrorTracker, ERROR_WINDOW_LINES, _timestamp_ns
+
+
+def log_lines(*lines):
+    return "".join(f"2024-05-01T10:00:{i:02d}.{i + 1}Z {line}\n" for i, line in lines).encode()
+
+
+def make_container(*responses):
+    container = MagicMock()
+    container.id = "abc123"
+    container.name = "web"
+    container.logs.side_effect = list(responses)
+    return container
+
+
+def test_timestamp_parsing_handles_trimmed_fractions():
+    assert _timestamp_ns("2024-05-01T10:00:00.5Z") - _timestamp_ns("2024-05-01T10:00:00Z") == 500_000_000
+    assert _timestamp_ns("2024-05-01T10:00:00.000000001Z") > _timestamp_ns("2024-05-01T10:00:00Z")
+
+
+def test_first_observe_reads_tail_and_counts_errors():
+    tracker = ContainerErrorTracker(refresh_seconds=0)
+    container = make_container(log_lines((0, "started"), (1, "Connection FAILED"), (2, "ok")))
+
+    assert tracker.observe(container) == (1, "Connection FAILED")
+    container.logs.assert_called_once_with(tail=ERROR_WINDOW_LINES, timestamps=True)
+
+
+def test_later_observe_fetches_only_new_lines():
+    tracker = ContainerErrorTracker(refresh_seconds=0)
+    container = make_container(
+        log_lines((0, "error one")),
+        # the daemon may resend the cursor line; it must not be counted twice
+        log_lines((0, "error one"), (1, "Exception: boom")),
+    )
+
+    tracker.observe(container)
+    count, latest = tracker.observe(container)
+
+    assert (count, latest) == (2, "Exception: boom")
+    since = container.logs.call_args.kwargs["since"]
+    assert since == _timestamp_ns("2024-05-01T10:00:00.1Z") / 1_000_000_000
+
+
+def test_empty_first_fetch_keeps_reading_the_tail():
+    tracker = ContainerErrorTracker(refresh_seconds=0)
+    container = make_container(b"", log_lines((0, "Exception: late")))
+
+    assert tracker.observe(container) == (0, None)
+    assert tracker.observe(container) == (1, "Exception: late")
+    assert container.logs.call_args.kwargs == {"tail": ERROR_WINDOW_LINES, "timestamps": True}
+
+
+def test_empty_fetch_is_not_retried_between_refreshes():
+    tracker = ContainerErrorTracker(refresh_seconds=60)
+    container = make_container(b"")
+
+    tracker.observe(container)
+    tracker.observe(container)
+
+    assert container.logs.call_count == 1
+
+
+def test_window_drops_errors_that_scroll_out():
+    tracker = ContainerErrorTracker(refresh_seconds=0)
+    quiet = "".join(f"2024-05-01T11:{i // 60:02d}:{i % 60:02d}Z fine\n" for i in range(ERROR_WINDOW_LINES)).encode()
+    container = make_container(log_lines((0, "error")), quiet)
+
+    assert tracker.observe(container) == (1, "error")
+    assert tracker.observe(container) == (0, None)
+
+
+def test_serves_from_memory_between_refreshes():
+    tracker = ContainerErrorTracker(refresh_seconds=60)
+    container = make_container(log_lines((0, "error")))
+
+    tracker.observe(container)
+    tracker.observe(container)
+
+    assert container.logs.call_count == 1
+
+
+def test_destroy_event_forgets_container():
+    tracker = ContainerErrorTracker(refresh_seconds=0)
+    tracker.observe(make_container(log_lines((0, "error"))))
+
+    tracker.handle_event({"Type": "container", "Action": "destroy", "Actor": {"ID": "abc123"}})
+
+    assert tracker.peek("abc123") == (0, None)
@@ -0,0 +1,59 @@
+import json
+
+import msgpack
+import pytest
+
+from Utils.frame_codec import CODECS, decode_binary, encode_binary, negotiate
+
+CONTAINER_FRAME = {
+    "cpu_percent": 12.5,
+    "cpu_cores": 4,
+    "per_cpu_usage": [10, 20, 30, 2 ** 40],
+    "memory_usage": 1 << 30,
+    "memory_limit": 1 << 33,
+    "memory_percent": 12.5,
+    "network_rx": 1000,
+    "network_tx": 2000,
+    "blk_read": 3000,
+    "blk_write": 4000,
+    "uptime_seconds": 3600,
+}
+
+HOST_FRAME = {
+    "type": "stats",
+    "sampled_at": 1700000000.25,
+    "rows": {"aaaaaaaaaaaa": (50.0, 2048, 4096, 1.5, 0.0, 0.0, 8.0)},
+    "removed": ["bbbbbbbbbbbb"],
+    "names": {"aaaaaaaaaaaa": "web-ü"},
+}
+
+
+def test_binary_container_frame_round_trips():
+    data = encode_binary(CONTAINER_FRAME)
+
+    assert data[:2] == b"\x01\x01"
+    assert decode_binary(data) == CONTAINER_FRAME
+    assert len(data) < len(json.dumps(CONTAINER_FRAME))
+
+
+def test_binary_host_frame_round_trips():
+    decoded = decode_binary(encode_binary(HOST_FRAME))
+
+    assert decoded == HOST_FRAME
+
+
+def test_binary_rejects_unknown_version():
+    with pytest.raises(ValueError):
+        decode_binary(b"\x02\x01" + encode_binary(CONTAINER_FRAME)[2:])
+
+
+def test_msgpack_round_trips():
+
+    assert msgpack.unpackb(CODECS["msgpack"].encode(CONTAINER_FRAME)) == CONTAINER_FRAME
+
+
+def test_negotiate_prefers_query_param_then_subprotocol():
+    assert negotiate(None, []).name == "json"
+    assert negotiate("BINARY", ["stats.json"]).name == "binary"
+    assert negotiate(None, ["chat", "stats.binary.v1", "stats.json"]).name == "binary"
+    assert negotiate("xml", []) is None
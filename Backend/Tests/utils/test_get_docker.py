@@ -0,0 +1,103 @@
+from unittest.mock import patch, MagicMock
+
+import pytest
+from docker.errors import DockerException, NotFound
+from fastapi import HTTPException
+
+from Utils import getDocker
+from Utils.getDocker import get_docker_client, close_docker_client, init_docker_client, get_container
+
+
+@pytest.fixture(autouse=True)
+def reset_client():
+    getDocker._client = None
+    yield
+    getDocker._client = None
+
+
+@patch("Utils.getDocker.docker.from_env")
+def test_get_docker_client_is_shared(mock_from_env):
+    mock_from_env.return_value = MagicMock()
+
+    first = get_docker_client()
+    second = get_docker_client()
+
+    assert first is second
+    mock_from_env.assert_called_once_with(max_pool_size=getDocker.DOCKER_POOL_SIZE, timeout=getDocker.DOCKER_TIMEOUT)
+
+
+@patch("Utils.getDocker.docker.from_env")
+def test_close_docker_client_releases_pool(mock_from_env):
+    client = MagicMock()
+    mock_from_env.return_value = client
+
+    get_docker_client()
+    close_docker_client()
+
+    client.close.assert_called_once()
+    assert getDocker._client is None
+
+    get_docker_client()
+    assert mock_from_env.call_count == 2
+
+
+@patch("Utils.getDocker.docker.from_env")
+def test_get_docker_client_unreachable(mock_from_env):
+    mock_from_env.side_effect = DockerException("socket missing")
+
+    with pytest.raises(HTTPException) as exc:
+        get_docker_client()
+
+    assert exc.value.status_code == 503
+    assert getDocker._client is None
+
+
+@patch("Utils.getDocker.docker.from_env")
+def test_init_docker_client_tolerates_missing_daemon(mock_from_env):
+    mock_from_env.side_effect = DockerException("socket missing")
+
+    init_docker_client()
+
+    assert getDocker._client is None
+
+
+@patch("Utils.getDocker.container_index")
+@patch("Utils.getDocker.docker.from_env")
+def test_get_container_uses_index_without_listing(mock_from_env, mock_index):
+    client = MagicMock()
+    mock_from_env.return_value = client
+    mock_index.resolve.return_value = "abc123full"
+
+    container = get_container(" web ")
+
+    mock_index.resolve.assert_called_once_with("web")
+    client.containers.get.assert_called_once_with("abc123full")
+    client.containers.list.assert_not_called()
+    assert container is client.containers.get.return_value
+
+
+@patch("Utils.getDocker.container_index")
+@patch("Utils.getDocker.docker.from_env")
+def test_get_container_falls_back_to_daemon_lookup(mock_from_env, mock_index):
+    client = MagicMock()
+    mock_from_env.return_value = client
+    mock_index.resolve.return_value = None
+
+    get_container("web")
+
+    client.containers.get.assert_called_once_with("web")
+
+
+@patch("Utils.getDocker.container_index")
+@patch("Utils.getDocker.docker.from_env")
+def test_get_container_not_found(mock_from_env, mock_index):
+    client = MagicMock()
+    client.containers.get.side_effect = NotFound("gone")
+    mock_from_env.return_value = client
+    mock_index.resolve.return_value = "stale-id"
+
+    with pytest.raises(HTTPException) as exc:
+        get_container("web")
+
+    assert exc.value.status_code == 404
+    mock_index.remove.assert_called_once_with("stale-id")
@@ -0,0 +1,43 @@
+from unittest.mock import MagicMock
+
+from Utils.image_index import build_image_index, image_tags
+from Utils.state_cache import state_cache
+
+
+def test_build_image_index_uses_single_listing_call():
+    client = MagicMock()
+    client.api.images.return_value = [
+        {"Id": "sha256:a", "RepoTags": ["nginx:latest"], "Size": 10, "Created": 1},
+        {"Id": "sha256:b", "RepoTags": ["<none>:<none>"], "Size": 20, "Created": 2},
+    ]
+
+    index = build_image_index(client)
+
+    client.api.images.assert_called_once_with()
+    client.images.get.assert_not_called()
+    assert image_tags(index, "sha256:a") == ["nginx:latest"]
+    assert image_tags(index, "sha256:b") == []
+    assert image_tags(index, "sha256:missing") == []
+    assert image_tags(index, None) == []
+    assert index["sha256:b"].size == 20
+
+
+def test_build_image_index_reuses_state_cache_revision():
+    client = MagicMock()
+    client.api.containers.return_value = []
+    client.api.networks.return_value = []
+    client.api.volumes.return_value = {"Volumes": []}
+    client.api.images.return_value = [{"Id": "sha256:a", "RepoTags": ["redis:7"], "RepoDigests": []}]
+    client.api.inspect_image.return_value = {"Id": "sha256:a", "RepoTags": ["redis:7"], "RepoDigests": [], "Size": 5}
+    state_cache.seed(client)
+    client.api.images.reset_mock()
+
+    try:
+        first = build_image_index(client)
+        second = build_image_index(client)
+    finally:
+        state_cache.reset()
+
+    assert first is second
+    assert image_tags(first, "sha256:a") == ["redis:7"]
+    client.api.images.assert_not_called()
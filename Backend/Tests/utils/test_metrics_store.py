@@ -0,0 +1,118 @@
+import time
+
+import pytest
+
+from Utils.metrics_store import MetricsStore, RingTier, BYTES_PER_CONTAINER, TIERS, tiers_for
+
+
+def sample(cpu_total, system_total, memory, rx=0, read=0):
+    return {
+        "cpu_stats": {"cpu_usage": {"total_usage": cpu_total, "percpu_usage": [0]}, "system_cpu_usage": system_total},
+        "precpu_stats": {"cpu_usage": {"total_usage": 0}, "system_cpu_usage": 0},
+        "memory_stats": {"usage": memory},
+        "networks": {"eth0": {"rx_bytes": rx, "tx_bytes": 0}},
+        "blkio_stats": {"io_service_bytes_recursive": [{"op": "Read", "value": read}]},
+    }
+
+
+def test_ring_tier_keeps_running_mean_and_overwrites_old_laps():
+    tier = RingTier(resolution=10, capacity=3)
+    tier.add(100, (1.0,) * 6)
+    tier.add(105, (3.0,) * 6)
+    tier.add(110, (4.0,) * 6)
+
+    assert [(p.timestamp, p.cpu_percent) for p in tier.points(100, 119)] == [(100, 2.0), (110, 4.0)]
+
+    tier.add(130, (7.0,) * 6)  # bucket 13 lands in bucket 10's slot
+
+    assert [(p.timestamp, p.cpu_percent) for p in tier.points(100, 139)] == [(110, 4.0), (130, 7.0)]
+    assert tier.points(100, 109) == []
+
+
+def test_tiers_are_never_finer_than_the_sampler_interval():
+    assert tiers_for(1) == ((1, 900), (10, 1080), (60, 1440), (300, 2016))
+    assert tiers_for(5) == ((5, 180), (10, 1080), (60, 1440), (300, 2016))
+    assert tiers_for(30) == ((30, 360), (60, 1440), (300, 2016))
+
+
+def test_record_computes_rates_and_rollups():
+    store = MetricsStore(tiers_for(1))
+    now = time.time() // 60 * 60 - 120
+    for i in range(60):
+        store.record("abc", sample(25, 100, 1000 + i, rx=i * 500, read=i * 100), timestamp=now + i)
+
+    step, raw = store.query("abc", now, now + 59, step=1)
+    assert step == 1 and len(raw) == 60
+    assert raw[0].network_rx == 0
+    assert raw[5].network_rx == pytest.approx(500)
+    assert raw[5].blk_read == pytest.approx(100)
+    assert raw[5].cpu_percent == pytest.approx(25)
+
+    step, rolled = store.query("abc", now, now + 59, step=10)
+    assert step == 10 and len(rolled) == 6
+    assert rolled[1].memory_usage == pytest.approx(1014.5)
+
+    step, regrouped = store.query("abc", now, now + 59, step=30)
+    assert step == 30 and len(regrouped) == 2
+
+
+def test_query_falls_back_to_coarser_tier_for_old_ranges():
+    store = MetricsStore()
+    old = time.time() - 2 * 3600
+    store.record("abc", sample(1, 4, 10), timestamp=old)
+
+    step, points = store.query("abc", old - 60, old + 60, step=1)
+
+    assert step == 10
+    assert len(points) == 1
+
+
+def test_memory_is_fixed_per_container_and_freed_on_destroy():
+    store = MetricsStore()
+    store.record("abc", sample(1, 4, 10))
+    store.record("def", sample(1, 4, 10))
+
+    assert store.memory_bytes() == 2 * BYTES_PER_CONTAINER
+    assert BYTES_PER_CONTAINER == sum(slots for _, slots in TIERS) * 36
+
+    store.handle_event({"Type": "container", "Action": "destroy", "Actor": {"ID": "abc"}})
+    assert store.container_ids() == ["def"]
+    assert store.query("abc", 0, time.time())[1] == []
+
+
+def test_load_returns_latest_or_window_mean():
+    store = MetricsStore()
+    now = time.time() // 60 * 60 - 60
+    for i, cpu_total in enumerate([10, 20, 90]):
+        stats = sample(cpu_total, 100, 100 * (i + 1))
+        stats["memory_stats"]["limit"] = 1000
+        store.record("abc", stats, timestamp=now + i)
+
+    latest = store.load("abc")
+    windowed = store.load("abc", window=10)
+
+    assert latest.cpu_percent == pytest.approx(90)
+    assert latest.memory_limit == 1000
+    assert windowed.cpu_percent == pytest.approx(40)
+    assert windowed.memory_usage == pytest.approx(200)
+    assert store.load("missing") is None
+
+
+def test_record_batch_matches_record():
+    from Utils.stats_batch import SweepTracker
+    from Utils.stats_sampler import StatsSample
+
+    scalar, batched, tracker = MetricsStore(), MetricsStore(), SweepTracker()
+    now = time.time() // 60 * 60 - 120
+    for i in range(5):
+        sweep = {
+            cid: StatsSample(sample(25 * (n + 1), 100, 1000 + i, rx=i * 500 * (n + 1), read=i * 100), now + i)
+            for n, cid in enumerate(("abc", "def"))
+        }
+        for cid, s in sweep.items():
+            scalar.record(cid, s.stats, s.sampled_at)
+        batched.on_batch(tracker.build(sweep))
+
+    for cid in ("abc", "def"):
+        assert batched.query(cid, now, now + 4, step=1) == scalar.query(cid, now, now + 4, step=1)
+        assert batched.load(cid) == scalar.load(cid)
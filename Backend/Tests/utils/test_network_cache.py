@@ -0,0 +1,51 @@
+from unittest.mock import MagicMock
+
+from Utils.network_cache import NetworkMetadataCache
+from Utils.state_cache import state_cache
+
+NETWORK = {
+    "Id": "net1",
+    "Name": "backend",
+    "Driver": "bridge",
+    "IPAM": {"Config": [{"Subnet": "172.20.0.0/16", "Gateway": "172.20.0.1"}]},
+    "Internal": False,
+    "Attachable": True,
+}
+
+
+def test_inspects_each_network_once_until_invalidated():
+    client = MagicMock()
+    client.api.inspect_network.return_value = NETWORK
+    cache = NetworkMetadataCache()
+
+    first = cache.get(client, "net1")
+    cache.get(client, "net1")
+
+    assert (first.driver, first.gateway, first.subnet, first.attachable) == ("bridge", "172.20.0.1", "172.20.0.0/16", True)
+    client.api.inspect_network.assert_called_once_with("net1")
+
+    cache.handle_event({"Type": "network", "Action": "connect", "Actor": {"ID": "net1"}})
+    cache.handle_event({"Type": "container", "Action": "start", "Actor": {"ID": "net1"}})
+    cache.get(client, "net1")
+    assert client.api.inspect_network.call_count == 2
+
+
+def test_reads_from_seeded_state_cache_without_inspecting():
+    client = MagicMock()
+    client.api.containers.return_value = []
+    client.api.images.return_value = []
+    client.api.volumes.return_value = {"Volumes": []}
+    client.api.networks.return_value = [NETWORK]
+    state_cache.seed(client)
+    cache = NetworkMetadataCache()
+
+    try:
+        metadata = cache.get(client, "net1")
+        missing = cache.get(client, "other")
+    finally:
+        state_cache.reset()
+
+    assert metadata.name == "backend"
+    assert metadata.gateway == "172.20.0.1"
+    assert missing is None
+    client.api.inspect_network.assert_not_called()
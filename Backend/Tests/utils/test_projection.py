@@ -0,0 +1,28 @@
+import pytest
+from fastapi import HTTPException
+
+from Models.models import ContainerSummary
+from Utils.projection import parse_fields, wants, build, select_fields
+
+
+def test_parse_fields_always_includes_id():
+    assert parse_fields("name, status", ContainerSummary) == frozenset({"id", "name", "status"})
+    assert parse_fields(None, ContainerSummary) is None
+    assert parse_fields("", ContainerSummary) is None
+
+
+def test_parse_fields_rejects_unknown_names():
+    with pytest.raises(HTTPException) as exc:
+        parse_fields("name,cpu_percent", ContainerSummary)
+    assert exc.value.status_code == 400
+    assert "cpu_percent" in exc.value.detail
+
+
+def test_partial_build_and_project():
+    fields = frozenset({"id", "name"})
+    item = build(ContainerSummary, fields, {"id": "abc", "name": "web", "command": "ignored"})
+
+    assert wants(fields, "name", "image")
+    assert not wants(fields, "image")
+    assert wants(None, "image")
+    assert select_fields(item, fields) == {"id": "abc", "name": "web"}
@@ -0,0 +1,111 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from Utils.prometheus_exporter import LatencyHistogram, RequestLatencyMiddleware, RestartCounter, render_metrics
+from Utils.stats_batch import compute_samples
+from Utils.stats_sampler import StatsSample
+
+WEB = "a" * 64
+
+
+def stats(cpu_total=250, memory=1024, limit=4096):
+    return {
+        "cpu_stats": {"cpu_usage": {"total_usage": cpu_total}, "system_cpu_usage": 1000},
+        "precpu_stats": {"cpu_usage": {"total_usage": 0}, "system_cpu_usage": 0},
+        "memory_stats": {"usage": memory, "limit": limit},
+        "networks": {"eth0": {"rx_bytes": 10, "tx_bytes": 20}},
+        "blkio_stats": {"io_service_bytes_recursive": [{"op": "Read", "value": 30}, {"op": "Write", "value": 40}]},
+    }
+
+
+def test_render_container_and_daemon_metrics():
+    snapshot = SimpleNamespace(
+        containers=({"State": "running"}, {"State": "running"}, {"State": "exited"}),
+        images=({},), volumes=(), networks=({}, {}),
+    )
+
+    text = render_metrics({WEB: StatsSample(stats(), 1700000000.0)}, {WEB: 'we"b'}, {WEB: 2}, snapshot)
+
+    labels = 'id="aaaaaaaaaaaa",name="we\\"b"'
+    assert f"docker_container_cpu_percent{{{labels}}} 25.0" in text
+    assert f"docker_container_memory_limit_bytes{{{labels}}} 4096" in text
+    assert f"docker_container_network_transmit_bytes_total{{{labels}}} 20" in text
+    assert f"docker_container_blkio_write_bytes_total{{{labels}}} 40" in text
+    assert f"docker_container_restarts_total{{{labels}}} 2" in text
+    assert 'docker_containers{state="running"} 2' in text
+    assert "docker_networks 2" in text
+    assert "# TYPE docker_container_network_receive_bytes_total counter" in text
+
+
+def test_daemon_counts_are_skipped_without_a_snapshot():
+    text = render_metrics({}, {}, {})
+
+    assert "docker_images" not in text
+    assert text.endswith("\n")
+
+
+def test_latency_histogram_buckets_are_cumulative():
+    histogram = LatencyHistogram(buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe("GET", "/containers/{container_id}", 200, seconds)
+
+    lines = []
+    histogram.render("latency", lines)
+
+    labels = 'method="GET",route="/containers/{container_id}",status="200"'
+    assert f'latency_bucket{{{labels},le="0.1"}} 2' in lines
+    assert f'latency_bucket{{{labels},le="1.0"}} 3' in lines
+    assert f'latency_bucket{{{labels},le="+Inf"}} 4' in lines
+    assert f"latency_count{{{labels}}} 4" in lines
+
+
+def test_latency_middleware_labels_requests_by_route_template():
+    app = FastAPI()
+    histogram = LatencyHistogram()
+    app.add_middleware(RequestLatencyMiddleware, histogram=histogram)
+
+    @app.get("/containers/{container_id}/metrics")
+    def metrics(container_id: str):
+        if container_id == "missing":
+            raise HTTPException(status_code=404)
+        return {}
+
+    client = TestClient(app)
+    for path in ("/containers/abc/metrics", "/containers/def/metrics", "/containers/missing/metrics", "/nope"):
+        client.get(path)
+
+    lines = []
+    histogram.render("latency", lines)
+    counts = dict(line[len("latency_count{"):].rsplit("} ", 1) for line in lines if line.startswith("latency_count"))
+    assert counts == {
+        'method="GET",route="/containers/{container_id}/metrics",status="200"': "2",
+        'method="GET",route="/containers/{container_id}/metrics",status="404"': "1",
+        'method="GET",route="unmatched",status="404"': "1",
+    }
+
+
+def test_restart_counter_counts_start_after_die():
+    counter = RestartCounter()
+    for action in ("start", "die", "start", "die", "die", "start"):
+        counter.handle_event({"Type": "container", "Action": action, "Actor": {"ID": WEB}})
+
+    assert counter.counts == {WEB: 2}
+
+    counter.handle_event({"Type": "container", "Action": "destroy", "Actor": {"ID": WEB}})
+    assert counter.counts == {}
+
+
+def test_render_for_a_thousand_containers_computes_one_batch():
+    samples = {f"{i:064x}": StatsSample(stats(cpu_total=i), 1700000000.0) for i in range(1000)}
+    names = {cid: f"svc-{i}" for i, cid in enumerate(samples)}
+
+    with patch("Utils.prometheus_exporter.compute_samples", wraps=compute_samples) as compute:
+        text = render_metrics(samples, names, {}, histogram=LatencyHistogram())
+
+    assert text.count("docker_container_cpu_percent{") == 1000
+    # one vectorized pass over every container, never one per container or per metric
+    compute.assert_called_once()
+    assert len(compute.call_args.args[0]) == 1000
@@ -0,0 +1,75 @@
+import threading
+import time
+
+import pytest
+
+from Utils.single_flight import SingleFlight
+
+
+def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    executions = []
+
+    def slow_query():
+        executions.append(1)
+        started.set()
+        release.wait(2)
+        return ["result"]
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("containers", slow_query)))
+    leader.start()
+    started.wait(2)
+
+    followers = [threading.Thread(target=lambda: results.append(flight.do("containers", slow_query)))
+                 for _ in range(5)]
+    for t in followers:
+        t.start()
+    while flight.stats()["deduplicated"] < 5:
+        time.sleep(0.001)
+    release.set()
+    for t in [leader, *followers]:
+        t.join(2)
+
+    assert len(executions) == 1
+    assert results == [["result"]] * 6
+    assert all(r is results[0] for r in results)
+    assert flight.stats() == {"calls": 6, "executions": 1, "deduplicated": 5, "cache_hits": 0, "in_flight": 0}
+
+
+def test_errors_propagate_and_are_not_cached():
+    flight = SingleFlight()
+
+    def failing():
+        raise RuntimeError("daemon down")
+
+    with pytest.raises(RuntimeError):
+        flight.do("images", failing, ttl=10)
+
+    assert flight.do("images", lambda: "ok", ttl=10) == "ok"
+
+
+def test_ttl_serves_recent_result():
+    flight = SingleFlight()
+    calls = []
+
+    def query():
+        calls.append(1)
+        return len(calls)
+
+    assert flight.do("volumes", query, ttl=60) == 1
+    assert flight.do("volumes", query, ttl=60) == 1
+    assert flight.do("other", query) == 2
+    assert flight.stats()["cache_hits"] == 1
+
+
+def test_without_ttl_sequential_calls_run_again():
+    flight = SingleFlight()
+    calls = []
+
+    flight.do("networks", lambda: calls.append(1))
+    flight.do("networks", lambda: calls.append(1))
+
+    assert len(calls) == 2
@@ -0,0 +1,134 @@
+from unittest.mock import MagicMock
+
+import pytest
+from docker.errors import NotFound
+
+from Utils.containers import list_containers
+from Utils.state_cache import DockerStateCache, state_cache, list_images, list_networks, list_volumes
+
+
+def make_client():
+    client = MagicMock()
+    api = client.api
+    api.containers.return_value = [
+        {"Id": "c1", "Names": ["/web"], "State": "running"},
+        {"Id": "c2", "Names": ["/db"], "State": "exited"},
+    ]
+    api.networks.return_value = [{"Id": "n1", "Name": "bridge"}]
+    api.volumes.return_value = {"Volumes": [{"Name": "data"}]}
+    api.images.return_value = [{"Id": "sha256:i1", "RepoTags": ["nginx:latest"], "RepoDigests": []}]
+    api.inspect_image.return_value = {"Id": "sha256:i1", "RepoTags": ["nginx:latest"], "RepoDigests": [], "Os": "linux"}
+    api.version.return_value = {"Version": "26.0.0"}
+    api.info.return_value = {"Swarm": {"LocalNodeState": "inactive"}}
+    client.containers.prepare_model.side_effect = lambda attrs: attrs
+    client.images.prepare_model.side_effect = lambda attrs: attrs
+    client.volumes.prepare_model.side_effect = lambda attrs: attrs
+    client.networks.prepare_model.side_effect = lambda attrs: attrs
+    return client
+
+
+@pytest.fixture
+def cache():
+    return DockerStateCache()
+
+
+@pytest.fixture
+def seeded_global_cache():
+    client = make_client()
+    state_cache.seed(client)
+    yield client
+    state_cache.reset()
+
+
+def test_seed_builds_snapshot(cache):
+    client = make_client()
+    cache.seed(client)
+
+    snapshot = cache.snapshot()
+    assert cache.ready
+    assert [c["Id"] for c in snapshot.containers] == ["c1", "c2"]
+    assert snapshot.images[0]["Os"] == "linux"
+    assert snapshot.volumes[0]["Name"] == "data"
+    assert snapshot.networks[0]["Name"] == "bridge"
+    assert snapshot.version["Version"] == "26.0.0"
+
+
+def test_reconcile_without_changes_keeps_revision_and_skips_known_images(cache):
+    client = make_client()
+    cache.seed(client)
+    revision = cache.revision
+
+    cache.seed(client)
+
+    assert cache.revision == revision
+    client.api.inspect_image.assert_called_once()
+
+
+def test_snapshot_is_reused_until_revision_changes(cache):
+    cache.seed(make_client())
+    assert cache.snapshot() is cache.snapshot()
+
+
+def test_container_events_update_state(cache):
+    client = make_client()
+    cache.seed(client)
+    revision = cache.revision
+
+    client.api.containers.return_value = [{"Id": "c3", "Names": ["/worker"], "State": "created"}]
+    cache.handle_event({"Type": "container", "Action": "create", "Actor": {"ID": "c3", "Attributes": {}}})
+    client.api.containers.assert_called_with(all=True, filters={"id": "c3"})
+    assert cache.revision == revision + 1
+
+    cache.handle_event({"Type": "container", "Action": "destroy", "Actor": {"ID": "c1", "Attributes": {}}})
+    assert sorted(c["Id"] for c in cache.snapshot().containers) == ["c2", "c3"]
+    assert cache.revision == revision + 2
+
+
+def test_exec_events_are_ignored(cache):
+    client = make_client()
+    cache.seed(client)
+    revision = cache.revision
+    client.api.containers.reset_mock()
+
+    cache.handle_event({"Type": "container", "Action": "exec_start: sh", "Actor": {"ID": "c1"}})
+
+    client.api.containers.assert_not_called()
+    assert cache.revision == revision
+
+
+def test_image_volume_and_network_events(cache):
+    client = make_client()
+    cache.seed(client)
+
+    client.api.inspect_image.side_effect = NotFound("gone")
+    cache.handle_event({"Type": "image", "Action": "delete", "Actor": {"ID": "sha256:i1"}})
+    assert cache.snapshot().images == ()
+
+    client.api.inspect_volume.return_value = {"Name": "logs"}
+    cache.handle_event({"Type": "volume", "Action": "create", "Actor": {"ID": "logs"}})
+    assert {v["Name"] for v in cache.snapshot().volumes} == {"data", "logs"}
+
+    cache.handle_event({"Type": "network", "Action": "destroy", "Actor": {"ID": "n1"}})
+    assert cache.snapshot().networks == ()
+
+
+def test_list_helpers_serve_from_seeded_cache(seeded_global_cache):
+    client = seeded_global_cache
+
+    assert [c["Id"] for c in list_containers(client, all=False)] == ["c1"]
+    assert len(list_containers(client, all=True)) == 2
+    assert len(list_images(client)) == 1
+    assert len(list_volumes(client)) == 1
+    assert len(list_networks(client)) == 1
+    client.containers.list.assert_not_called()
+    client.images.list.assert_not_called()
+
+
+def test_list_helpers_fall_back_to_daemon_when_not_seeded():
+    client = MagicMock()
+
+    list_containers(client, all=True)
+    list_images(client)
+
+    client.containers.list.assert_called_once_with(all=True, filters=None, sparse=True)
+    client.images.list.assert_called_once()
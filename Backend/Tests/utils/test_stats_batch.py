@@ -0,0 +1,54 @@
+import random
+
+import numpy as np
+
+from Utils.stats import _calculate_cpu_percent, _extract_network_io, _extract_blk_io
+from Utils.stats_batch import compute_samples, rates
+
+
+def random_sample(rng):
+    cores = rng.randint(0, 16)
+    system = rng.randint(10 ** 15, 10 ** 16)
+    total = rng.randint(10 ** 12, 10 ** 14)
+    return {
+        "cpu_stats": {
+            "cpu_usage": {"total_usage": total + rng.randint(-10 ** 6, 10 ** 9), "percpu_usage": [0] * cores},
+            "system_cpu_usage": system + rng.choice([0, rng.randint(1, 10 ** 10)]),
+        },
+        "precpu_stats": {"cpu_usage": {"total_usage": total}, "system_cpu_usage": system},
+        "memory_stats": {"usage": rng.randint(0, 1 << 34), "limit": rng.choice([0, 1 << 34])},
+        "networks": {f"eth{i}": {"rx_bytes": rng.randint(0, 1 << 40), "tx_bytes": rng.randint(0, 1 << 40)}
+                     for i in range(rng.randint(0, 3))},
+        "blkio_stats": {"io_service_bytes_recursive": [
+            {"op": op, "value": rng.randint(0, 1 << 40)} for op in ("Read", "Write", "Sync", "Read")
+        ]},
+    }
+
+
+def test_batch_matches_scalar_functions():
+    rng = random.Random(7)
+    samples = [random_sample(rng) for _ in range(500)] + [{}]
+
+    batch = compute_samples(samples)
+
+    for i, stats in enumerate(samples):
+        assert batch.cpu_percent[i] == _calculate_cpu_percent(stats)
+        limit = stats.get("memory_stats", {}).get("limit") or 1
+        assert batch.memory_percent[i] == stats.get("memory_stats", {}).get("usage", 0) / limit * 100
+        net, blk = _extract_network_io(stats), _extract_blk_io(stats)
+        assert batch.counters[i].tolist() == [net["rx"], net["tx"], blk["read"], blk["write"]]
+
+
+def test_empty_batch():
+    batch = compute_samples([])
+    assert batch.cpu_percent.shape == (0,)
+    assert batch.counters.shape == (0, 4)
+
+
+def test_rates_clamp_resets_and_missing_intervals():
+    current = np.array([[100, 50, 0, 10], [100, 100, 100, 100]], dtype=np.int64)
+    previous = np.array([[0, 100, 0, 0], [0, 0, 0, 0]], dtype=np.int64)
+
+    result = rates(current, previous, np.array([2.0, 0.0]))
+
+    assert result.tolist() == [[50.0, 0.0, 0.0, 5.0], [0.0, 0.0, 0.0, 0.0]]
@@ -0,0 +1,73 @@
+from Utils.stats_batch import SweepTracker
+from Utils.stats_feed import StatsFeed, FeedSession, valid_subscription
+from Utils.stats_sampler import StatsSample
+
+WEB = "a" * 64
+DB = "b" * 64
+
+
+def stats(cpu_total, memory, rx=0):
+    return {
+        "cpu_stats": {"cpu_usage": {"total_usage": cpu_total}, "system_cpu_usage": 1000},
+        "precpu_stats": {"cpu_usage": {"total_usage": 0}, "system_cpu_usage": 0},
+        "memory_stats": {"usage": memory, "limit": 4096},
+        "networks": {"eth0": {"rx_bytes": rx, "tx_bytes": 0}},
+    }
+
+
+def sweep(tracker, at, **containers):
+    ids = {"web": WEB, "db": DB}
+    return tracker.build({ids[name]: StatsSample(s, at) for name, s in containers.items()})
+
+
+def test_feed_builds_rows_with_rates_once_per_sweep():
+    feed, tracker = StatsFeed(), SweepTracker()
+    feed.on_batch(sweep(tracker, 100.0, web=stats(250, 1024, rx=1000)))
+    feed.on_batch(sweep(tracker, 102.0, web=stats(500, 2048, rx=3000)))
+
+    snapshot = feed.snapshot()
+
+    assert snapshot.revision == 2
+    assert snapshot.rows[WEB] == (50.0, 2048, 4096, 1000.0, 0.0, 0.0, 0.0)
+
+
+def test_session_sends_full_rows_then_only_changes():
+    feed, session, tracker = StatsFeed(), FeedSession(threshold=0.05), SweepTracker()
+    feed.on_batch(sweep(tracker, 100.0, web=stats(250, 1000), db=stats(100, 1000)))
+
+    first = session.frame(feed.snapshot())
+    assert set(first["rows"]) == {WEB[:12], DB[:12]}
+    assert set(first["names"]) == {WEB[:12], DB[:12]}
+    assert session.frame(feed.snapshot()) is None
+
+    # web moves by 1% (below threshold), db by 50%
+    feed.on_batch(sweep(tracker, 101.0, web=stats(250, 1010), db=stats(150, 1000)))
+    second = session.frame(feed.snapshot())
+    assert set(second["rows"]) == {DB[:12]}
+    assert "names" not in second
+
+    feed.on_batch(sweep(tracker, 102.0, web=stats(250, 1010)))
+    third = session.frame(feed.snapshot())
+    assert third["rows"] == {} and third["removed"] == [DB[:12]]
+
+
+def test_session_subset_can_change_mid_stream():
+    feed, session = StatsFeed(), FeedSession()
+    feed.on_batch(sweep(SweepTracker(), 100.0, web=stats(250, 1000), db=stats(100, 1000)))
+    session.subscribe([WEB[:12]])
+
+    assert set(session.frame(feed.snapshot())["rows"]) == {WEB[:12]}
+
+    session.subscribe([DB])
+    frame = session.frame(feed.snapshot())
+
+    assert set(frame["rows"]) == {DB[:12]}
+    assert frame["removed"] == [WEB[:12]]
+
+
+def test_only_lists_of_strings_or_null_are_valid_subscriptions():
+    assert valid_subscription(None)
+    assert valid_subscription(["web", DB])
+    assert not valid_subscription("web")
+    assert not valid_subscription(["web", 3])
+    assert not valid_subscription({"web": True})
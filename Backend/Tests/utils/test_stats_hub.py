@@ -0,0 +1,124 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+from Utils.stats_hub import StatsHub, StatsSubscription, END_OF_STREAM
+
+
+class FakeStream:
+    """Blocking iterator standing in for docker-py's decoded stats stream."""
+
+    def __init__(self):
+        self.samples = []
+        self.closed = False
+        self._cond = threading.Condition()
+
+    def emit(self, sample):
+        with self._cond:
+            self.samples.append(sample)
+            self._cond.notify_all()
+
+    def end(self):
+        self.emit(StopIteration)
+
+    def __iter__(self):
+        while True:
+            with self._cond:
+                while not self.samples:
+                    self._cond.wait()
+                sample = self.samples.pop(0)
+            if sample is StopIteration:
+                return
+            yield sample
+
+    def close(self):
+        self.closed = True
+
+
+def make_hub(grace_seconds=0.0):
+    streams = []
+
+    def open_stream(container_id, stream, decode):
+        streams.append(FakeStream())
+        return streams[-1]
+
+    client = MagicMock()
+    client.api.stats.side_effect = open_stream
+    return StatsHub(client_factory=lambda: client, grace_seconds=grace_seconds), client, streams
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_subscribers_share_one_upstream_stream():
+    hub, client, streams = make_hub()
+
+    async def scenario():
+        subs = [hub.subscribe("abc") for _ in range(20)]
+        await asyncio.to_thread(wait_for, lambda: len(streams) == 1)
+        streams[0].emit({"read": 1})
+        received = await asyncio.gather(*(s.get() for s in subs))
+        counts = hub.stats()
+        for s in subs:
+            hub.unsubscribe(s)
+        streams[0].emit({"read": 2})
+        return received, counts
+
+    received, counts = asyncio.run(scenario())
+
+    assert client.api.stats.call_count == 1
+    assert all(sample == {"read": 1} for sample in received)
+    assert counts["streams"] == 1 and counts["subscribers"] == 20
+    wait_for(lambda: streams[0].closed)
+    assert hub.stats()["streams"] == 0
+
+
+def test_slow_subscriber_drops_oldest_samples():
+    async def scenario():
+        subscription = StatsSubscription("abc", asyncio.get_running_loop(), maxsize=2)
+        for i in range(5):
+            subscription.push({"read": i})
+        return subscription, [await subscription.get(), await subscription.get()]
+
+    subscription, samples = asyncio.run(scenario())
+
+    assert samples == [{"read": 3}, {"read": 4}]
+    assert subscription.dropped == 3
+
+
+def test_grace_period_keeps_stream_for_quick_resubscribe():
+    hub, client, streams = make_hub(grace_seconds=0.2)
+
+    async def scenario():
+        first = hub.subscribe("abc")
+        hub.unsubscribe(first)
+        await asyncio.sleep(0.05)
+        second = hub.subscribe("abc")
+        await asyncio.sleep(0.3)
+        still_open = hub.stats()["streams"]
+        hub.unsubscribe(second)
+        return still_open
+
+    assert asyncio.run(scenario()) == 1
+    assert client.api.stats.call_count == 1
+    time.sleep(0.3)
+    streams[0].emit({"read": 1})
+    wait_for(lambda: streams[0].closed)
+
+
+def test_subscribers_are_told_when_upstream_ends():
+    hub, client, streams = make_hub()
+
+    async def scenario():
+        subscription = hub.subscribe("abc")
+        await asyncio.to_thread(wait_for, lambda: len(streams) == 1)
+        streams[0].end()
+        return await asyncio.wait_for(subscription.get(), 2)
+
+    assert asyncio.run(scenario()) is END_OF_STREAM
+    wait_for(lambda: hub.stats()["streams"] == 0)
@@ -0,0 +1,140 @@
+import time
+from unittest.mock import MagicMock, patch
+
+from docker.errors import InvalidVersion, NotFound
+from fastapi import HTTPException
+
+from Utils.stats_sampler import StatsSampler
+
+
+def cpu(total, system):
+    return {"cpu_usage": {"total_usage": total}, "system_cpu_usage": system, "online_cpus": 2}
+
+
+def make_client(*container_ids):
+    client = MagicMock()
+    client.containers.list.return_value = [MagicMock(id=cid) for cid in container_ids]
+    return client
+
+
+@patch("Utils.containers.state_cache", MagicMock(ready=False))
+def test_first_sample_is_full_and_later_samples_are_one_shot():
+    client = make_client("abc")
+    client.api.stats.side_effect = [
+        {"cpu_stats": cpu(100, 1000), "precpu_stats": cpu(50, 500)},
+        {"cpu_stats": cpu(300, 3000), "precpu_stats": {}},
+    ]
+    sampler = StatsSampler(interval=1)
+    sampler._client = client
+
+    sampler.sample_all()
+    sampler.sample_all()
+
+    first, second = client.api.stats.call_args_list
+    assert first.kwargs == {"stream": False}
+    assert second.kwargs == {"stream": False, "one_shot": True}
+    # precpu is filled from the previous sample so CPU deltas stay meaningful
+    assert sampler.latest("abc").stats["precpu_stats"] == cpu(100, 1000)
+
+
+@patch("Utils.containers.state_cache", MagicMock(ready=False))
+def test_falls_back_when_one_shot_is_unsupported():
+    client = make_client("abc")
+    client.api.stats.side_effect = [{"cpu_stats": cpu(1, 1)}, InvalidVersion("too old"), {"cpu_stats": cpu(2, 2)}]
+    sampler = StatsSampler(interval=1)
+    sampler._client = client
+
+    sampler.sample_all()
+    sampler.sample_all()
+
+    assert client.api.stats.call_args_list[-1].kwargs == {"stream": False}
+    assert sampler.latest("abc").stats["cpu_stats"] == cpu(2, 2)
+
+
+@patch("Utils.containers.state_cache", MagicMock(ready=False))
+def test_stopped_and_missing_containers_are_dropped():
+    client = make_client("abc", "def")
+    client.api.stats.side_effect = lambda cid, **_: (_ for _ in ()).throw(NotFound("gone")) if cid == "def" else {}
+    sampler = StatsSampler(interval=1)
+    sampler._client = client
+
+    sampler.sample_all()
+    assert sampler.latest("abc") is not None
+    assert sampler.latest("def") is None
+
+    sampler.handle_event({"Type": "container", "Action": "die", "Actor": {"ID": "abc"}})
+    assert sampler.latest("abc") is None
+
+
+@patch("Utils.containers.state_cache", MagicMock(ready=False))
+def test_vanished_containers_are_pruned_from_the_sweep_tracker():
+    client = make_client("abc", "def")
+    client.api.stats.return_value = {"cpu_stats": cpu(100, 1000)}
+    sampler = StatsSampler(interval=1)
+    sampler._client = client
+
+    sampler.sample_all()
+    assert set(sampler._sweeps._previous) == {"abc", "def"}
+
+    client.containers.list.return_value = [MagicMock(id="abc")]
+    sampler.sample_all()
+
+    assert sampler.latest("def") is None
+    assert set(sampler._sweeps._previous) == {"abc"}
+
+
+def test_latest_or_fetch_serves_fresh_samples_and_refetches_stale_ones():
+    sampler = StatsSampler(interval=1)
+    listener = MagicMock()
+    sampler.subscribe(listener)
+    container = MagicMock(id="abc")
+    container.stats.return_value = {"memory_stats": {"usage": 1}}
+
+    first = sampler.latest_or_fetch(container)
+    assert sampler.latest_or_fetch(container) is first
+    container.stats.assert_called_once_with(stream=False)
+    listener.assert_called_once_with("abc", first)
+
+    sampler._samples["abc"] = first._replace(sampled_at=time.time() - 60)
+    sampler.latest_or_fetch(container)
+    assert container.stats.call_count == 2
+
+
+@patch("Utils.containers.state_cache", MagicMock(ready=False))
+def test_batch_listeners_get_one_call_per_sweep():
+    client = make_client("abc", "gone")
+
+    def stats(container_id, **_):
+        if container_id == "gone":
+            raise NotFound("gone")
+        return {"cpu_stats": cpu(100, 1000), "precpu_stats": cpu(50, 500)}
+
+    client.api.stats.side_effect = stats
+    sampler = StatsSampler(interval=1)
+    sampler._client = client
+    sweeps = []
+    sampler.subscribe_batch(sweeps.append)
+
+    sampler.sample_all()
+
+    assert len(sweeps) == 1
+    assert sweeps[0].ids == ["abc"]
+
+
+def test_start_does_not_need_a_reachable_daemon():
+    calls = []
+
+    def unreachable():
+        calls.append(1)
+        raise HTTPException(status_code=503, detail="Docker is not running or unreachable")
+
+    sampler = StatsSampler(interval=0.01, client_factory=unreachable)
+    sampler.start()
+    try:
+        deadline = time.monotonic() + 2
+        while len(calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sampler.running
+        assert len(calls) >= 2
+    finally:
+        sampler.stop()
@@ -0,0 +1,96 @@
+import asyncio
+import time
+
+from Utils.stream_pacer import StreamPacer, MAX_INTERVAL, MIN_INTERVAL, RECOVER_AFTER, receive_controls
+
+
+def test_control_messages_clamp_interval_and_pause():
+    async def scenario():
+        pacer = StreamPacer(1.0)
+        assert pacer.take_status() is None
+
+        assert pacer.apply({"interval": 0.01})
+        assert pacer.interval == MIN_INTERVAL
+        assert pacer.apply({"action": "pause"})
+        assert pacer.take_status() == {"type": "pacing", "interval": MIN_INTERVAL, "requested": MIN_INTERVAL,
+                                       "paused": True}
+        assert pacer.take_status() is None
+
+        assert not pacer.apply({"subscribe": ["web"]})
+        assert not pacer.apply({"interval": "soon"})
+        assert pacer.apply({"action": "resume"}) and not pacer.paused
+
+    asyncio.run(scenario())
+
+
+def test_slow_sends_back_off_and_fast_sends_recover():
+    async def scenario():
+        pacer = StreamPacer(1.0)
+
+        assert pacer.record_send(0.8)
+        assert pacer.interval == 2.0 and pacer.backoffs == 1
+        assert pacer.take_status()["interval"] == 2.0
+
+        for _ in range(RECOVER_AFTER - 1):
+            assert not pacer.record_send(0.01)
+        assert pacer.record_send(0.01)
+        assert pacer.interval == 1.0
+
+        # never faster than requested, never slower than the cap
+        assert not pacer.record_send(0.01)
+        pacer.interval = MAX_INTERVAL
+        assert not pacer.record_send(MAX_INTERVAL)
+
+    asyncio.run(scenario())
+
+
+def test_wait_wakes_on_control_message_or_stop():
+    async def scenario():
+        pacer = StreamPacer(1.0)
+        stop = asyncio.get_running_loop().create_future()
+
+        asyncio.get_running_loop().call_later(0.05, pacer.apply, {"action": "pause"})
+        started = time.monotonic()
+        await pacer.wait(None, stop)
+        assert time.monotonic() - started < 1
+
+        asyncio.get_running_loop().call_later(0.05, stop.set_result, None)
+        await pacer.wait(None, stop)
+        assert stop.done()
+
+    asyncio.run(scenario())
+
+
+def test_wake_cuts_a_wait_short():
+    async def scenario():
+        pacer = StreamPacer(MAX_INTERVAL)
+        stop = asyncio.get_running_loop().create_future()
+
+        asyncio.get_running_loop().call_later(0.05, pacer.wake)
+        started = time.monotonic()
+        await pacer.wait(pacer.interval, stop)
+        assert time.monotonic() - started < 1
+
+    asyncio.run(scenario())
+
+
+class FakeSocket:
+    def __init__(self, *messages):
+        self.messages = list(messages)
+
+    async def receive(self):
+        return self.messages.pop(0)
+
+
+def test_receive_controls_skips_binary_frames_and_bad_json():
+    socket = FakeSocket(
+        {"type": "websocket.receive", "bytes": b"\x00\x01"},
+        {"type": "websocket.receive", "text": "not json"},
+        {"type": "websocket.receive", "text": '{"action": "pause"}'},
+        {"type": "websocket.disconnect", "code": 1000},
+    )
+    handled = []
+
+    asyncio.run(receive_controls(socket, handled.append))
+
+    assert handled == [{"action": "pause"}]
@@ -0,0 +1,175 @@
+import time
+
+from Utils.warning_engine import WarningEngine, cpu_limit_cores, cpu_percent_of_limit, RESTART_THRESHOLD
+
+
+def sample(cpu_share=0.0, memory=0, limit=1000):
+    return {
+        "cpu_stats": {"cpu_usage": {"total_usage": int(cpu_share * 1000)}, "system_cpu_usage": 2000},
+        "precpu_stats": {"cpu_usage": {"total_usage": 0}, "system_cpu_usage": 1000},
+        "memory_stats": {"usage": memory, "limit": limit},
+    }
+
+
+def container_event(action, container_id="abc123", at=None, name="web"):
+    return {
+        "Type": "container",
+        "Action": action,
+        "time": at or time.time(),
+        "Actor": {"ID": container_id, "Attributes": {"name": name}},
+    }
+
+
+def no_limit(container_id):
+    return None
+
+
+def one_core_busy(**cpu_stats):
+    # one full core of a 16-CPU host
+    return {
+        "cpu_stats": {"cpu_usage": {"total_usage": 2000, **cpu_stats.pop("usage", {})},
+                      "system_cpu_usage": 32000, **cpu_stats},
+        "precpu_stats": {"cpu_usage": {"total_usage": 1000}, "system_cpu_usage": 16000},
+    }
+
+
+def test_cpu_percent_is_share_of_what_the_container_may_use():
+    cgroup_v2 = one_core_busy(online_cpus=16)
+    cgroup_v1 = one_core_busy(online_cpus=16, usage={"percpu_usage": [0] * 16})
+
+    for stats in (cgroup_v2, cgroup_v1):
+        assert cpu_percent_of_limit(stats) == 6.25
+        assert cpu_percent_of_limit(stats, 1.0) == 100.0
+        assert cpu_percent_of_limit(stats, 2.0) == 50.0
+    assert cpu_percent_of_limit(sample(cpu_share=0.5)) == 50.0
+    assert cpu_percent_of_limit({}) == 0.0
+
+
+def test_cpu_limit_comes_from_nano_cpus_or_quota():
+    assert cpu_limit_cores({"NanoCpus": 1_500_000_000}) == 1.5
+    assert cpu_limit_cores({"CpuQuota": 50_000, "CpuPeriod": 100_000}) == 0.5
+    assert cpu_limit_cores({"NanoCpus": 0, "CpuQuota": 0}) is None
+
+
+def test_cpu_limited_container_fires_and_limit_is_looked_up_once():
+    lookups = []
+
+    def limit(container_id):
+        lookups.append(container_id)
+        return 1.0
+
+    engine = WarningEngine(cpu_limit=limit)
+    now = time.time()
+    stats = one_core_busy(online_cpus=16)
+    engine.evaluate("abc123", stats, now=now)
+    engine.evaluate("abc123", stats, now=now + 61)
+
+    assert [w.rule for w in engine.active()] == ["high_cpu"]
+    assert lookups == ["abc123"]
+
+    engine.handle_event(container_event("update", at=now + 62))
+    engine.evaluate("abc123", stats, now=now + 63)
+    assert lookups == ["abc123", "abc123"]
+
+
+def test_cpu_warning_needs_sustained_breach_and_clears_with_hysteresis():
+    engine = WarningEngine(cpu_limit=no_limit)
+    now = time.time()
+
+    engine.evaluate("abc123", sample(cpu_share=0.95), now)
+    engine.evaluate("abc123", sample(cpu_share=0.95), now + 30)
+    assert engine.active() == []
+
+    engine.evaluate("abc123", sample(cpu_share=0.95), now + 60)
+    [warning] = engine.active()
+    assert (warning.rule, warning.severity, warning.since) == ("high_cpu", "warning", now)
+
+    # between clear_below and threshold: stays active
+    engine.evaluate("abc123", sample(cpu_share=0.85), now + 65)
+    assert len(engine.active()) == 1
+
+    engine.evaluate("abc123", sample(cpu_share=0.5), now + 70)
+    assert engine.active() == []
+    [resolved] = engine.recent()
+    assert resolved.rule == "high_cpu" and resolved.resolved_at == now + 70
+
+
+def test_dip_below_clear_level_resets_breach_timer():
+    engine = WarningEngine(cpu_limit=no_limit)
+    now = time.time()
+
+    engine.evaluate("abc123", sample(cpu_share=0.95), now)
+    engine.evaluate("abc123", sample(cpu_share=0.1), now + 40)
+    engine.evaluate("abc123", sample(cpu_share=0.95), now + 50)
+    engine.evaluate("abc123", sample(cpu_share=0.95), now + 70)
+
+    assert engine.active() == []
+
+
+def test_memory_warning_fires_immediately_and_is_listed_before_cpu():
+    engine = WarningEngine(cpu_limit=no_limit)
+    now = time.time()
+    for offset in (0, 60):
+        engine.evaluate("cpu1", sample(cpu_share=0.99), now + offset)
+    engine.evaluate("mem1", sample(memory=990, limit=1000), now + 60)
+
+    assert [(w.container_id, w.rule) for w in engine.active()] == [
+        ("mem1", "memory_near_limit"), ("cpu1", "high_cpu"),
+    ]
+
+
+def test_oom_and_restart_loop_come_from_events():
+    engine = WarningEngine(cpu_limit=no_limit)
+    now = time.time()
+
+    engine.handle_event(container_event("oom", at=now))
+    for i in range(RESTART_THRESHOLD):
+        engine.handle_event(container_event("die", at=now + i))
+        engine.handle_event(container_event("start", at=now + i))
+
+    warnings = {w.rule: w for w in engine.active()}
+    assert warnings["oom_killed"].severity == "critical"
+    assert warnings["oom_killed"].container_name == "web"
+    assert warnings["restart_loop"].value == RESTART_THRESHOLD
+
+    engine.handle_event(container_event("destroy", at=now + 5))
+    assert engine.active() == []
+    assert {w.rule for w in engine.recent()} == {"oom_killed", "restart_loop"}
+
+
+def test_manual_stops_are_not_a_restart_loop():
+    engine = WarningEngine(cpu_limit=no_limit)
+    now = time.time()
+
+    for i in range(RESTART_THRESHOLD):
+        engine.handle_event(container_event("die", at=now + i))
+        engine.handle_event(container_event("stop", at=now + i))
+
+    assert engine.active() == []
+
+
+def test_stopping_a_container_resolves_its_threshold_warnings():
+    engine = WarningEngine(cpu_limit=no_limit)
+    now = time.time()
+    engine.evaluate("abc123", sample(memory=990), now=now)
+    assert [w.rule for w in engine.active()] == ["memory_near_limit"]
+
+    engine.handle_event(container_event("die", at=now + 1))
+
+    assert engine.active() == []
+    assert engine.recent()[0].resolved_at == now + 1
+
+
+def test_evaluating_a_thousand_containers_is_cheap():
+    engine = WarningEngine(cpu_limit=no_limit)
+    stats = sample(cpu_share=0.95, memory=500)
+    now = time.time()
+    for i in range(1000):
+        engine.evaluate(f"c{i}", stats, now)
+
+    started = time.perf_counter()
+    for i in range(1000):
+        engine.evaluate(f"c{i}", stats, now + 5)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.05
@@ -0,0 +1,355 @@
+"""
+Minimal asyncio-native Docker Engine API client.
+
+Speaks HTTP/1.1 directly over the daemon's unix socket with a bounded pool of
+keep-alive connections, so async route handlers can wait on the daemon
+without holding one of Starlette's threadpool workers. Errors are raised as
+the same `docker.errors` types the sync handlers already catch.
+
+When `DOCKER_HOST` points somewhere other than a unix socket (tcp://,
+ssh://), the same calls go through the shared docker-py client in worker
+threads instead, so both clients always talk to the same daemon.
+"""
+import asyncio
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import quote, urlencode
+
+from docker.errors import APIError, DockerException, NotFound
+from fastapi import HTTPException
+
+from Utils.container_index import container_index
+from Utils.getDocker import get_docker_client
+from Utils.logger import logger
+
+DEFAULT_SOCKET_PATH = "/var/run/docker.sock"
+ASYNC_DOCKER_POOL_SIZE = int(os.getenv("ASYNC_DOCKER_POOL_SIZE", os.getenv("DOCKER_POOL_SIZE", "32")))
+
+
+def _socket_path_from_env() -> str:
+    host = os.getenv("DOCKER_HOST", "")
+    if host.startswith("unix://"):
+        return host[len("unix://"):]
+    return DEFAULT_SOCKET_PATH
+
+
+class _Connection:
+    __slots__ = ("reader", "writer")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self) -> None:
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+
+class _Response:
+    def __init__(self, status: int, headers: Dict[str, str], connection: _Connection):
+        self.status = status
+        self.headers = headers
+        self._connection = connection
+        self._chunked = headers.get("transfer-encoding", "").lower() == "chunked"
+        length = headers.get("content-length")
+        self._remaining = int(length) if length is not None else None
+        if status in (204, 304):
+            self._remaining = 0
+        self.done = False
+
+    @property
+    def keep_alive(self) -> bool:
+        if self.headers.get("connection", "").lower() == "close":
+            return False
+        return self._chunked or self._remaining is not None
+
+    async def read_chunk(self) -> bytes:
+        """Return the next piece of the body, or b"" once it is complete."""
+        if self.done:
+            return b""
+        reader = self._connection.reader
+
+        if self._chunked:
+            size_line = await reader.readline()
+            size = int(size_line.split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                await reader.readline()  # trailing CRLF after the last chunk
+                self.done = True
+                return b""
+            data = await reader.readexactly(size)
+            await reader.readexactly(2)
+            return data
+
+        if self._remaining is not None:
+            if self._remaining == 0:
+                self.done = True
+                return b""
+            data = await reader.read(min(self._remaining, 65536))
+            if not data:
+                raise DockerException("Docker daemon closed the connection mid-response")
+            self._remaining -= len(data)
+            return data
+
+        data = await reader.read(65536)
+        if not data:
+            self.done = True
+        return data
+
+    async def read(self) -> bytes:
+        parts = []
+        while True:
+            chunk = await self.read_chunk()
+            if not chunk:
+                return b"".join(parts)
+            parts.append(chunk)
+
+
+class AsyncDockerClient:
+    def __init__(self, socket_path: Optional[str] = None, pool_size: int = ASYNC_DOCKER_POOL_SIZE,
+                 api_version: Optional[str] = None, timeout: float = 60.0):
+        self.socket_path = socket_path or _socket_path_from_env()
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._api_version = api_version
+        self._idle: List[_Connection] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._version_lock: Optional[asyncio.Lock] = None
+        self.connections_opened = 0
+
+    # --- connection pool -------------------------------------------------------
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.pool_size)
+        return self._slots
+
+    async def _acquire(self) -> _Connection:
+        while self._idle:
+            connection = self._idle.pop()
+            if not connection.writer.is_closing() and not connection.reader.at_eof():
+                return connection
+            connection.close()
+        try:
+            reader, writer = await asyncio.open_unix_connection(self.socket_path)
+        except OSError as e:
+            raise DockerException(f"Cannot connect to Docker daemon at {self.socket_path}: {e}")
+        self.connections_opened += 1
+        return _Connection(reader, writer)
+
+    def _release(self, connection: _Connection, reusable: bool) -> None:
+        if reusable and len(self._idle) < self.pool_size:
+            self._idle.append(connection)
+        else:
+            connection.close()
+
+    async def close(self) -> None:
+        while self._idle:
+            self._idle.pop().close()
+
+    # --- HTTP ------------------------------------------------------------------
+
+    async def _api_prefix(self) -> str:
+        if self._api_version is None:
+            if self._version_lock is None:
+                self._version_lock = asyncio.Lock()
+            async with self._version_lock:
+                if self._api_version is None:
+                    version = await self._request_json("GET", "/version", versioned=False)
+                    self._api_version = version.get("ApiVersion", "")
+        return f"/v{self._api_version}" if self._api_version else ""
+
+    async def _send(self, connection: _Connection, method: str, path: str,
+                    body: Optional[bytes]) -> _Response:
+        head = [f"{method} {path} HTTP/1.1", "Host: docker", "User-Agent: docker-manager-async"]
+        if body is not None:
+            head += ["Content-Type: application/json", f"Content-Length: {len(body)}"]
+        elif method in ("POST", "PUT"):
+            head.append("Content-Length: 0")
+        connection.writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + (body or b""))
+        await connection.writer.drain()
+
+        status_line = await connection.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Docker daemon closed the connection")
+        status = int(status_line.split(b" ", 2)[1])
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await connection.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+        return _Response(status, headers, connection)
+
+    def _build_path(self, prefix: str, path: str, params: Optional[Dict[str, Any]]) -> str:
+        if not params:
+            return prefix + path
+        encoded = {}
+        for key, value in params.items():
+            if value is None:
+                continue
+            if isinstance(value, bool):
+                value = "1" if value else "0"
+            elif isinstance(value, (dict, list)):
+                value = json.dumps(value)
+            encoded[key] = value
+        return f"{prefix}{path}?{urlencode(encoded)}" if encoded else prefix + path
+
+    async def _open(self, method: str, path: str, params: Optional[Dict[str, Any]] = None,
+                    body: Any = None, versioned: bool = True) -> Tuple[_Response, _Connection]:
+        prefix = await self._api_prefix() if versioned else ""
+        full_path = self._build_path(prefix, path, params)
+        payload = json.dumps(body).encode() if body is not None else None
+
+        await self._semaphore().acquire()
+        try:
+            # A pooled connection may have been closed by the daemon; retry once on a fresh one
+            for attempt in range(2):
+                connection = await self._acquire()
+                try:
+                    response = await asyncio.wait_for(self._send(connection, method, full_path, payload), self.timeout)
+                    return response, connection
+                except (ConnectionResetError, BrokenPipeError, asyncio.IncompleteReadError) as e:
+                    connection.close()
+                    if attempt:
+                        raise DockerException(f"Docker daemon connection failed: {e}")
+                except BaseException:
+                    connection.close()
+                    raise
+        except BaseException:
+            self._semaphore().release()
+            raise
+
+    def _finish(self, response: _Response, connection: _Connection) -> None:
+        self._release(connection, response.done and response.keep_alive)
+        self._semaphore().release()
+
+    async def request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None,
+                      body: Any = None, versioned: bool = True) -> Tuple[int, bytes]:
+        response, connection = await self._open(method, path, params, body, versioned)
+        try:
+            data = await asyncio.wait_for(response.read(), self.timeout)
+        except BaseException:
+            response.done = False
+            self._finish(response, connection)
+            raise
+        self._finish(response, connection)
+        _raise_for_status(response.status, data)
+        return response.status, data
+
+    async def _request_json(self, method: str, path: str, params: Optional[Dict[str, Any]] = None,
+                            body: Any = None, versioned: bool = True) -> Any:
+        _, data = await self.request(method, path, params, body, versioned)
+        return json.loads(data) if data else None
+
+    # --- Engine API ------------------------------------------------------------
+
+    async def ping(self) -> bool:
+        _, data = await self.request("GET", "/_ping", versioned=False)
+        return data == b"OK"
+
+    async def version(self) -> dict:
+        return await self._request_json("GET", "/version")
+
+    async def containers(self, all: bool = False, filters: Optional[Dict[str, Any]] = None) -> List[dict]:
+        if filters:
+            filters = {key: value if isinstance(value, list) else [value] for key, value in filters.items()}
+        return await self._request_json("GET", "/containers/json", {"all": all, "filters": filters})
+
+    async def inspect_container(self, container_id: str) -> dict:
+        return await self._request_json("GET", f"/containers/{quote(container_id, safe='')}/json")
+
+    async def start_container(self, container_id: str) -> None:
+        await self.request("POST", f"/containers/{quote(container_id, safe='')}/start")
+
+    async def stop_container(self, container_id: str, timeout: Optional[int] = None) -> None:
+        await self.request("POST", f"/containers/{quote(container_id, safe='')}/stop", {"t": timeout})
+
+    async def restart_container(self, container_id: str, timeout: Optional[int] = None) -> None:
+        await self.request("POST", f"/containers/{quote(container_id, safe='')}/restart", {"t": timeout})
+
+
+def _raise_for_status(status: int, data: bytes) -> None:
+    if status < 400:
+        return
+    try:
+        message = json.loads(data).get("message", "")
+    except (ValueError, AttributeError):
+        message = data.decode("utf-8", errors="replace")
+    if status == 404:
+        raise NotFound(message)
+    raise APIError(f"{status} Server Error: {message}", explanation=message)
+
+
+class ThreadedDockerClient:
+    """The `AsyncDockerClient` calls, run on the shared docker-py client in worker threads."""
+
+    def __init__(self, host: str):
+        self.host = host
+
+    async def close(self) -> None:
+        # the docker-py client is shared and closed with the sync client
+        pass
+
+    async def ping(self) -> bool:
+        return await asyncio.to_thread(lambda: get_docker_client().api.ping())
+
+    async def version(self) -> dict:
+        return await asyncio.to_thread(lambda: get_docker_client().api.version())
+
+    async def containers(self, all: bool = False, filters: Optional[Dict[str, Any]] = None) -> List[dict]:
+        return await asyncio.to_thread(lambda: get_docker_client().api.containers(all=all, filters=filters))
+
+    async def inspect_container(self, container_id: str) -> dict:
+        return await asyncio.to_thread(lambda: get_docker_client().api.inspect_container(container_id))
+
+    async def start_container(self, container_id: str) -> None:
+        await asyncio.to_thread(lambda: get_docker_client().api.start(container_id))
+
+    async def stop_container(self, container_id: str, timeout: Optional[int] = None) -> None:
+        await asyncio.to_thread(lambda: get_docker_client().api.stop(container_id, timeout=timeout))
+
+    async def restart_container(self, container_id: str, timeout: Optional[int] = None) -> None:
+        kwargs = {} if timeout is None else {"timeout": timeout}
+        await asyncio.to_thread(lambda: get_docker_client().api.restart(container_id, **kwargs))
+
+
+_async_client: Optional[Union[AsyncDockerClient, ThreadedDockerClient]] = None
+
+
+def get_async_docker_client() -> Union[AsyncDockerClient, ThreadedDockerClient]:
+    global _async_client
+    if _async_client is None:
+        host = os.getenv("DOCKER_HOST", "")
+        if host and not host.startswith("unix://"):
+            _async_client = ThreadedDockerClient(host)
+            logger.warning(f"DOCKER_HOST={host} is not a unix socket; async Docker calls use the docker-py client "
+                           f"in worker threads")
+        else:
+            _async_client = AsyncDockerClient()
+            logger.info(f"Async Docker client using {_async_client.socket_path} (pool size {_async_client.pool_size})")
+    return _async_client
+
+
+async def get_container_async(container_id: str) -> dict:
+    """Async counterpart of `getDocker.get_container`, returning the inspect payload."""
+    container_id = container_id.strip()
+    full_id = container_index.resolve(container_id)
+    try:
+        return await get_async_docker_client().inspect_container(full_id or container_id)
+    except NotFound:
+        if full_id:
+            container_index.remove(full_id)
+        logger.warning(f"Container not found: {container_id}")
+        raise HTTPException(status_code=404, detail=f"Container '{container_id}' not found")
+
+
+async def close_async_docker_client() -> None:
+    global _async_client
+    if _async_client is not None:
+        await _async_client.close()
+        _async_client = None
@@ -0,0 +1,181 @@
+"""
+Container stats read straight from cgroup v2 files.
+
+Every `/containers/{id}/stats` call costs the daemon a goroutine and a JSON
+encode per tick. When the API runs on the Docker host with `/sys/fs/cgroup`
+and `/proc` visible (bind-mount them when running in a container), the same
+numbers can be read from the kernel directly:
+
+    cpu.stat        usage_usec           -> cpu_stats.cpu_usage.total_usage
+    /proc/stat      cpu line             -> cpu_stats.system_cpu_usage
+    memory.current                       -> memory_stats.usage
+    memory.max      ("max" = host RAM)   -> memory_stats.limit
+    io.stat         rbytes / wbytes      -> blkio_stats.io_service_bytes_recursive
+    /proc/<pid>/net/dev                  -> networks
+
+`read` returns a dict in the Engine API stats shape, with `precpu_stats`
+filled from the caller's previous read, so everything downstream
+(`build_stats_frame`, the sampler listeners) works unchanged. The reader
+keeps no readings itself: the sampler and each hub stream have their own
+cadence, and sharing one previous reading would give each of them a
+delta over an arbitrary interval. Select it with `STATS_BACKEND=cgroup`.
+"""
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+STATS_BACKEND = os.getenv("STATS_BACKEND", "docker")
+CGROUP_ROOT = os.getenv("CGROUP_ROOT", "/sys/fs/cgroup")
+PROC_ROOT = os.getenv("PROC_ROOT", "/proc")
+
+NANOS_PER_TICK = 1_000_000_000 // (os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100)
+
+# Where the systemd and cgroupfs cgroup drivers put a container's cgroup
+SCOPE_PATTERNS = ("system.slice/docker-{id}.scope", "docker/{id}")
+
+
+class CgroupStatsReader:
+    def __init__(self, cgroup_root: str = CGROUP_ROOT, proc_root: str = PROC_ROOT):
+        self.cgroup_root = cgroup_root
+        self.proc_root = proc_root
+        self._paths: Dict[str, str] = {}
+
+    def available(self) -> bool:
+        """True on a cgroup v2 (unified) host."""
+        return os.path.isfile(os.path.join(self.cgroup_root, "cgroup.controllers"))
+
+    def cgroup_path(self, container_id: str) -> str:
+        path = self._paths.get(container_id)
+        if path is not None and os.path.isdir(path):
+            return path
+        for pattern in SCOPE_PATTERNS:
+            candidate = os.path.join(self.cgroup_root, pattern.format(id=container_id))
+            if os.path.isdir(candidate):
+                self._paths[container_id] = candidate
+                return candidate
+        self.forget(container_id)
+        raise FileNotFoundError(f"No cgroup for container {container_id}")
+
+    def read(self, container_id: str, previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        One stats sample in the Engine API shape, `precpu_stats` taken from
+        `previous` (the caller's last sample of this container); raises
+        FileNotFoundError once the container is gone.
+        """
+        path = self.cgroup_path(container_id)
+        system_usage, online_cpus = self._read_system_cpu()
+        cpu_stats = {
+            "cpu_usage": {"total_usage": _read_keyed(path, "cpu.stat").get("usage_usec", 0) * 1000},
+            "system_cpu_usage": system_usage,
+            "online_cpus": online_cpus,
+        }
+        limit = _read_text(path, "memory.max")
+        stats = {
+            "read": datetime.now(timezone.utc).isoformat(),
+            "cpu_stats": cpu_stats,
+            "memory_stats": {
+                "usage": int(_read_text(path, "memory.current")),
+                "limit": self._host_memory() if limit == "max" else int(limit),
+            },
+            "blkio_stats": {"io_service_bytes_recursive": _read_io(path)},
+            "networks": self._read_networks(path),
+        }
+        stats["precpu_stats"] = previous.get("cpu_stats") or {} if previous else {}
+        stats["preread"] = previous.get("read") if previous else None
+        return stats
+
+    def stream(self, container_id: str, interval: float = 1.0) -> Iterator[Dict[str, Any]]:
+        """`api.stats(stream=True)` equivalent: one sample per `interval` until the cgroup goes away."""
+        previous = None
+        while True:
+            started = time.monotonic()
+            try:
+                previous = self.read(container_id, previous)
+            except FileNotFoundError:
+                return
+            yield previous
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+    def forget(self, container_id: str) -> None:
+        self._paths.pop(container_id, None)
+
+    # --- host-wide files -------------------------------------------------------
+
+    def _read_system_cpu(self):
+        # same source and units as the daemon: jiffies on the aggregate cpu line, in nanoseconds
+        total, cpus = 0, 0
+        with open(os.path.join(self.proc_root, "stat")) as f:
+            for line in f:
+                if line.startswith("cpu "):
+                    total = sum(int(v) for v in line.split()[1:8]) * NANOS_PER_TICK
+                elif line.startswith("cpu"):
+                    cpus += 1
+                elif cpus:
+                    break
+        return total, cpus
+
+    def _host_memory(self) -> int:
+        with open(os.path.join(self.proc_root, "meminfo")) as f:
+            for line in f:
+                if line.startswith("MemTotal:"):
+                    return int(line.split()[1]) * 1024
+        return 0
+
+    def _read_networks(self, path: str) -> Dict[str, Dict[str, int]]:
+        pids = _read_text(path, "cgroup.procs").split()
+        if not pids:
+            return {}
+        try:
+            with open(os.path.join(self.proc_root, pids[0], "net", "dev")) as f:
+                lines = f.readlines()[2:]
+        except FileNotFoundError:
+            return {}
+        networks = {}
+        for line in lines:
+            name, _, data = line.partition(":")
+            name = name.strip()
+            if name == "lo":
+                continue
+            v = [int(x) for x in data.split()]
+            networks[name] = {
+                "rx_bytes": v[0], "rx_packets": v[1], "rx_errors": v[2], "rx_dropped": v[3],
+                "tx_bytes": v[8], "tx_packets": v[9], "tx_errors": v[10], "tx_dropped": v[11],
+            }
+        return networks
+
+
+def _read_text(path: str, name: str) -> str:
+    with open(os.path.join(path, name)) as f:
+        return f.read().strip()
+
+
+def _read_keyed(path: str, name: str) -> Dict[str, int]:
+    values = {}
+    for line in _read_text(path, name).splitlines():
+        key, _, value = line.partition(" ")
+        if value.isdigit():
+            values[key] = int(value)
+    return values
+
+
+def _read_io(path: str) -> List[Dict[str, Any]]:
+    try:
+        text = _read_text(path, "io.stat")
+    except FileNotFoundError:
+        return []
+    entries = []
+    for line in text.splitlines():
+        device, *fields = line.split()
+        major, _, minor = device.partition(":")
+        values = dict(field.split("=", 1) for field in fields if "=" in field)
+        for op, key in (("Read", "rbytes"), ("Write", "wbytes")):
+            entries.append({"major": int(major), "minor": int(minor), "op": op, "value": int(values.get(key, 0))})
+    return entries
+
+
+cgroup_stats = CgroupStatsReader()
+
+
+def use_cgroup_stats() -> bool:
+    return STATS_BACKEND == "cgroup" and cgroup_stats.available()
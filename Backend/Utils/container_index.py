@@ -0,0 +1,136 @@
+import threading
+from bisect import bisect_left, insort
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException
+
+from Utils.logger import logger
+
+
+class ContainerIndex:
+    """
+    In-memory name -> id map plus a sorted ID list for prefix lookups.
+
+    Seeded from one summary listing and kept current from the Docker event
+    stream, so resolving a name or ID prefix never lists containers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids: List[str] = []
+        self._names: Dict[str, str] = {}
+        self._id_names: Dict[str, str] = {}
+        self._ready = False
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def seed(self, client: Any) -> None:
+        summaries = client.api.containers(all=True)
+        ids: List[str] = []
+        names: Dict[str, str] = {}
+        id_names: Dict[str, str] = {}
+
+        for summary in summaries:
+            container_id = summary["Id"]
+            name = (summary.get("Names") or [""])[0].lstrip("/")
+            ids.append(container_id)
+            id_names[container_id] = name
+            if name:
+                names[name] = container_id
+
+        ids.sort()
+        with self._lock:
+            self._ids = ids
+            self._names = names
+            self._id_names = id_names
+            self._ready = True
+        logger.info(f"Container index seeded with {len(ids)} containers")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._ids = []
+            self._names = {}
+            self._id_names = {}
+            self._ready = False
+
+    def add(self, container_id: str, name: Optional[str]) -> None:
+        with self._lock:
+            if container_id not in self._id_names:
+                insort(self._ids, container_id)
+            self._set_name(container_id, name or "")
+
+    def remove(self, container_id: str) -> None:
+        with self._lock:
+            name = self._id_names.pop(container_id, None)
+            if name is None:
+                return
+            i = bisect_left(self._ids, container_id)
+            if i < len(self._ids) and self._ids[i] == container_id:
+                del self._ids[i]
+            if self._names.get(name) == container_id:
+                del self._names[name]
+
+    def _set_name(self, container_id: str, name: str) -> None:
+        old_name = self._id_names.get(container_id)
+        if old_name and self._names.get(old_name) == container_id:
+            del self._names[old_name]
+        self._id_names[container_id] = name
+        if name:
+            self._names[name] = container_id
+
+    def resolve(self, reference: str) -> Optional[str]:
+        """
+        Return the full container ID for a name, full ID or unique ID prefix,
+        or None when the index has no match (or is not seeded yet).
+        Raises 409 when an ID prefix matches more than one container.
+        """
+        if not self._ready or not reference:
+            return None
+
+        with self._lock:
+            by_name = self._names.get(reference.lstrip("/"))
+            if by_name:
+                return by_name
+
+            prefix = reference.lower()
+            i = bisect_left(self._ids, prefix)
+            if i >= len(self._ids) or not self._ids[i].startswith(prefix):
+                return None
+            if i + 1 < len(self._ids) and self._ids[i + 1].startswith(prefix):
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Container reference '{reference}' is ambiguous, use a longer ID prefix"
+                )
+            return self._ids[i]
+
+    def name_of(self, container_id: str) -> Optional[str]:
+        return self._id_names.get(container_id) or None
+
+    def handle_event(self, event: dict) -> None:
+        if event.get("Type") != "container":
+            return
+
+        action = event.get("Action", "")
+        actor = event.get("Actor") or {}
+        container_id = actor.get("ID") or event.get("id")
+        attributes = actor.get("Attributes") or {}
+        if not container_id:
+            return
+
+        if action == "create":
+            self.add(container_id, attributes.get("name"))
+        elif action == "destroy":
+            self.remove(container_id)
+        elif action == "rename":
+            with self._lock:
+                if container_id not in self._id_names:
+                    insort(self._ids, container_id)
+                self._set_name(container_id, attributes.get("name", "").lstrip("/"))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+container_index = ContainerIndex()
@@ -0,0 +1,130 @@
+"""
+Shared container listing built on the `/containers/json` summary payload.
+
+`client.containers.list()` inspects every container unless `sparse=True`;
+the summary already carries ports, mounts, networks, labels, image ID and
+state, so list endpoints only need one daemon call. The accessors below
+read a field from either the summary or the full inspect shape, which lets
+the same code serve sparse listings and single-container details.
+Listings are served from the state cache once it is seeded; filters the
+cache can evaluate are applied in memory, anything else is pushed down to
+the daemon's `filters=` query.
+"""
+import datetime
+import re
+from typing import Any, Dict, List, Optional
+
+from Utils.state_cache import state_cache
+
+
+CACHED_FILTERS = {"status", "name", "label", "network"}
+
+
+def list_containers(client: Any, all: bool = True, filters: Optional[Dict[str, Any]] = None) -> List[Any]:
+    if state_cache.ready and (not filters or set(filters) <= CACHED_FILTERS):
+        return [
+            client.containers.prepare_model(summary)
+            for summary in state_cache.snapshot().containers
+            if (all or summary.get("State") == "running") and _matches(summary, filters or {})
+        ]
+    return client.containers.list(all=all, filters=filters, sparse=True)
+
+
+def _values(value: Any) -> List[Any]:
+    return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+
+def _matches(summary: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    """Evaluate daemon-style filters against a `/containers/json` summary (values OR, keys AND)."""
+    if "status" in filters and summary.get("State") not in _values(filters["status"]):
+        return False
+    if "name" in filters:
+        names = [name.lstrip("/") for name in summary.get("Names") or []]
+        if not any(re.search(pattern, name) for pattern in _values(filters["name"]) for name in names):
+            return False
+    if "label" in filters:
+        labels = summary.get("Labels") or {}
+        for label in _values(filters["label"]):
+            key, sep, value = label.partition("=")
+            if key not in labels or (sep and labels[key] != value):
+                return False
+    if "network" in filters:
+        networks = (summary.get("NetworkSettings") or {}).get("Networks") or {}
+        known = set(networks) | {net.get("NetworkID") for net in networks.values()}
+        if not known & set(_values(filters["network"])):
+            return False
+    return True
+
+
+def inspect_container(container: Any) -> Any:
+    """Load the full inspect payload for a sparse container (one extra call)."""
+    if is_sparse(container):
+        container.reload()
+    return container
+
+
+def is_sparse(container: Any) -> bool:
+    return "Names" in container.attrs
+
+
+def container_name(container: Any) -> str:
+    if is_sparse(container):
+        return (container.attrs.get("Names") or [""])[0].lstrip("/")
+    return container.name
+
+
+def container_image_id(container: Any) -> Optional[str]:
+    if is_sparse(container):
+        return container.attrs.get("ImageID")
+    return container.attrs.get("Image")
+
+
+def container_labels(container: Any) -> Dict[str, str]:
+    if is_sparse(container):
+        return container.attrs.get("Labels") or {}
+    return container.attrs.get("Config", {}).get("Labels") or {}
+
+
+def container_command(container: Any) -> str:
+    # the list payload's "Command" is the entrypoint followed by the cmd, so the inspect
+    # payload is joined the same way to keep /containers and /containers/{id} in agreement
+    if is_sparse(container):
+        return container.attrs.get("Command") or ""
+    config = container.attrs.get("Config", {})
+    entrypoint = config.get("Entrypoint") or []
+    if isinstance(entrypoint, str):
+        entrypoint = [entrypoint]
+    return " ".join([*entrypoint, *(config.get("Cmd") or [])])
+
+
+def container_created(container: Any) -> datetime.datetime:
+    created = container.attrs["Created"]
+    if isinstance(created, (int, float)):
+        return datetime.datetime.fromtimestamp(created, tz=datetime.timezone.utc)
+    return datetime.datetime.fromisoformat(created.replace("Z", "+00:00")).astimezone(datetime.timezone.utc)
+
+
+def container_ports(container: Any) -> Dict[str, Optional[List[Dict[str, str]]]]:
+    """Ports in the inspect shape: {"80/tcp": [{"HostIp": ..., "HostPort": ...}] or None}."""
+    if not is_sparse(container):
+        return container.attrs.get("NetworkSettings", {}).get("Ports") or {}
+
+    ports: Dict[str, Optional[List[Dict[str, str]]]] = {}
+    for entry in container.attrs.get("Ports") or []:
+        key = f"{entry.get('PrivatePort')}/{entry.get('Type', 'tcp')}"
+        public_port = entry.get("PublicPort")
+        if public_port is None:
+            ports.setdefault(key, None)
+            continue
+        bindings = ports.get(key) or []
+        bindings.append({"HostIp": entry.get("IP", ""), "HostPort": str(public_port)})
+        ports[key] = bindings
+    return ports
+
+
+def container_mounts(container: Any) -> List[Dict[str, Any]]:
+    return container.attrs.get("Mounts") or []
+
+
+def container_networks(container: Any) -> Dict[str, Dict[str, Any]]:
+    return (container.attrs.get("NetworkSettings") or {}).get("Networks") or {}
@@ -0,0 +1,119 @@
+import threading
+from typing import Callable, List, Optional, Tuple, Any
+
+from Utils.getDocker import get_docker_client
+from Utils.logger import logger
+
+EventListener = Callable[[dict], None]
+ConnectListener = Callable[[Any], None]
+
+RECONNECT_DELAY_SECONDS = 2.0
+MAX_RECONNECT_DELAY_SECONDS = 30.0
+
+
+class RestartDetector:
+    """
+    Recognises container restarts on the event stream: a `start` that
+    follows a `die`. A plain stop/start or a create/start is not a restart
+    until the container has actually exited in between. Not thread-safe;
+    callers hold their own lock.
+    """
+
+    def __init__(self):
+        self._exited: set = set()
+
+    def observe(self, action: str, container_id: str) -> bool:
+        """True when this event is the start of a restart."""
+        if action == "die":
+            self._exited.add(container_id)
+        elif action == "start" and container_id in self._exited:
+            self._exited.discard(container_id)
+            return True
+        elif action == "destroy":
+            self._exited.discard(container_id)
+        return False
+
+
+class DockerEventWatcher:
+    """
+    Consumes the daemon event stream on a background thread and fans every
+    decoded event out to the subscribed listeners.
+
+    `on_connect` listeners run each time the stream is (re)opened, after the
+    subscription is live, so they can reseed any state that may have missed
+    events while the stream was down.
+    """
+
+    def __init__(self):
+        self._listeners: List[Tuple[EventListener, Optional[ConnectListener]]] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stream = None
+
+    def subscribe(self, on_event: EventListener, on_connect: Optional[ConnectListener] = None) -> None:
+        self._listeners.append((on_event, on_connect))
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="docker-events", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        stream = self._stream
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                pass
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        delay = RECONNECT_DELAY_SECONDS
+        while not self._stop.is_set():
+            try:
+                client = get_docker_client()
+                self._stream = client.events(decode=True)
+                self._notify_connect(client)
+                delay = RECONNECT_DELAY_SECONDS
+
+                for event in self._stream:
+                    if self._stop.is_set():
+                        break
+                    self.dispatch(event)
+            except Exception as e:
+                if not self._stop.is_set():
+                    logger.warning(f"Docker event stream interrupted: {e}")
+            finally:
+                self._stream = None
+
+            if self._stop.wait(delay):
+                break
+            delay = min(delay * 2, MAX_RECONNECT_DELAY_SECONDS)
+
+    def _notify_connect(self, client: Any) -> None:
+        for _, on_connect in self._listeners:
+            if on_connect is None:
+                continue
+            try:
+                on_connect(client)
+            except Exception as e:
+                logger.warning(f"Docker event resync failed: {e}")
+
+    def dispatch(self, event: dict) -> None:
+        for on_event, _ in self._listeners:
+            try:
+                on_event(event)
+            except Exception as e:
+                logger.warning(f"Docker event listener failed for {event.get('Type')}/{event.get('Action')}: {e}")
+
+
+event_watcher = DockerEventWatcher()
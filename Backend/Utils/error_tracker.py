@@ -0,0 +1,116 @@
+"""
+Incremental error-line detection over container logs.
+
+Each container keeps a cursor (timestamp of the last log line seen) and a
+rolling window of the most recent `ERROR_WINDOW_LINES` lines. A refresh
+only asks the daemon for lines newer than the cursor, so the cost of
+`error_count` / `latest_error_message` no longer grows with log volume.
+"""
+import datetime
+import os
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from Utils.logger import logger
+
+ERROR_PATTERN = re.compile(r"error|fail|exception", re.IGNORECASE)
+ERROR_WINDOW_LINES = 100
+ERROR_REFRESH_SECONDS = float(os.getenv("ERROR_TRACKER_REFRESH_SECONDS", "5"))
+
+
+def _timestamp_ns(timestamp: str) -> int:
+    """Parse a RFC3339Nano log timestamp (trailing zeros trimmed) into epoch nanoseconds."""
+    base, _, fraction = timestamp.rstrip("Z").partition(".")
+    seconds = datetime.datetime.fromisoformat(base).replace(tzinfo=datetime.timezone.utc).timestamp()
+    return int(seconds) * 1_000_000_000 + int((fraction or "0")[:9].ljust(9, "0"))
+
+
+class _ContainerErrors:
+    __slots__ = ("lock", "cursor_ns", "window", "count", "latest", "refreshed_at")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.cursor_ns: Optional[int] = None
+        self.window: Deque[bool] = deque(maxlen=ERROR_WINDOW_LINES)
+        self.count = 0
+        self.latest: Optional[str] = None
+        self.refreshed_at: Optional[float] = None
+
+    def push(self, line: str) -> None:
+        is_error = ERROR_PATTERN.search(line) is not None
+        if len(self.window) == self.window.maxlen and self.window[0]:
+            self.count -= 1
+        self.window.append(is_error)
+        if is_error:
+            self.count += 1
+            self.latest = line
+        elif self.count == 0:
+            self.latest = None
+
+
+class ContainerErrorTracker:
+    def __init__(self, refresh_seconds: float = ERROR_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._containers: Dict[str, _ContainerErrors] = {}
+
+    def _state(self, container_id: str) -> _ContainerErrors:
+        state = self._containers.get(container_id)
+        if state is None:
+            with self._lock:
+                state = self._containers.setdefault(container_id, _ContainerErrors())
+        return state
+
+    def observe(self, container: Any) -> Tuple[int, Optional[str]]:
+        """Pull log lines newer than the cursor (at most every `refresh_seconds`) and return the window stats."""
+        state = self._state(container.id)
+        with state.lock:
+            now = time.monotonic()
+            if state.refreshed_at is None or now - state.refreshed_at >= self.refresh_seconds:
+                self._refresh(container, state)
+                state.refreshed_at = now
+            return state.count, state.latest
+
+    def peek(self, container_id: str) -> Tuple[int, Optional[str]]:
+        """Return the last known stats without touching the daemon."""
+        state = self._containers.get(container_id)
+        if state is None:
+            return 0, None
+        return state.count, state.latest
+
+    def forget(self, container_id: str) -> None:
+        with self._lock:
+            self._containers.pop(container_id, None)
+
+    def handle_event(self, event: dict) -> None:
+        if event.get("Type") == "container" and event.get("Action") == "destroy":
+            self.forget((event.get("Actor") or {}).get("ID") or event.get("id", ""))
+
+    @staticmethod
+    def _refresh(container: Any, state: _ContainerErrors) -> None:
+        if state.cursor_ns is None:
+            raw = container.logs(tail=ERROR_WINDOW_LINES, timestamps=True)
+        else:
+            raw = container.logs(since=state.cursor_ns / 1_000_000_000, timestamps=True)
+
+        for line in raw.decode("utf-8", errors="ignore").splitlines():
+            timestamp, _, message = line.partition(" ")
+            try:
+                line_ns = _timestamp_ns(timestamp)
+            except ValueError:
+                continue
+            # `since` has second-level granularity on older daemons, so skip lines already seen
+            if state.cursor_ns is not None and line_ns <= state.cursor_ns:
+                continue
+            state.cursor_ns = line_ns
+            state.push(message)
+
+        if state.cursor_ns is None:
+            # keep the cursor unset so the next refresh reads the tail again
+            logger.debug(f"No timestamped log lines yet for container {container.id}")
+
+
+error_tracker = ContainerErrorTracker()
@@ -0,0 +1,149 @@
+"""
+Wire encodings for stats websocket frames.
+
+A client picks one with a websocket subprotocol (`stats.json`,
+`stats.msgpack`, `stats.binary.v1`) or a `?format=json|msgpack|binary`
+query parameter; JSON is the default. Only stats frames are encoded this
+way; control messages (`hello`, errors) always go out as JSON text.
+
+The binary format is little-endian and fixed-layout. Every frame starts
+with a 2-byte header: format version (1) and frame kind.
+
+kind 1, per-container frame (`build_stats_frame`):
+    f32 cpu_percent, u16 cpu_cores, u64 memory_usage, u64 memory_limit,
+    f32 memory_percent, u64 network_rx, u64 network_tx, u64 blk_read,
+    u64 blk_write, u32 uptime_seconds, u16 n, n x u64 per_cpu_usage
+
+kind 2, host feed frame (`FeedSession.frame`):
+    f64 sampled_at, u16 n, n x (12s id, f32 cpu_percent, u64 memory_usage,
+    u64 memory_limit, 4 x f32 io rates), u16 n, n x 12s removed id,
+    u16 n, n x (12s id, u8 len, len bytes UTF-8 name)
+"""
+import json
+import struct
+from typing import Any, Callable, Dict, NamedTuple, Optional, Union
+
+import msgpack
+
+BINARY_VERSION = 1
+KIND_CONTAINER = 1
+KIND_HOST = 2
+
+_HEADER = struct.Struct("<BB")
+_CONTAINER = struct.Struct("<fHQQfQQQQIH")
+_HOST = struct.Struct("<dH")
+_ROW = struct.Struct("<12sfQQffff")
+_COUNT = struct.Struct("<H")
+
+Encoded = Union[str, bytes]
+
+
+class FrameCodec(NamedTuple):
+    name: str
+    subprotocol: str
+    encode: Callable[[Dict[str, Any]], Encoded]
+    binary: bool
+
+
+def encode_json(frame: Dict[str, Any]) -> str:
+    # same output as Starlette's send_json
+    return json.dumps(frame, separators=(",", ":"), ensure_ascii=False)
+
+
+def encode_msgpack(frame: Dict[str, Any]) -> bytes:
+    return msgpack.packb(frame)
+
+
+def encode_binary(frame: Dict[str, Any]) -> bytes:
+    if frame.get("type") == "stats":
+        return _encode_host(frame)
+    per_cpu = frame.get("per_cpu_usage") or []
+    return b"".join((
+        _HEADER.pack(BINARY_VERSION, KIND_CONTAINER),
+        _CONTAINER.pack(
+            frame["cpu_percent"], frame["cpu_cores"], frame["memory_usage"], frame["memory_limit"],
+            frame["memory_percent"], frame["network_rx"], frame["network_tx"], frame["blk_read"],
+            frame["blk_write"], max(0, frame["uptime_seconds"]), len(per_cpu),
+        ),
+        struct.pack(f"<{len(per_cpu)}Q", *per_cpu),
+    ))
+
+
+def _encode_host(frame: Dict[str, Any]) -> bytes:
+    rows = frame.get("rows") or {}
+    removed = frame.get("removed") or []
+    names = frame.get("names") or {}
+    parts = [_HEADER.pack(BINARY_VERSION, KIND_HOST), _HOST.pack(frame["sampled_at"], len(rows))]
+    parts.extend(_ROW.pack(cid.encode(), *row) for cid, row in rows.items())
+    parts.append(_COUNT.pack(len(removed)))
+    parts.extend(cid.encode() for cid in removed)
+    parts.append(_COUNT.pack(len(names)))
+    for cid, name in names.items():
+        raw = name.encode()[:255]
+        parts.append(cid.encode() + bytes((len(raw),)) + raw)
+    return b"".join(parts)
+
+
+def decode_binary(data: bytes) -> Dict[str, Any]:
+    """Inverse of `encode_binary`; the reference decoder for clients."""
+    version, kind = _HEADER.unpack_from(data)
+    if version != BINARY_VERSION:
+        raise ValueError(f"Unsupported binary frame version {version}")
+    offset = _HEADER.size
+    if kind == KIND_CONTAINER:
+        values = _CONTAINER.unpack_from(data, offset)
+        offset += _CONTAINER.size
+        keys = ("cpu_percent", "cpu_cores", "memory_usage", "memory_limit", "memory_percent",
+                "network_rx", "network_tx", "blk_read", "blk_write", "uptime_seconds")
+        frame = dict(zip(keys, values))
+        frame["per_cpu_usage"] = list(struct.unpack_from(f"<{values[-1]}Q", data, offset))
+        return frame
+
+    sampled_at, count = _HOST.unpack_from(data, offset)
+    offset += _HOST.size
+    rows = {}
+    for _ in range(count):
+        cid, *row = _ROW.unpack_from(data, offset)
+        rows[cid.decode()] = tuple(row)
+        offset += _ROW.size
+    (count,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    removed = [data[offset + 12 * i:offset + 12 * (i + 1)].decode() for i in range(count)]
+    offset += 12 * count
+    (count,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    names = {}
+    for _ in range(count):
+        cid, length = data[offset:offset + 12].decode(), data[offset + 12]
+        names[cid] = data[offset + 13:offset + 13 + length].decode()
+        offset += 13 + length
+    return {"type": "stats", "sampled_at": sampled_at, "rows": rows, "removed": removed, "names": names}
+
+
+CODECS: Dict[str, FrameCodec] = {
+    "json": FrameCodec("json", "stats.json", encode_json, False),
+    "msgpack": FrameCodec("msgpack", "stats.msgpack", encode_msgpack, True),
+    "binary": FrameCodec("binary", f"stats.binary.v{BINARY_VERSION}", encode_binary, True),
+}
+
+
+def negotiate(requested_format: Optional[str], subprotocols) -> Optional[FrameCodec]:
+    """
+    Codec for a query-param format or the first supported offered subprotocol;
+    JSON when neither is given, None when the requested format is unsupported.
+    """
+    if requested_format:
+        return CODECS.get(requested_format.lower())
+    by_subprotocol = {codec.subprotocol: codec for codec in CODECS.values()}
+    for offered in subprotocols or ():
+        if offered in by_subprotocol:
+            return by_subprotocol[offered]
+    return CODECS["json"]
+
+
+async def send_frame(websocket, codec: FrameCodec, frame: Dict[str, Any]) -> None:
+    payload = codec.encode(frame)
+    if codec.binary:
+        await websocket.send_bytes(payload)
+    else:
+        await websocket.send_text(payload)
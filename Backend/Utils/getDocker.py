@@ -1,38 +1,87 @@
+import os
+import threading
 from typing import Optional, Any
 
 import docker
 from fastapi import HTTPException
+
+from Utils.container_index import container_index
+from Utils.error_tracker import error_tracker
 from Utils.logger import logger
 
+# Size of the keep-alive connection pool shared by every request handler.
+DOCKER_POOL_SIZE = int(os.getenv("DOCKER_POOL_SIZE", "32"))
+DOCKER_TIMEOUT = int(os.getenv("DOCKER_TIMEOUT", "60"))
+
+_client: Optional[docker.DockerClient] = None
+_client_lock = threading.Lock()
+
+
 def get_docker_client() -> docker.DockerClient:
+    """
+    Return the process-wide Docker client, creating it on first use.
+
+    The client (and its connection pool and negotiated API version) is reused
+    by every caller until `close_docker_client()` is called.
+    """
+    global _client
+    if _client is not None:
+        return _client
+
+    with _client_lock:
+        if _client is None:
+            try:
+                _client = docker.from_env(max_pool_size=DOCKER_POOL_SIZE, timeout=DOCKER_TIMEOUT)
+                logger.info(f"Docker client initialized (pool size {DOCKER_POOL_SIZE})")
+            except docker.errors.DockerException as e:
+                logger.error(f"Docker connection error: {e}")
+                raise HTTPException(status_code=503, detail="Docker is not running or unreachable")
+        return _client
+
+
+def init_docker_client() -> None:
+    """Eagerly create the shared client on startup; a missing daemon is retried lazily."""
     try:
-        return docker.from_env()
-    except docker.errors.DockerException as e:
-        logger.error(f"Docker connection error: {e}")
-        raise HTTPException(status_code=503, detail="Docker is not running or unreachable")
+        get_docker_client()
+    except HTTPException:
+        logger.warning("Docker is unreachable at startup, client will be created on first request")
+
+
+def close_docker_client() -> None:
+    """Close the shared client and release its pooled connections."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            return
+        try:
+            _client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close Docker client: {e}")
+        finally:
+            _client = None
 
 
 def get_container(container_id: str) -> Any:
     client = get_docker_client()
-    container_id = container_id.strip().lower()  # Normalize input
-    for container in client.containers.list(all=True):
-        logger.debug(f"Checking container: {container.id} ({container.name})")
-        if container.id.startswith(container_id) or container.name == container_id:
-            logger.info(f"Matched container: {container.name} ({container.id})")
-            return container
-    logger.warning(f"Container not found: {container_id}")
-    raise HTTPException(status_code=404, detail=f"Container '{container_id}' not found")
+    container_id = container_id.strip()  # Normalize input
+    full_id = container_index.resolve(container_id)
+
+    try:
+        # On an index miss the daemon resolves the name or ID prefix itself
+        container = client.containers.get(full_id or container_id)
+        logger.info(f"Matched container: {container.name} ({container.id})")
+        return container
+    except docker.errors.NotFound:
+        if full_id:
+            container_index.remove(full_id)
+        logger.warning(f"Container not found: {container_id}")
+        raise HTTPException(status_code=404, detail=f"Container '{container_id}' not found")
 
 def detect_container_errors(container: Any) -> tuple[int, Optional[str]]:
     try:
-        logs = container.logs(tail=100).decode("utf-8", errors="ignore").lower()
-        error_lines = [line for line in logs.splitlines() if
-                       any(word in line for word in ["error", "fail", "exception"])]
-        count = len(error_lines)
-        latest = error_lines[-1] if error_lines else None
-        return count, latest
+        return error_tracker.observe(container)
     except Exception as e:
         logger.warning(f"Could not read logs for {container.name}: {e}")
-        return 0, None
+        return error_tracker.peek(container.id)
 
 
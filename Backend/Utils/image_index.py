@@ -0,0 +1,55 @@
+"""
+Image ID -> tags/size/created index that container queries join against.
+
+docker-py resolves `container.image` with a separate `images.get()` call per
+container. Building this index costs one `/images/json` call (or nothing
+when the state cache is seeded, in which case it is reused per revision).
+"""
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from Utils.state_cache import state_cache
+
+
+class IndexedImage(NamedTuple):
+    id: str
+    tags: List[str]
+    size: int
+    created: Any
+
+
+ImageIndex = Dict[str, IndexedImage]
+
+_cached: Optional[Tuple[int, ImageIndex]] = None
+_cached_lock = threading.Lock()
+
+
+def _index_from(images) -> ImageIndex:
+    return {
+        attrs["Id"]: IndexedImage(
+            id=attrs["Id"],
+            tags=[tag for tag in (attrs.get("RepoTags") or []) if tag != "<none>:<none>"],
+            size=attrs.get("Size", 0),
+            created=attrs.get("Created"),
+        )
+        for attrs in images
+    }
+
+
+def build_image_index(client: Any) -> ImageIndex:
+    global _cached
+    if state_cache.ready:
+        snapshot = state_cache.snapshot()
+        cached = _cached
+        if cached is not None and cached[0] == snapshot.revision:
+            return cached[1]
+        index = _index_from(snapshot.images)
+        with _cached_lock:
+            _cached = (snapshot.revision, index)
+        return index
+    return _index_from(client.api.images())
+
+
+def image_tags(index: ImageIndex, image_id: Optional[str]) -> List[str]:
+    image = index.get(image_id) if image_id else None
+    return list(image.tags) if image else []
@@ -0,0 +1,88 @@
+"""
+Network ID -> driver/IPAM/flags metadata shared by container details.
+
+When the state cache is seeded the metadata comes from its network listing
+(re-indexed once per revision). Otherwise networks are inspected on first
+use and kept until a network event for that ID invalidates the entry.
+"""
+import threading
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from docker.errors import NotFound
+
+from Utils.state_cache import state_cache
+
+# Network actions that can change what we cache about a network
+INVALIDATING_ACTIONS = {"create", "destroy", "remove", "connect", "disconnect", "update"}
+
+
+class NetworkMetadata(NamedTuple):
+    id: str
+    name: str
+    driver: Optional[str]
+    gateway: Optional[str]
+    subnet: Optional[str]
+    internal: Optional[bool]
+    attachable: Optional[bool]
+
+
+def _metadata_from(attrs: Dict[str, Any]) -> NetworkMetadata:
+    ipam = ((attrs.get("IPAM") or {}).get("Config") or [{}])[0] or {}
+    return NetworkMetadata(
+        id=attrs.get("Id", ""),
+        name=attrs.get("Name", ""),
+        driver=attrs.get("Driver"),
+        gateway=ipam.get("Gateway"),
+        subnet=ipam.get("Subnet"),
+        internal=attrs.get("Internal"),
+        attachable=attrs.get("Attachable"),
+    )
+
+
+class NetworkMetadataCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inspected: Dict[str, NetworkMetadata] = {}
+        self._indexed: Optional[Tuple[int, Dict[str, NetworkMetadata]]] = None
+
+    def get(self, client: Any, network_id: str) -> Optional[NetworkMetadata]:
+        if state_cache.ready:
+            return self._snapshot_index().get(network_id)
+
+        metadata = self._inspected.get(network_id)
+        if metadata is None:
+            try:
+                metadata = _metadata_from(client.api.inspect_network(network_id))
+            except NotFound:
+                return None
+            with self._lock:
+                self._inspected[network_id] = metadata
+        return metadata
+
+    def _snapshot_index(self) -> Dict[str, NetworkMetadata]:
+        snapshot = state_cache.snapshot()
+        indexed = self._indexed
+        if indexed is not None and indexed[0] == snapshot.revision:
+            return indexed[1]
+        index = {attrs["Id"]: _metadata_from(attrs) for attrs in snapshot.networks}
+        with self._lock:
+            self._indexed = (snapshot.revision, index)
+        return index
+
+    def invalidate(self, network_id: Optional[str] = None) -> None:
+        with self._lock:
+            if network_id is None:
+                self._inspected.clear()
+            else:
+                self._inspected.pop(network_id, None)
+
+    def handle_event(self, event: dict) -> None:
+        if event.get("Type") != "network" or event.get("Action") not in INVALIDATING_ACTIONS:
+            return
+        self.invalidate((event.get("Actor") or {}).get("ID") or event.get("id"))
+
+    def __len__(self) -> int:
+        return len(self._inspected)
+
+
+network_cache = NetworkMetadataCache()
@@ -0,0 +1,39 @@
+"""
+Sparse field projection (`?fields=id,name,status`) for read endpoints.
+
+Queries receive the parsed field set and skip the enrichment steps whose
+output was not requested; routes then serialise only those fields. `id`
+is always included so clients can key the rows they get back.
+"""
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Type
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+Fields = Optional[FrozenSet[str]]
+
+
+def parse_fields(raw: Optional[str], model: Type[BaseModel]) -> Fields:
+    """Parse a comma separated `fields` parameter; None means every field."""
+    if not raw:
+        return None
+    fields = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = fields - set(model.model_fields)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    return frozenset(fields | {"id"})
+
+
+def wants(fields: Fields, *names: str) -> bool:
+    return fields is None or any(name in fields for name in names)
+
+
+def build(model: Type[BaseModel], fields: Fields, values: Dict[str, Any]) -> BaseModel:
+    """Validate a full model, or construct a partial one when only some fields were computed."""
+    if fields is None:
+        return model(**values)
+    return model.model_construct(**{k: v for k, v in values.items() if k in fields})
+
+
+def select_fields(item: BaseModel, fields: Iterable[str]) -> Dict[str, Any]:
+    return item.model_dump(include=set(fields), mode="json")
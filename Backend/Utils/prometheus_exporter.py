@@ -0,0 +1,191 @@
+"""
+Prometheus text exposition for `/metrics`.
+
+Everything is rendered from state the service already keeps: per-container
+figures from the stats sampler's latest samples (computed in one vectorized
+pass), object counts from the state cache snapshot, restart counts from the
+Docker event stream, and this service's own request latencies from the
+HTTP middleware. A scrape never calls the daemon.
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+from Utils.docker_events import RestartDetector
+from Utils.stats_batch import compute_samples
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _container_labels(container_id: str, names: Dict[str, Optional[str]]) -> str:
+    return f'id="{container_id[:12]}",name="{_escape(names.get(container_id) or container_id[:12])}"'
+
+
+class LatencyHistogram:
+    """Cumulative-bucket request latency histogram keyed by (method, route, status)."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        # per key: one count per bucket plus +Inf, and the sum of observed seconds
+        self._series: Dict[Tuple[str, str, str], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, method: str, route: str, status: int, seconds: float) -> None:
+        key = (method, route, str(status))
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][bisect_left(self.buckets, seconds)] += 1
+            series[1][0] += seconds
+
+    def render(self, name: str, lines: List[str]) -> None:
+        lines.append(f"# HELP {name} HTTP request latency by route")
+        lines.append(f"# TYPE {name} histogram")
+        with self._lock:
+            series = [(key, list(counts), total[0]) for key, (counts, total) in self._series.items()]
+        for (method, route, status), counts, total in sorted(series):
+            labels = f'method="{method}",route="{_escape(route)}",status="{status}"'
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            cumulative += counts[-1]
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {cumulative}')
+            lines.append(f"{name}_sum{{{labels}}} {total}")
+            lines.append(f"{name}_count{{{labels}}} {cumulative}")
+
+
+class RequestLatencyMiddleware:
+    """
+    Plain ASGI middleware timing every HTTP request into `histogram`.
+    Requests are labelled by route template (`/containers/{container_id}`),
+    read from the scope the router fills in, so IDs in paths do not create
+    a series each; requests no route matched are labelled `unmatched`.
+    """
+
+    def __init__(self, app: Any, histogram: LatencyHistogram):
+        self.app = app
+        self.histogram = histogram
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            self.histogram.observe(scope["method"], getattr(route, "path", "unmatched"), status,
+                                   time.perf_counter() - started)
+
+
+class RestartCounter:
+    """Counts container restarts seen on the event stream (a `start` that follows a `die`)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._restarts = RestartDetector()
+        self.counts: Dict[str, int] = {}
+
+    def handle_event(self, event: dict) -> None:
+        if event.get("Type") != "container":
+            return
+        action = (event.get("Action") or "").split(":")[0]
+        container_id = (event.get("Actor") or {}).get("ID") or event.get("id")
+        if not container_id:
+            return
+        with self._lock:
+            if self._restarts.observe(action, container_id):
+                self.counts[container_id] = self.counts.get(container_id, 0) + 1
+            elif action == "destroy":
+                self.counts.pop(container_id, None)
+
+
+CONTAINER_METRICS = (
+    ("docker_container_cpu_percent", "gauge", "CPU usage in percent of one core"),
+    ("docker_container_memory_usage_bytes", "gauge", "Memory usage"),
+    ("docker_container_memory_limit_bytes", "gauge", "Memory limit"),
+    ("docker_container_network_receive_bytes_total", "counter", "Bytes received on all interfaces"),
+    ("docker_container_network_transmit_bytes_total", "counter", "Bytes sent on all interfaces"),
+    ("docker_container_blkio_read_bytes_total", "counter", "Bytes read from block devices"),
+    ("docker_container_blkio_write_bytes_total", "counter", "Bytes written to block devices"),
+    ("docker_container_last_sample_timestamp_seconds", "gauge", "When the figures above were sampled"),
+)
+
+
+def render_metrics(
+    samples: Dict[str, Any],
+    names: Dict[str, Optional[str]],
+    restarts: Dict[str, int],
+    snapshot: Any = None,
+    histogram: Optional[LatencyHistogram] = None,
+) -> str:
+    """
+    `samples` maps container IDs to `StatsSample`s, `names` IDs to names;
+    `snapshot` is a state cache snapshot (object counts are skipped without one).
+    """
+    lines: List[str] = []
+    ids = list(samples)
+    labels = [_container_labels(cid, names) for cid in ids]
+
+    if ids:
+        batch = compute_samples([samples[cid].stats for cid in ids])
+        counters = batch.counters.T.tolist()
+        columns = (
+            batch.cpu_percent.round(3).tolist(),
+            batch.memory_usage.tolist(),
+            # compute() reports a missing limit as 1; expose it as 0 like the API does
+            [limit if limit > 1 else 0 for limit in batch.memory_limit.tolist()],
+            *counters,
+            [samples[cid].sampled_at for cid in ids],
+        )
+        for (name, kind, help_text), values in zip(CONTAINER_METRICS, columns):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(f"{name}{{{label}}} {value}" for label, value in zip(labels, values))
+
+    lines.append("# HELP docker_container_restarts_total Restarts observed since this service started")
+    lines.append("# TYPE docker_container_restarts_total counter")
+    for cid, count in sorted(restarts.items()):
+        lines.append(f"docker_container_restarts_total{{{_container_labels(cid, names)}}} {count}")
+
+    if snapshot is not None:
+        states: Dict[str, int] = {}
+        for container in snapshot.containers:
+            state = container.get("State") or "unknown"
+            states[state] = states.get(state, 0) + 1
+        lines.append("# HELP docker_containers Containers by state")
+        lines.append("# TYPE docker_containers gauge")
+        lines.extend(f'docker_containers{{state="{_escape(state)}"}} {count}' for state, count in sorted(states.items()))
+        for kind, items in (("images", snapshot.images), ("volumes", snapshot.volumes),
+                            ("networks", snapshot.networks)):
+            lines.append(f"# HELP docker_{kind} Number of {kind}")
+            lines.append(f"# TYPE docker_{kind} gauge")
+            lines.append(f"docker_{kind} {len(items)}")
+
+    if histogram is not None:
+        histogram.render("http_request_duration_seconds", lines)
+
+    lines.append("")
+    return "\n".join(lines)
+
+
+request_latency = LatencyHistogram()
+restart_counter = RestartCounter()
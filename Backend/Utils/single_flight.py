@@ -0,0 +1,101 @@
+"""
+Single-flight coalescing for read queries.
+
+Concurrent callers asking for the same key share one in-flight computation
+and its result (or exception). An optional TTL keeps the last result around
+briefly so a burst of dashboard polls costs one daemon sweep.
+"""
+import functools
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+QUERY_CACHE_TTL_SECONDS = float(os.getenv("QUERY_CACHE_TTL", "0"))
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._cache: Dict[Hashable, Tuple[float, Any]] = {}
+        self.calls = 0
+        self.executions = 0
+        self.deduplicated = 0
+        self.cache_hits = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any], ttl: float = 0.0) -> Any:
+        with self._lock:
+            self.calls += 1
+            cached = self._cache.get(key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    self.cache_hits += 1
+                    self.deduplicated += 1
+                    return cached[1]
+                del self._cache[key]
+
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+            else:
+                self.deduplicated += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                if call.error is None and ttl > 0:
+                    self._cache[key] = (time.monotonic() + ttl, call.result)
+            call.done.set()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "executions": self.executions,
+                "deduplicated": self.deduplicated,
+                "cache_hits": self.cache_hits,
+                "in_flight": len(self._calls),
+            }
+
+
+coalescer = SingleFlight()
+
+
+def single_flight(name: str, ttl: Optional[float] = None):
+    """Coalesce concurrent calls of the decorated query that share the same arguments."""
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (name, args, tuple(sorted(kwargs.items())))
+            return coalescer.do(key, lambda: fn(*args, **kwargs),
+                                QUERY_CACHE_TTL_SECONDS if ttl is None else ttl)
+        return wrapper
+    return decorator
@@ -0,0 +1,294 @@
+"""
+Event-driven in-memory model of containers, images, volumes and networks.
+
+The cache is seeded with one sweep of the daemon, then kept current from
+the Docker event stream (see `Utils.docker_events`) and reconciled on a
+timer to recover from missed events. Every applied change bumps a
+monotonically increasing revision. Read endpoints go through the
+`list_*` helpers, which serve from the snapshot once the cache is seeded
+and fall back to the daemon otherwise.
+"""
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from docker.errors import NotFound
+
+from Utils.logger import logger
+
+RECONCILE_INTERVAL_SECONDS = float(os.getenv("STATE_RECONCILE_INTERVAL", "60"))
+
+# Container actions that do not change the /containers/json summary
+IGNORED_CONTAINER_ACTIONS = {"attach", "resize", "top", "export", "copy", "archive-path", "extract-to-dir", "commit"}
+
+
+class StateSnapshot:
+    __slots__ = ("revision", "containers", "images", "volumes", "networks", "version", "info")
+
+    def __init__(self, revision: int, containers: Tuple[dict, ...], images: Tuple[dict, ...],
+                 volumes: Tuple[dict, ...], networks: Tuple[dict, ...], version: dict, info: dict):
+        self.revision = revision
+        self.containers = containers
+        self.images = images
+        self.volumes = volumes
+        self.networks = networks
+        self.version = version
+        self.info = info
+
+
+class DockerStateCache:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._containers: Dict[str, dict] = {}
+        self._images: Dict[str, dict] = {}
+        self._volumes: Dict[str, dict] = {}
+        self._networks: Dict[str, dict] = {}
+        self._version: dict = {}
+        self._info: dict = {}
+        self._revision = 0
+        self._snapshot: Optional[StateSnapshot] = None
+        self._ready = False
+        self._client: Any = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_reconciled_at: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    @property
+    def revision(self) -> int:
+        return self._revision
+
+    # --- lifecycle ---------------------------------------------------------
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._reconcile_loop, name="docker-state-reconcile", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _reconcile_loop(self) -> None:
+        while not self._stop.wait(RECONCILE_INTERVAL_SECONDS):
+            if self._client is None:
+                continue
+            try:
+                self.seed(self._client)
+            except Exception as e:
+                logger.warning(f"State cache reconcile failed: {e}")
+
+    # --- seeding / reconciliation ------------------------------------------
+
+    def seed(self, client: Any) -> None:
+        """Full sweep of the daemon; also used to reconcile after missed events."""
+        self._client = client
+        api = client.api
+
+        containers = {c["Id"]: c for c in api.containers(all=True)}
+        networks = {n["Id"]: n for n in api.networks()}
+        volumes = {v["Name"]: v for v in (api.volumes().get("Volumes") or [])}
+        images = self._reconcile_images(api)
+        version = api.version()
+        info = api.info()
+
+        with self._lock:
+            changed = (
+                containers != self._containers
+                or images != self._images
+                or volumes != self._volumes
+                or networks != self._networks
+                or version != self._version
+                or info.get("Swarm") != self._info.get("Swarm")
+            )
+            self._containers = containers
+            self._images = images
+            self._volumes = volumes
+            self._networks = networks
+            self._version = version
+            self._info = info
+            if changed or not self._ready:
+                self._bump()
+            self._ready = True
+            self.last_reconciled_at = time.time()
+
+        logger.info(
+            f"State cache reconciled at revision {self._revision}: {len(containers)} containers, "
+            f"{len(images)} images, {len(volumes)} volumes, {len(networks)} networks"
+        )
+
+    def _reconcile_images(self, api: Any) -> Dict[str, dict]:
+        # /images/json lacks Architecture/Os, so only images not seen before are inspected
+        with self._lock:
+            known = dict(self._images)
+
+        images: Dict[str, dict] = {}
+        for summary in api.images():
+            image_id = summary["Id"]
+            attrs = known.get(image_id)
+            if attrs is None:
+                try:
+                    attrs = api.inspect_image(image_id)
+                except NotFound:
+                    continue
+            else:
+                attrs = {**attrs, "RepoTags": summary.get("RepoTags") or [],
+                         "RepoDigests": summary.get("RepoDigests") or []}
+            images[image_id] = attrs
+        return images
+
+    def reset(self) -> None:
+        with self._lock:
+            self._containers, self._images, self._volumes, self._networks = {}, {}, {}, {}
+            self._version, self._info = {}, {}
+            self._ready = False
+            self._client = None
+            self._bump()
+
+    def _bump(self) -> None:
+        self._revision += 1
+        self._snapshot = None
+
+    # --- event handling ------------------------------------------------------
+
+    def handle_event(self, event: dict) -> None:
+        if not self._ready or self._client is None:
+            return
+
+        event_type = event.get("Type")
+        action = (event.get("Action") or "").split(":")[0]
+        actor = event.get("Actor") or {}
+        actor_id = actor.get("ID") or event.get("id")
+        attributes = actor.get("Attributes") or {}
+        if not actor_id:
+            return
+
+        if event_type == "container":
+            if action.startswith("exec_") or action in IGNORED_CONTAINER_ACTIONS:
+                return
+            self._refresh_container(actor_id, removed=action == "destroy")
+        elif event_type == "image":
+            self._refresh_image(actor_id, removed=action == "delete")
+        elif event_type == "volume":
+            if action in ("create", "destroy"):
+                self._refresh_volume(actor_id, removed=action == "destroy")
+        elif event_type == "network":
+            self._refresh_network(actor_id, removed=action == "destroy")
+            if action in ("connect", "disconnect") and attributes.get("container"):
+                self._refresh_container(attributes["container"])
+
+    def _refresh_container(self, container_id: str, removed: bool = False) -> None:
+        summary = None
+        if not removed:
+            found = self._client.api.containers(all=True, filters={"id": container_id})
+            summary = found[0] if found else None
+        with self._lock:
+            if summary is None:
+                if self._containers.pop(container_id, None) is not None:
+                    self._bump()
+            elif self._containers.get(container_id) != summary:
+                self._containers[container_id] = summary
+                self._bump()
+
+    def _refresh_image(self, reference: str, removed: bool = False) -> None:
+        attrs = None
+        if not removed:
+            try:
+                attrs = self._client.api.inspect_image(reference)
+            except NotFound:
+                attrs = None
+        with self._lock:
+            if attrs is None:
+                if self._images.pop(reference, None) is not None:
+                    self._bump()
+            elif self._images.get(attrs["Id"]) != attrs:
+                self._images[attrs["Id"]] = attrs
+                self._bump()
+
+    def _refresh_volume(self, name: str, removed: bool = False) -> None:
+        attrs = None
+        if not removed:
+            try:
+                attrs = self._client.api.inspect_volume(name)
+            except NotFound:
+                attrs = None
+        with self._lock:
+            if attrs is None:
+                if self._volumes.pop(name, None) is not None:
+                    self._bump()
+            elif self._volumes.get(name) != attrs:
+                self._volumes[name] = attrs
+                self._bump()
+
+    def _refresh_network(self, network_id: str, removed: bool = False) -> None:
+        summary = None
+        if not removed:
+            found = self._client.api.networks(ids=[network_id])
+            summary = found[0] if found else None
+        with self._lock:
+            if summary is None:
+                if self._networks.pop(network_id, None) is not None:
+                    self._bump()
+            elif self._networks.get(network_id) != summary:
+                self._networks[network_id] = summary
+                self._bump()
+
+    # --- reads ---------------------------------------------------------------
+
+    def snapshot(self) -> StateSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = StateSnapshot(
+                    revision=self._revision,
+                    containers=tuple(self._containers.values()),
+                    images=tuple(self._images.values()),
+                    volumes=tuple(self._volumes.values()),
+                    networks=tuple(self._networks.values()),
+                    version=self._version,
+                    info=self._info,
+                )
+            return self._snapshot
+
+
+state_cache = DockerStateCache()
+
+
+def list_images(client: Any) -> List[Any]:
+    if state_cache.ready:
+        return [client.images.prepare_model(attrs) for attrs in state_cache.snapshot().images]
+    return client.images.list()
+
+
+def list_volumes(client: Any) -> List[Any]:
+    if state_cache.ready:
+        return [client.volumes.prepare_model(attrs) for attrs in state_cache.snapshot().volumes]
+    return client.volumes.list()
+
+
+def list_networks(client: Any) -> List[Any]:
+    if state_cache.ready:
+        return [client.networks.prepare_model(attrs) for attrs in state_cache.snapshot().networks]
+    return client.networks.list()
+
+
+def docker_version(client: Any) -> dict:
+    if state_cache.ready:
+        return state_cache.snapshot().version
+    return client.version()
+
+
+def docker_info(client: Any) -> dict:
+    if state_cache.ready:
+        return state_cache.snapshot().info
+    return client.info()
@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+
 from Utils.logger import logger
 
 
@@ -42,4 +44,26 @@ def _extract_blk_io(stats):
         return {"read": read, "write": write}
     except Exception as e:
         logger.warning(f"Block IO parse failed: {e}")
-        return {"read": 0, "write": 0}
\ No newline at end of file
+        return {"read": 0, "write": 0}
+
+def build_stats_frame(stats, started_dt):
+    """Websocket payload for one decoded stats sample."""
+    cpu_percent = _calculate_cpu_percent(stats)
+    per_cpu_usage = stats.get("cpu_stats", {}).get("cpu_usage", {}).get("percpu_usage") or []
+    mem_usage = stats.get("memory_stats", {}).get("usage", 0)
+    mem_limit = stats.get("memory_stats", {}).get("limit") or 1
+    net_io = _extract_network_io(stats)
+    blk_io = _extract_blk_io(stats)
+    return {
+        "cpu_percent": round(cpu_percent, 2),
+        "cpu_cores": len(per_cpu_usage),
+        "per_cpu_usage": per_cpu_usage,
+        "memory_usage": mem_usage,
+        "memory_limit": mem_limit,
+        "memory_percent": round((mem_usage / mem_limit) * 100, 2),
+        "network_rx": net_io["rx"],
+        "network_tx": net_io["tx"],
+        "blk_read": blk_io["read"],
+        "blk_write": blk_io["write"],
+        "uptime_seconds": int((datetime.now(timezone.utc) - started_dt).total_seconds()),
+    }
@@ -0,0 +1,132 @@
+"""
+Host-wide stats feed for the multiplexed `/ws/stats` socket.
+
+`StatsFeed` listens to whole sampler sweeps and turns them into one compact
+row per running container (see `COLUMNS`), built once per sweep from the
+sampler's `Sweep` no matter how many sockets are open. Each socket owns
+a `FeedSession` that remembers the rows it last sent, so a frame carries
+only containers that are new, gone, or whose values moved by more than the
+session's threshold. Data refreshes at the sampler interval
+(`STATS_SAMPLE_INTERVAL`); a socket ticking faster simply sends nothing
+until the next sweep lands.
+"""
+import math
+import os
+import threading
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Set, Tuple
+
+from fastapi import HTTPException
+
+from Utils.container_index import container_index
+from Utils.stats_batch import Sweep
+
+COLUMNS = ("cpu_percent", "memory_usage", "memory_limit", "network_rx", "network_tx", "blk_read", "blk_write")
+
+# Relative change (of the last sent value) a column needs before a row is resent
+STATS_FEED_DELTA = float(os.getenv("STATS_FEED_DELTA", "0.01"))
+
+Row = Tuple[float, ...]
+
+
+class FeedSnapshot(NamedTuple):
+    revision: int
+    sampled_at: float
+    rows: Dict[str, Row]
+
+
+class StatsFeed:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot = FeedSnapshot(0, 0.0, {})
+
+    def on_batch(self, sweep: Sweep) -> None:
+        """`StatsSampler` batch listener."""
+        batch = sweep.stats
+        rows = {
+            cid: (round(cpu, 2), memory, limit, *io)
+            for cid, cpu, memory, limit, io in zip(
+                sweep.ids, batch.cpu_percent.tolist(), batch.memory_usage.tolist(), batch.memory_limit.tolist(),
+                sweep.rates.round(1).tolist(),
+            )
+        }
+        sampled_at = max(sweep.sampled_at.tolist(), default=0.0)
+        with self._lock:
+            self._snapshot = FeedSnapshot(self._snapshot.revision + 1, sampled_at, rows)
+
+    def snapshot(self) -> FeedSnapshot:
+        return self._snapshot
+
+
+def _resolve(ref: str) -> str:
+    try:
+        return container_index.resolve(ref) or ref
+    except HTTPException:
+        # ambiguous prefix: keep it as given, it simply matches nothing
+        return ref
+
+
+def valid_subscription(refs: Any) -> bool:
+    """True for the shapes `FeedSession.subscribe` accepts from a client: None or a list of strings."""
+    return refs is None or (isinstance(refs, list) and all(isinstance(ref, str) for ref in refs))
+
+
+def _changed(old: Row, new: Row, threshold: float) -> bool:
+    return any(not math.isclose(a, b, rel_tol=threshold, abs_tol=threshold) for a, b in zip(old, new))
+
+
+class FeedSession:
+    """Per-socket view of the feed: the subscribed subset and the rows already sent."""
+
+    def __init__(self, threshold: float = STATS_FEED_DELTA):
+        self.threshold = threshold
+        self.containers: Optional[Set[str]] = None
+        self._sent: Dict[str, Row] = {}
+        self._revision = -1
+
+    def subscribe(self, refs: Optional[Iterable[str]]) -> None:
+        """Limit the session to these container names/IDs, or every container when `refs` is None."""
+        if refs is None:
+            self.containers = None
+        else:
+            self.containers = {_resolve(ref.strip()) for ref in refs if ref.strip()}
+        # force the next frame even if no new sweep has landed
+        self._revision = -1
+
+    def _wanted(self, container_id: str) -> bool:
+        containers = self.containers
+        return containers is None or container_id in containers or container_id[:12] in containers
+
+    def frame(self, snapshot: FeedSnapshot) -> Optional[Dict[str, Any]]:
+        """Delta frame against what this session last sent, or None when there is nothing new."""
+        if snapshot.revision == self._revision:
+            return None
+        self._revision = snapshot.revision
+
+        rows: Dict[str, Row] = {}
+        names: Dict[str, str] = {}
+        for container_id, row in snapshot.rows.items():
+            if not self._wanted(container_id):
+                continue
+            old = self._sent.get(container_id)
+            if old is None:
+                names[container_id[:12]] = container_index.name_of(container_id) or container_id[:12]
+            elif not _changed(old, row, self.threshold):
+                continue
+            rows[container_id[:12]] = row
+            self._sent[container_id] = row
+
+        removed = [cid for cid in self._sent if cid not in snapshot.rows or not self._wanted(cid)]
+        for container_id in removed:
+            del self._sent[container_id]
+
+        if not rows and not removed:
+            return None
+        frame: Dict[str, Any] = {"type": "stats", "sampled_at": snapshot.sampled_at, "rows": rows}
+        if names:
+            frame["names"] = names
+        if removed:
+            frame["removed"] = [cid[:12] for cid in removed]
+        return frame
+
+
+stats_feed = StatsFeed()
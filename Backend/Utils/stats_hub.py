@@ -0,0 +1,186 @@
+"""
+Fan-out hub for live container stats.
+
+At most one upstream `stats(stream=True)` stream is open per container,
+read by a dedicated thread. Each decoded sample is pushed to every
+subscriber's bounded queue; a slow subscriber loses its oldest samples
+instead of holding up the others. When the last subscriber leaves, the
+upstream stream is kept for a grace period so quick reconnects reuse it.
+With `STATS_BACKEND=cgroup` the upstream is a cgroup file poller instead.
+"""
+import asyncio
+import os
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Set
+
+from Utils.cgroup_stats import cgroup_stats, use_cgroup_stats
+from Utils.getDocker import get_docker_client
+from Utils.logger import logger
+
+STATS_HUB_QUEUE_SIZE = int(os.getenv("STATS_HUB_QUEUE_SIZE", "8"))
+STATS_HUB_GRACE_SECONDS = float(os.getenv("STATS_HUB_GRACE_SECONDS", "10"))
+# Tick of the cgroup-backed stream (the daemon's own stream ticks about once a second)
+STATS_HUB_CGROUP_INTERVAL = float(os.getenv("STATS_HUB_CGROUP_INTERVAL", "1"))
+
+# Pushed to subscribers when the upstream stream ends (container stopped or removed)
+END_OF_STREAM = None
+
+
+class StatsSubscription:
+    """Bounded drop-oldest queue fed from the upstream reader thread and drained by one async consumer."""
+
+    def __init__(self, container_id: str, loop: asyncio.AbstractEventLoop, maxsize: int = STATS_HUB_QUEUE_SIZE):
+        self.container_id = container_id
+        self.dropped = 0
+        self.closed = False
+        self._loop = loop
+        self._queue: Deque[Optional[Dict[str, Any]]] = deque(maxlen=maxsize)
+        self._lock = threading.Lock()
+        self._ready = asyncio.Event()
+
+    def push(self, sample: Optional[Dict[str, Any]]) -> None:
+        with self._lock:
+            if len(self._queue) == self._queue.maxlen:
+                self.dropped += 1
+            self._queue.append(sample)
+        try:
+            self._loop.call_soon_threadsafe(self._ready.set)
+        except RuntimeError:
+            # consumer loop already closed
+            pass
+
+    def get_nowait(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._queue.popleft()
+
+    async def get(self) -> Optional[Dict[str, Any]]:
+        """Next sample, or END_OF_STREAM once the upstream stream has ended."""
+        while True:
+            with self._lock:
+                if self._queue:
+                    return self._queue.popleft()
+                self._ready.clear()
+            await self._ready.wait()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+
+class _Upstream:
+    def __init__(self, container_id: str):
+        self.container_id = container_id
+        self.subscribers: Set[StatsSubscription] = set()
+        self.stop = threading.Event()
+        self.teardown: Optional[threading.Timer] = None
+        self.thread: Optional[threading.Thread] = None
+
+
+class StatsHub:
+    def __init__(self, client_factory: Callable[[], Any] = get_docker_client,
+                 grace_seconds: float = STATS_HUB_GRACE_SECONDS):
+        self._client_factory = client_factory
+        self.grace_seconds = grace_seconds
+        self._lock = threading.Lock()
+        self._upstreams: Dict[str, _Upstream] = {}
+        self.streams_opened = 0
+
+    def subscribe(self, container_id: str, maxsize: int = STATS_HUB_QUEUE_SIZE) -> StatsSubscription:
+        """Attach a subscriber; must be called from the consumer's event loop."""
+        subscription = StatsSubscription(container_id, asyncio.get_running_loop(), maxsize)
+        with self._lock:
+            upstream = self._upstreams.get(container_id)
+            if upstream is None:
+                upstream = self._upstreams[container_id] = _Upstream(container_id)
+                upstream.thread = threading.Thread(
+                    target=self._read, args=(upstream,), name=f"stats-hub-{container_id[:12]}", daemon=True
+                )
+                self.streams_opened += 1
+                upstream.thread.start()
+            elif upstream.teardown is not None:
+                upstream.teardown.cancel()
+                upstream.teardown = None
+            upstream.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: StatsSubscription) -> None:
+        subscription.closed = True
+        with self._lock:
+            upstream = self._upstreams.get(subscription.container_id)
+            if upstream is None:
+                return
+            upstream.subscribers.discard(subscription)
+            if upstream.subscribers or upstream.teardown is not None:
+                return
+            if self.grace_seconds <= 0:
+                self._close(upstream)
+                return
+            upstream.teardown = threading.Timer(self.grace_seconds, self._expire, args=(upstream,))
+            upstream.teardown.daemon = True
+            upstream.teardown.start()
+
+    def _expire(self, upstream: _Upstream) -> None:
+        with self._lock:
+            # a timer cancelled by a resubscribe may still fire; only the current one may close
+            if upstream.teardown is threading.current_thread() and not upstream.subscribers:
+                self._close(upstream)
+
+    def _close(self, upstream: _Upstream) -> None:
+        # caller holds self._lock; the reader thread notices the flag on its next sample
+        upstream.stop.set()
+        upstream.teardown = None
+        if self._upstreams.get(upstream.container_id) is upstream:
+            del self._upstreams[upstream.container_id]
+
+    def _read(self, upstream: _Upstream) -> None:
+        stream = None
+        try:
+            stream = self._open_stream(upstream.container_id)
+            for sample in stream:
+                if upstream.stop.is_set():
+                    break
+                with self._lock:
+                    subscribers = list(upstream.subscribers)
+                for subscription in subscribers:
+                    subscription.push(sample)
+        except Exception as e:
+            logger.warning(f"Stats stream for {upstream.container_id} failed: {e}")
+        finally:
+            if stream is not None and hasattr(stream, "close"):
+                stream.close()
+            with self._lock:
+                if self._upstreams.get(upstream.container_id) is upstream:
+                    del self._upstreams[upstream.container_id]
+                if upstream.teardown is not None:
+                    upstream.teardown.cancel()
+                subscribers = list(upstream.subscribers)
+            for subscription in subscribers:
+                subscription.push(END_OF_STREAM)
+            logger.info(f"Stats stream closed for container {upstream.container_id}")
+
+    def _open_stream(self, container_id: str):
+        if use_cgroup_stats():
+            try:
+                cgroup_stats.cgroup_path(container_id)
+                return cgroup_stats.stream(container_id, STATS_HUB_CGROUP_INTERVAL)
+            except FileNotFoundError:
+                pass
+        return self._client_factory().api.stats(container_id, stream=True, decode=True)
+
+    def stop(self) -> None:
+        with self._lock:
+            for upstream in list(self._upstreams.values()):
+                self._close(upstream)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            upstreams = list(self._upstreams.values())
+            return {
+                "streams": len(upstreams),
+                "subscribers": sum(len(u.subscribers) for u in upstreams),
+                "streams_opened": self.streams_opened,
+                "dropped": sum(s.dropped for u in upstreams for s in u.subscribers),
+            }
+
+
+stats_hub = StatsHub()
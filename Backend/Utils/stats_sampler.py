@@ -0,0 +1,207 @@
+"""
+Background sampler that keeps the latest stats sample per running container.
+
+`container.stats(stream=False)` makes the daemon wait for a second CPU
+reading, so each call blocks for one to two seconds. The sampler instead
+polls every running container in the background: the first sample takes
+the daemon's two readings, later ones use `one-shot` requests and fill
+`precpu_stats` from the previous sample. Readers get the latest sample with
+its timestamp; a blocking fetch is only needed for a container that has
+not been sampled yet. With `STATS_BACKEND=cgroup` samples are read from
+cgroup files instead and the daemon is only asked for the container list.
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from docker.errors import InvalidVersion, NotFound
+
+from Utils.cgroup_stats import CgroupStatsReader, cgroup_stats, use_cgroup_stats
+from Utils.containers import list_containers
+from Utils.getDocker import get_docker_client
+from Utils.logger import logger
+from Utils.stats_batch import Sweep, SweepTracker
+
+SAMPLE_INTERVAL_SECONDS = float(os.getenv("STATS_SAMPLE_INTERVAL", "5"))
+SAMPLER_WORKERS = int(os.getenv("STATS_SAMPLER_WORKERS", "8"))
+
+# Container actions after which a container stops producing stats
+STOPPED_ACTIONS = {"die", "stop", "kill", "destroy", "pause"}
+
+
+class StatsSample(NamedTuple):
+    stats: Dict[str, Any]
+    sampled_at: float
+
+
+SampleListener = Callable[[str, StatsSample], None]
+BatchListener = Callable[[Sweep], None]
+
+
+class StatsSampler:
+    def __init__(self, interval: float = SAMPLE_INTERVAL_SECONDS, workers: int = SAMPLER_WORKERS,
+                 cgroup: Optional[CgroupStatsReader] = None,
+                 client_factory: Callable[[], Any] = get_docker_client):
+        self.interval = interval
+        self._client_factory = client_factory
+        self.workers = workers
+        self._cgroup = cgroup
+        self._lock = threading.Lock()
+        self._samples: Dict[str, StatsSample] = {}
+        self._listeners: List[SampleListener] = []
+        self._batch_listeners: List[BatchListener] = []
+        self._sweeps = SweepTracker()
+        self._client: Any = None
+        self._one_shot = True
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def subscribe(self, listener: SampleListener) -> None:
+        """Register a callback invoked with every new sample."""
+        self._listeners.append(listener)
+
+    def subscribe_batch(self, listener: BatchListener) -> None:
+        """Register a callback invoked once per sweep with the `Sweep` computed from every sample it took."""
+        self._batch_listeners.append(listener)
+
+    # --- lifecycle ---------------------------------------------------------
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        if self._cgroup is None and use_cgroup_stats():
+            self._cgroup = cgroup_stats
+            logger.info("Stats sampler reading cgroup v2 files directly")
+        self._stop.clear()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="stats-sampler")
+        self._thread = threading.Thread(target=self._run, name="stats-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                # resolved per sweep so a daemon that is down at startup is picked up once it appears
+                self._client = self._client_factory()
+                self.sample_all()
+            except Exception as e:
+                logger.warning(f"Stats sampling failed: {e}")
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    # --- sampling ------------------------------------------------------------
+
+    def sample_all(self) -> None:
+        """Take one sample of every running container."""
+        running = [c.id for c in list_containers(self._client, all=False)]
+        if self._executor is not None:
+            samples = list(self._executor.map(self._sample_quietly, running))
+        else:
+            samples = [self._sample_quietly(container_id) for container_id in running]
+
+        alive = set(running)
+        with self._lock:
+            for container_id in [cid for cid in self._samples if cid not in alive]:
+                del self._samples[container_id]
+                self._sweeps.forget(container_id)
+
+        sweep = self._sweeps.build({cid: sample for cid, sample in zip(running, samples) if sample is not None})
+        for listener in list(self._batch_listeners):
+            try:
+                listener(sweep)
+            except Exception as e:
+                logger.warning(f"Stats batch listener {getattr(listener, '__qualname__', listener)} failed: {e}")
+
+    def _sample_quietly(self, container_id: str) -> Optional[StatsSample]:
+        try:
+            return self.sample(container_id)
+        except NotFound:
+            self.forget(container_id)
+        except Exception as e:
+            logger.debug(f"Stats sample for {container_id} failed: {e}")
+        return None
+
+    def sample(self, container_id: str) -> StatsSample:
+        previous = self._samples.get(container_id)
+        if self._cgroup is not None:
+            try:
+                return self._store(container_id, self._cgroup.read(container_id, previous and previous.stats))
+            except FileNotFoundError:
+                # unknown cgroup layout or the container just exited; let the daemon answer
+                pass
+        if previous is None:
+            # the first sample pays for the daemon's two readings so its CPU figure is usable
+            return self._store(container_id, self._client.api.stats(container_id, stream=False))
+        stats = self._fetch_one_shot(container_id)
+        if not (stats.get("precpu_stats") or {}).get("system_cpu_usage"):
+            stats["precpu_stats"] = previous.stats.get("cpu_stats", {})
+        return self._store(container_id, stats)
+
+    def _fetch_one_shot(self, container_id: str) -> Dict[str, Any]:
+        api = self._client.api
+        if self._one_shot:
+            try:
+                return api.stats(container_id, stream=False, one_shot=True)
+            except InvalidVersion:
+                # one-shot needs API 1.41+; older daemons always take two readings
+                self._one_shot = False
+        return api.stats(container_id, stream=False)
+
+    def _store(self, container_id: str, stats: Dict[str, Any]) -> StatsSample:
+        sample = StatsSample(stats=stats, sampled_at=time.time())
+        with self._lock:
+            self._samples[container_id] = sample
+        for listener in list(self._listeners):
+            try:
+                listener(container_id, sample)
+            except Exception as e:
+                logger.warning(f"Stats listener {getattr(listener, '__qualname__', listener)} failed: {e}")
+        return sample
+
+    # --- reads ---------------------------------------------------------------
+
+    def latest(self, container_id: str) -> Optional[StatsSample]:
+        return self._samples.get(container_id)
+
+    def samples(self) -> Dict[str, StatsSample]:
+        """Latest sample of every container, as of the last sweep."""
+        with self._lock:
+            return dict(self._samples)
+
+    def latest_or_fetch(self, container: Any) -> StatsSample:
+        """Latest sample, or a blocking two-reading fetch when none exists (or the sampler stalled)."""
+        sample = self._samples.get(container.id)
+        if sample is not None and time.time() - sample.sampled_at <= 3 * self.interval:
+            return sample
+        return self._store(container.id, container.stats(stream=False))
+
+    def forget(self, container_id: str) -> None:
+        with self._lock:
+            self._samples.pop(container_id, None)
+            self._sweeps.forget(container_id)
+        if self._cgroup is not None:
+            self._cgroup.forget(container_id)
+
+    def handle_event(self, event: dict) -> None:
+        if event.get("Type") != "container":
+            return
+        if (event.get("Action") or "").split(":")[0] in STOPPED_ACTIONS:
+            self.forget((event.get("Actor") or {}).get("ID") or event.get("id", ""))
+
+
+stats_sampler = StatsSampler()
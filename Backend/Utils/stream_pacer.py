@@ -0,0 +1,129 @@
+"""
+Per-subscriber pacing for the stats websockets.
+
+Each socket sends at most one frame per `interval` seconds, always the
+newest sample (anything older is skipped, never queued). Clients steer it
+with control messages:
+
+    {"interval": 5}        request a new interval (clamped to 0.25-30 s)
+    {"action": "pause"}    stop sending, e.g. while the tab is hidden
+    {"action": "resume"}
+
+The pacer also backs off on its own: when a send takes more than half the
+interval (the client's socket buffer is full, so the send has to wait)
+the interval doubles, and it steps back toward the requested interval
+after a run of fast sends. Every change is reported to the client as a
+`{"type": "pacing", ...}` message.
+"""
+import asyncio
+import json
+import os
+from typing import Any, Callable, Dict, Optional
+
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+MIN_INTERVAL = float(os.getenv("STATS_MIN_INTERVAL", "0.25"))
+MAX_INTERVAL = float(os.getenv("STATS_MAX_INTERVAL", "30"))
+
+# A send slower than this share of the interval counts as backpressure
+SLOW_SEND_RATIO = 0.5
+# Consecutive fast sends (under a tenth of the interval) before speeding back up
+RECOVER_AFTER = 5
+
+
+def clamp_interval(seconds: float) -> float:
+    return min(MAX_INTERVAL, max(MIN_INTERVAL, seconds))
+
+
+class StreamPacer:
+    def __init__(self, interval: float = 1.0):
+        self.requested = clamp_interval(interval)
+        self.interval = self.requested
+        self.paused = False
+        self.backoffs = 0
+        self._fast_sends = 0
+        self._announce = False
+        self._changed = asyncio.Event()
+
+    def apply(self, message: Any) -> bool:
+        """Handle a control message; False when it is not a pacing message."""
+        if not isinstance(message, dict):
+            return False
+        handled = False
+        if "interval" in message:
+            try:
+                self.requested = clamp_interval(float(message["interval"]))
+            except (TypeError, ValueError):
+                return False
+            self.interval = self.requested
+            self._fast_sends = 0
+            handled = True
+        action = message.get("action")
+        if action in ("pause", "resume"):
+            self.paused = action == "pause"
+            handled = True
+        if handled:
+            self._announce = True
+            self._changed.set()
+        return handled
+
+    def wake(self) -> None:
+        """Cut the current wait short, e.g. after a control message the pacer does not handle itself."""
+        self._changed.set()
+
+    def record_send(self, seconds: float) -> bool:
+        """Feed back how long a send took; True when the effective interval changed."""
+        if seconds > SLOW_SEND_RATIO * self.interval:
+            self._fast_sends = 0
+            if self.interval < MAX_INTERVAL:
+                self.interval = clamp_interval(self.interval * 2)
+                self.backoffs += 1
+                self._announce = True
+                return True
+            return False
+        if self.interval > self.requested and seconds < 0.1 * self.interval:
+            self._fast_sends += 1
+            if self._fast_sends >= RECOVER_AFTER:
+                self._fast_sends = 0
+                self.interval = max(self.requested, self.interval / 2)
+                self._announce = True
+                return True
+        return False
+
+    async def wait(self, seconds: Optional[float], stop: asyncio.Future) -> None:
+        """Sleep up to `seconds` (forever when None), waking early on a control message or when `stop` completes."""
+        changed = asyncio.ensure_future(self._changed.wait())
+        try:
+            await asyncio.wait({changed, stop}, timeout=seconds, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            changed.cancel()
+        self._changed.clear()
+
+    def status(self) -> Dict[str, Any]:
+        return {"type": "pacing", "interval": self.interval, "requested": self.requested, "paused": self.paused}
+
+    def take_status(self) -> Optional[Dict[str, Any]]:
+        """The pacing message to send after a change, once; None when nothing changed."""
+        if not self._announce:
+            return None
+        self._announce = False
+        return self.status()
+
+
+async def receive_controls(websocket: WebSocket, handle: Callable[[Any], Any]) -> None:
+    """Feed every JSON text message to `handle` until the client disconnects; binary frames and bad JSON are skipped."""
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            text = message.get("text")
+            if text is None:
+                continue
+            try:
+                payload = json.loads(text)
+            except ValueError:
+                continue
+            handle(payload)
+    except WebSocketDisconnect:
+        pass
@@ -0,0 +1,243 @@
+"""
+Rule-based performance warnings evaluated incrementally.
+
+Threshold rules are checked once per stats sample against a small state
+record per (container, rule): when the value first crosses `threshold` the
+breach start is remembered, and the warning fires once the breach has
+lasted `duration` seconds. It only clears when the value drops below
+`clear_below`, so a value hovering around the threshold does not flap, or
+when the container stops and there are no more samples to judge it by.
+CPU is judged against what the container may use: its CPU limit (looked
+up once per container with an inspect), or every online CPU when it has
+none. Event rules (OOM kills, repeated restarts) are fed from the Docker event
+stream. Nothing ever rescans history.
+"""
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from Utils.container_index import container_index
+from Utils.docker_events import RestartDetector
+from Utils.getDocker import get_docker_client
+from Utils.logger import logger
+from Utils.stats import _calculate_cpu_percent
+
+SEVERITY_ORDER = {"critical": 0, "warning": 1, "info": 2}
+
+RECENT_WARNINGS = 200
+OOM_HOLD_SECONDS = 600.0
+RESTART_WINDOW_SECONDS = 300.0
+RESTART_THRESHOLD = 3
+
+# Events after which a container produces no more samples
+STOP_ACTIONS = ("die", "stop", "kill")
+
+
+def cpu_limit_cores(host_config: dict) -> Optional[float]:
+    """CPU cores a container may use from its HostConfig (`--cpus` or quota/period); None when unlimited."""
+    nano_cpus = host_config.get("NanoCpus") or 0
+    if nano_cpus > 0:
+        return nano_cpus / 1_000_000_000
+    quota, period = host_config.get("CpuQuota") or 0, host_config.get("CpuPeriod") or 100_000
+    if quota > 0:
+        return quota / period
+    return None
+
+
+def inspect_cpu_limit(container_id: str) -> Optional[float]:
+    return cpu_limit_cores(get_docker_client().api.inspect_container(container_id).get("HostConfig") or {})
+
+
+def cpu_percent_of_limit(stats: dict, cpu_limit: Optional[float] = None) -> float:
+    """CPU use as a share of what the container may use (0-100): `cpu_limit` cores, or every online CPU."""
+    cpu = stats.get("cpu_stats") or {}
+    # `_calculate_cpu_percent` scales by the per-CPU entries it sees (none on cgroup v2)
+    counted = len((cpu.get("cpu_usage") or {}).get("percpu_usage") or ()) or 1
+    online = cpu.get("online_cpus") or counted
+    percent_of_one_core = _calculate_cpu_percent(stats) / counted * online
+    return percent_of_one_core / min(cpu_limit or online, online)
+
+
+def memory_percent(stats: dict, cpu_limit: Optional[float] = None) -> float:
+    memory = stats.get("memory_stats") or {}
+    limit = memory.get("limit") or 0
+    return memory.get("usage", 0) / limit * 100.0 if limit else 0.0
+
+
+class ThresholdRule(NamedTuple):
+    name: str
+    severity: str
+    metric: Callable[[dict, Optional[float]], float]  # (stats, CPU limit in cores or None)
+    threshold: float
+    clear_below: float
+    duration: float
+    message: str
+
+
+DEFAULT_RULES: Tuple[ThresholdRule, ...] = (
+    ThresholdRule("high_cpu", "warning", cpu_percent_of_limit, 90.0, 80.0, 60.0,
+                  "CPU above 90% of its limit for over a minute"),
+    ThresholdRule("memory_near_limit", "critical", memory_percent, 95.0, 90.0, 0.0,
+                  "Memory above 95% of its limit"),
+)
+
+
+class WarningRecord(NamedTuple):
+    container_id: str
+    container_name: str
+    rule: str
+    severity: str
+    message: str
+    value: Optional[float]
+    since: float
+    resolved_at: Optional[float]
+
+
+class _RuleState:
+    __slots__ = ("breach_since", "active")
+
+    def __init__(self):
+        self.breach_since: Optional[float] = None
+        self.active: Optional[WarningRecord] = None
+
+
+class WarningEngine:
+    def __init__(self, rules: Tuple[ThresholdRule, ...] = DEFAULT_RULES,
+                 cpu_limit: Callable[[str], Optional[float]] = inspect_cpu_limit):
+        self.rules = rules
+        self._cpu_limit = cpu_limit
+        self._cpu_limits: Dict[str, Optional[float]] = {}
+        self._lock = threading.Lock()
+        self._states: Dict[str, List[_RuleState]] = {}
+        self._event_warnings: Dict[Tuple[str, str], WarningRecord] = {}
+        self._restarts: Dict[str, Deque[float]] = {}
+        self._restart_detector = RestartDetector()
+        self._recent: Deque[WarningRecord] = deque(maxlen=RECENT_WARNINGS)
+
+    # --- threshold rules -----------------------------------------------------
+
+    def _limit_of(self, container_id: str) -> Optional[float]:
+        if container_id in self._cpu_limits:
+            return self._cpu_limits[container_id]
+        try:
+            limit = self._cpu_limit(container_id)
+        except Exception as e:
+            logger.debug(f"CPU limit lookup for {container_id} failed: {e}")
+            limit = None
+        self._cpu_limits[container_id] = limit
+        return limit
+
+    def evaluate(self, container_id: str, stats: dict, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        cpu_limit = self._limit_of(container_id)
+        with self._lock:
+            states = self._states.get(container_id)
+            if states is None:
+                states = self._states[container_id] = [_RuleState() for _ in self.rules]
+            for rule, state in zip(self.rules, states):
+                value = rule.metric(stats, cpu_limit)
+                if value > rule.threshold:
+                    if state.breach_since is None:
+                        state.breach_since = now
+                    if state.active is None and now - state.breach_since >= rule.duration:
+                        state.active = self._warning(container_id, rule.name, rule.severity, rule.message,
+                                                     value, state.breach_since)
+                elif value < rule.clear_below:
+                    state.breach_since = None
+                    if state.active is not None:
+                        self._recent.append(state.active._replace(resolved_at=now))
+                        state.active = None
+            self._expire_event_warnings(now)
+
+    def on_sample(self, container_id: str, sample) -> None:
+        """`StatsSampler` listener."""
+        self.evaluate(container_id, sample.stats, sample.sampled_at)
+
+    # --- event rules ---------------------------------------------------------
+
+    def handle_event(self, event: dict) -> None:
+        if event.get("Type") != "container":
+            return
+        action = (event.get("Action") or "").split(":")[0]
+        actor = event.get("Actor") or {}
+        container_id = actor.get("ID") or event.get("id")
+        if not container_id:
+            return
+        now = float(event.get("time") or time.time())
+        name = (actor.get("Attributes") or {}).get("name")
+
+        with self._lock:
+            if action == "oom":
+                self._raise_event_warning(container_id, "oom_killed", "critical",
+                                          "Container was killed for running out of memory", None, now, name)
+            elif self._restart_detector.observe(action, container_id):
+                restarts = self._restarts.setdefault(container_id, deque())
+                restarts.append(now)
+                while restarts and now - restarts[0] > RESTART_WINDOW_SECONDS:
+                    restarts.popleft()
+                if len(restarts) >= RESTART_THRESHOLD:
+                    self._raise_event_warning(
+                        container_id, "restart_loop", "warning",
+                        f"Container restarted {len(restarts)} times in the last {int(RESTART_WINDOW_SECONDS // 60)} minutes",
+                        float(len(restarts)), restarts[0], name)
+            elif action == "destroy":
+                self._forget(container_id, now)
+            if action in STOP_ACTIONS:
+                self._resolve_thresholds(container_id, now)
+            if action in STOP_ACTIONS or action in ("update", "destroy"):
+                # `docker update --cpus` or a restart may change the limit; look it up again
+                self._cpu_limits.pop(container_id, None)
+
+    def _raise_event_warning(self, container_id: str, rule: str, severity: str, message: str,
+                             value: Optional[float], since: float, name: Optional[str]) -> None:
+        key = (container_id, rule)
+        current = self._event_warnings.get(key)
+        if current is not None:
+            self._event_warnings[key] = current._replace(value=value, message=message)
+            return
+        self._event_warnings[key] = self._warning(container_id, rule, severity, message, value, since, name)
+
+    def _expire_event_warnings(self, now: float) -> None:
+        for key, warning in list(self._event_warnings.items()):
+            if warning.rule == "oom_killed":
+                expired = now - warning.since > OOM_HOLD_SECONDS
+            else:
+                restarts = self._restarts.get(warning.container_id) or deque()
+                expired = not restarts or now - restarts[-1] > RESTART_WINDOW_SECONDS
+            if expired:
+                del self._event_warnings[key]
+                self._recent.append(warning._replace(resolved_at=now))
+
+    def _resolve_thresholds(self, container_id: str, now: float) -> None:
+        for state in self._states.pop(container_id, []):
+            if state.active is not None:
+                self._recent.append(state.active._replace(resolved_at=now))
+
+    def _forget(self, container_id: str, now: float) -> None:
+        self._resolve_thresholds(container_id, now)
+        for key in [k for k in self._event_warnings if k[0] == container_id]:
+            self._recent.append(self._event_warnings.pop(key)._replace(resolved_at=now))
+        self._restarts.pop(container_id, None)
+
+    # --- reads -----------------------------------------------------------------
+
+    @staticmethod
+    def _warning(container_id: str, rule: str, severity: str, message: str, value: Optional[float],
+                 since: float, name: Optional[str] = None) -> WarningRecord:
+        name = name or container_index.name_of(container_id) or container_id[:12]
+        return WarningRecord(container_id, name, rule, severity, message, value, since, None)
+
+    def active(self) -> List[WarningRecord]:
+        with self._lock:
+            self._expire_event_warnings(time.time())
+            warnings = [state.active for states in self._states.values() for state in states if state.active]
+            warnings.extend(self._event_warnings.values())
+        return sorted(warnings, key=lambda w: (SEVERITY_ORDER.get(w.severity, 9), w.since))
+
+    def recent(self) -> List[WarningRecord]:
+        with self._lock:
+            return list(reversed(self._recent))
+
+
+warning_engine = WarningEngine()
@@ -1,26 +1,29 @@
 import asyncio
 import logging
 import threading
-from typing import List, Optional
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import List, Optional, Literal
 
 import docker
 from docker.errors import DockerException
-from docker.models.containers import Container
-from fastapi import FastAPI, Query, WebSocket, Body
+from fastapi import FastAPI, Query, WebSocket, Body, Response, HTTPException
 from fastapi import Path
 from starlette.middleware.cors import CORSMiddleware
-from starlette.responses import StreamingResponse
+from starlette.responses import StreamingResponse, JSONResponse
 from starlette.websockets import WebSocketDisconnect
 
 from Models.NetworkMapModel import DockerNetworkGraphResponse
 from Models.models import (
     ContainerSummary,
     ContainerDetails,
+    ContainerStatusEnum,
     GenericMessageResponse, DockerImageSummary, DockerVolumeSummary, DockerOverview, ContainerStats, LogInfo,
-    PerformanceWarning, DockerNetworkOverview, ContainerLogsResponse, PullImageRequest,
+    PerformanceWarning, PerformanceWarnings, DockerNetworkOverview, QueryCoalescingStats, ContainerLogsResponse, PullImageRequest,
     CreateVolumeRequest, CreatedVolumeResponse, VolumeSelectList, AttachVolumeRequest,
     CreateContainerRequest, CreateDockerNetworkRequest, AssignNetworkRequest, DisconnectNetworkRequest,
-    AssignMultipleNetworksRequest, AssignNetworkWithIPRequest, DockerNetworkSelectItem
+    AssignMultipleNetworksRequest, AssignNetworkWithIPRequest, DockerNetworkSelectItem, DockerStateInfo,
+    ContainerDetailsBatchRequest, ContainerDetailsBatchItem, StatsHubInfo, ContainerMetrics
 )
 from Routes.Commands.AssignNetworkToContainer.assign_multiple_networks_to_container_command import \
     assign_multiple_networks_to_container_command
@@ -40,28 +43,80 @@ from Routes.Commands.DisconnectNetworkFromContainer.disconnect_network_from_cont
     disconnect_network_from_container_command
 from Routes.Commands.PullDockerImage.stream_pull_with_progress_and_summary_query import \
     stream_pull_with_progress_and_summary_query
-from Routes.Commands.RestartContainer.restart_container_command import restart_container_command
-from Routes.Commands.StartContainer.start_container_command import start_container_command
-from Routes.Commands.StopContainer.stop_container_command import stop_container_command
-from Routes.Queries.GetConainersList.get_containers_list_query import get_containers_list_query
+from Routes.Commands.RestartContainer.restart_container_command import restart_container_command_async
+from Routes.Commands.StartContainer.start_container_command import start_container_command_async
+from Routes.Commands.StopContainer.stop_container_command import stop_container_command_async
+from Routes.Queries.GetConainersList.get_containers_list_query import get_containers_list_query, next_cursor, \
+    cursor_fields
 from Routes.Queries.GetContainerDetail.get_container_details_query import get_container_details_query
+from Routes.Queries.GetContainerDetailsBatch.get_container_details_batch_query import \
+    get_container_details_batch_query
 from Routes.Queries.GetContainerLogs.get_container_logs_query import get_container_logs_query
+from Routes.Queries.GetContainerMetrics.get_container_metrics_query import get_container_metrics_query
 from Routes.Queries.GetContainerVolumes.get_container_volumes_query import get_container_volumes_query
 from Routes.Queries.GetDockerImages.get_docker_images_query import get_docker_images_query
 from Routes.Queries.GetDockerNetworkOverview.get_docker_networks_overview_query import \
     get_docker_networks_overview_query
 from Routes.Queries.GetDockerOverview.get_docker_overview_query import get_docker_overview_query
-from Routes.Queries.GetDockerStatus.check_docker_status_query import check_docker_status_query
+from Routes.Queries.GetDockerStatus.check_docker_status_query import check_docker_status_query_async
 from Routes.Queries.GetDockerVolumes.get_docker_volumes_query import get_docker_volumes_query
 from Routes.Queries.GetNetworkMap.get_docker_network_map import get_docker_network_map
 from Routes.Queries.GetNetworksSmallList.list_docker_networks_lite_query import list_docker_networks_lite_query
+from Routes.Queries.GetPerformanceWarnings.get_performance_warnings_query import get_performance_warning_query, \
+    get_performance_warnings_query
 from Routes.Queries.GetTopContainers.get_top_containers_query import get_top_containers_query
 from Routes.Queries.ListDockerVolumesSelectList.list_docker_volumes_lite_query import list_docker_volumes_lite_query
-from Utils.getDocker import get_container
+from Utils.async_docker import close_async_docker_client, get_container_async
+from Utils.container_index import container_index
+from Utils.docker_events import event_watcher
+from Utils.error_tracker import error_tracker
+from Utils.frame_codec import negotiate, send_frame, CODECS
+from Utils.getDocker import get_docker_client, init_docker_client, close_docker_client
 from Utils.logger import logger
-from Utils.stats import _extract_network_io, _extract_blk_io, _calculate_cpu_percent
-
-app = FastAPI()
+from Utils.metrics_store import metrics_store
+from Utils.network_cache import network_cache
+from Utils.prometheus_exporter import render_metrics, request_latency, restart_counter, RequestLatencyMiddleware, \
+    CONTENT_TYPE as METRICS_CONTENT_TYPE
+from Utils.projection import parse_fields, select_fields
+from Utils.single_flight import coalescer
+from Utils.state_cache import state_cache
+from Utils.stats_sampler import stats_sampler
+from Utils.stats import build_stats_frame
+from Utils.stats_feed import stats_feed, valid_subscription, FeedSession, COLUMNS as STATS_FEED_COLUMNS, \
+    STATS_FEED_DELTA
+from Utils.stats_hub import stats_hub, END_OF_STREAM
+from Utils.stream_pacer import StreamPacer, receive_controls, MIN_INTERVAL, MAX_INTERVAL
+from Utils.warning_engine import warning_engine
+
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    init_docker_client()
+    event_watcher.subscribe(container_index.handle_event, on_connect=container_index.seed)
+    event_watcher.subscribe(state_cache.handle_event, on_connect=state_cache.seed)
+    event_watcher.subscribe(error_tracker.handle_event)
+    event_watcher.subscribe(stats_sampler.handle_event)
+    event_watcher.subscribe(network_cache.handle_event)
+    event_watcher.subscribe(metrics_store.handle_event)
+    event_watcher.subscribe(warning_engine.handle_event)
+    event_watcher.subscribe(restart_counter.handle_event)
+    stats_sampler.subscribe_batch(metrics_store.on_batch)
+    stats_sampler.subscribe_batch(stats_feed.on_batch)
+    stats_sampler.subscribe(warning_engine.on_sample)
+    event_watcher.start()
+    state_cache.start()
+    stats_sampler.start()
+    yield
+    stats_sampler.stop()
+    stats_hub.stop()
+    state_cache.stop()
+    event_watcher.stop()
+    await close_async_docker_client()
+    close_docker_client()
+
+
+app = FastAPI(lifespan=lifespan)
 logging.basicConfig(level=logging.INFO)
 
 app.add_middleware(
@@ -70,26 +125,67 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
+app.add_middleware(RequestLatencyMiddleware, histogram=request_latency)
+
+
+@app.get("/metrics", include_in_schema=False)
+def get_prometheus_metrics() -> Response:
+    samples = stats_sampler.samples()
+    names = {cid: container_index.name_of(cid) for cid in samples}
+    restarts = dict(restart_counter.counts)
+    names.update({cid: container_index.name_of(cid) for cid in restarts if cid not in names})
+    body = render_metrics(samples, names, restarts, state_cache.snapshot() if state_cache.ready else None,
+                          request_latency)
+    return Response(content=body, media_type=METRICS_CONTENT_TYPE)
 
 
 @app.get("/docker-status", response_model=GenericMessageResponse, operation_id="checkDockerStatus")
-def check_docker_status() -> GenericMessageResponse:
-    return check_docker_status_query()
+async def check_docker_status() -> GenericMessageResponse:
+    return await check_docker_status_query_async()
 
 @app.get("/docker/overview", response_model=DockerOverview, operation_id="getDockerOverview")
 def get_docker_overview() -> DockerOverview:
     return get_docker_overview_query()
 
 
+@app.get("/docker/state", response_model=DockerStateInfo, operation_id="getDockerStateInfo")
+def get_docker_state_info() -> DockerStateInfo:
+    snapshot = state_cache.snapshot()
+    return DockerStateInfo(
+        ready=state_cache.ready,
+        revision=snapshot.revision,
+        containers=len(snapshot.containers),
+        images=len(snapshot.images),
+        volumes=len(snapshot.volumes),
+        networks=len(snapshot.networks),
+        last_reconciled_at=state_cache.last_reconciled_at,
+    )
+
+
+@app.get("/docker/query-stats", response_model=QueryCoalescingStats, operation_id="getQueryCoalescingStats")
+def get_query_coalescing_stats() -> QueryCoalescingStats:
+    return QueryCoalescingStats(**coalescer.stats())
+
+
 @app.get("/docker/top-containers", response_model=List[ContainerStats], operation_id="getTopContainers")
-def get_top_containers() -> List[ContainerStats]:
-    return get_top_containers_query()
+def get_top_containers(
+    by: Literal["cpu", "memory", "network", "block_io"] = Query("cpu", description="Metric to rank by"),
+    k: int = Query(4, ge=1, le=100, description="Number of containers to return"),
+    window: Optional[str] = Query(None, description="Average over a trailing window, e.g. 60s or 5m"),
+) -> List[ContainerStats]:
+    return get_top_containers_query(by, k, window)
 
 
 @app.get("/docker/performance-warning", response_model=PerformanceWarning, operation_id="getPerformanceWarning")
-def get_performance_warning():
-    return PerformanceWarning(message="High CPU usage detected in container 'db'")
+def get_performance_warning() -> PerformanceWarning:
+    return get_performance_warning_query()
+
+
+@app.get("/docker/performance-warnings", response_model=PerformanceWarnings, operation_id="getPerformanceWarnings")
+def get_performance_warnings() -> PerformanceWarnings:
+    return get_performance_warnings_query()
 
 
 @app.get("/docker/logs/latest", response_model=LogInfo, operation_id="getLatestLog")
@@ -98,58 +194,155 @@ def get_latest_log():
 
 
 @app.get("/containers", response_model=List[ContainerSummary], operation_id="listContainers")
-def list_containers(all: bool = Query(True, description="Show all containers, including stopped")):
-    return get_containers_list_query(all)
+def list_containers(
+    response: Response,
+    all: bool = Query(True, description="Show all containers, including stopped"),
+    status: Optional[List[ContainerStatusEnum]] = Query(None, description="Only containers in these states"),
+    name: Optional[str] = Query(None, description="Container name substring"),
+    image: Optional[str] = Query(None, description="Image tag or ID substring"),
+    label: Optional[List[str]] = Query(None, description="Label filter, `key` or `key=value`"),
+    project: Optional[str] = Query(None, description="Docker Compose project name"),
+    network: Optional[str] = Query(None, description="Attached network name or ID"),
+    sort_by: Optional[Literal["name", "created", "uptime", "error_count"]] = Query(None),
+    order: Literal["asc", "desc"] = Query("asc"),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Value of a previous X-Next-Cursor header"),
+    fields: Optional[str] = Query(None, description="Comma separated ContainerSummary fields to return"),
+):
+    projection = parse_fields(fields, ContainerSummary)
+    page = get_containers_list_query(
+        all,
+        status=tuple(status) if status else None,
+        name=name,
+        image=image,
+        label=tuple(label) if label else None,
+        project=project,
+        network=network,
+        sort_by=sort_by,
+        order=order,
+        limit=limit,
+        cursor=cursor,
+        fields=projection | cursor_fields(sort_by) if projection is not None and limit is not None else projection,
+    )
+    next_page = next_cursor(page, sort_by, limit)
+    headers = {"X-Next-Cursor": next_page} if next_page is not None else {}
+    if projection is not None:
+        return JSONResponse([select_fields(c, projection) for c in page], headers=headers)
+    response.headers.update(headers)
+    return page
 
 
 @app.get("/containers/{container_id}", response_model=ContainerDetails, operation_id="getContainerDetails")
-def get_container_details(container_id: str):
-    return get_container_details_query(container_id)
+def get_container_details(
+    container_id: str,
+    fields: Optional[str] = Query(None, description="Comma separated ContainerDetails fields to return"),
+):
+    projection = parse_fields(fields, ContainerDetails)
+    details = get_container_details_query(container_id, fields=projection)
+    if projection is not None:
+        return JSONResponse(select_fields(details, projection))
+    return details
+
+
+@app.get("/containers/{container_id}/metrics", response_model=ContainerMetrics, operation_id="getContainerMetrics")
+def get_container_metrics(
+    container_id: str,
+    start: Optional[float] = Query(None, alias="from", description="Range start (unix seconds), default 15 min ago"),
+    end: Optional[float] = Query(None, alias="to", description="Range end (unix seconds), default now"),
+    step: Optional[float] = Query(None, gt=0, description="Seconds between points, default picked from the range"),
+):
+    return get_container_metrics_query(container_id, start, end, step)
+
+
+@app.post(
+    "/containers/details:batch",
+    response_model=List[ContainerDetailsBatchItem],
+    operation_id="getContainerDetailsBatch",
+    summary="Load details for several containers at once, with per-item errors"
+)
+def get_container_details_batch(body: ContainerDetailsBatchRequest):
+    return get_container_details_batch_query(body.ids)
+
+
+async def accept_stats_socket(websocket: WebSocket, requested_format: Optional[str]):
+    """Accept with the negotiated frame codec; None (socket closed) when the format is unsupported."""
+    offered = websocket.scope.get("subprotocols") or []
+    codec = negotiate(requested_format, offered)
+    await websocket.accept(subprotocol=codec.subprotocol if codec and codec.subprotocol in offered else None)
+    if codec is None:
+        await websocket.send_json({"error": f"Unsupported format '{requested_format}', use one of: {', '.join(CODECS)}"})
+        await websocket.close()
+    return codec
 
 
 @app.websocket("/ws/containers/{container_id}/stats")
-async def stream_container_stats(websocket: WebSocket, container_id: str):
-    await websocket.accept()
+async def stream_container_stats(
+    websocket: WebSocket,
+    container_id: str,
+    format: Optional[str] = Query(None, description="Frame encoding: json, msgpack or binary"),
+    interval: float = Query(1.0, ge=MIN_INTERVAL, le=MAX_INTERVAL, description="Seconds between frames"),
+):
+    """
+    Live stats for one container, at most one frame per `interval` (always
+    the newest sample). Send `{"interval": n}`, `{"action": "pause"}` or
+    `{"action": "resume"}` to change pacing; while paused the upstream stats
+    stream is released.
+    """
+    codec = await accept_stats_socket(websocket, format)
+    if codec is None:
+        return
+    pacer = StreamPacer(interval)
+    subscription = None
+    receiver = None
+    loop = asyncio.get_running_loop()
     try:
-        container: Container = get_container(container_id)
-        if not container:
+        try:
+            container = await get_container_async(container_id)
+        except HTTPException as e:
+            if e.status_code != 404:
+                raise
             await websocket.send_json({"error": "Container not found"})
             await websocket.close()
             return
 
-        stats_stream = container.stats(stream=True, decode=True)
-        from datetime import datetime, timezone
-        started_at = container.attrs["State"]["StartedAt"]
+        started_at = container["State"]["StartedAt"]
         started_dt = datetime.fromisoformat(started_at.replace("Z", "+00:00"))
+        receiver = asyncio.create_task(receive_controls(websocket, pacer.apply))
 
-        while True:
+        while not receiver.done():
             try:
-                stats = next(stats_stream)
-                cpu_percent = _calculate_cpu_percent(stats)
-                per_cpu_usage = stats["cpu_stats"]["cpu_usage"].get("percpu_usage", [])
-                cpu_cores = len(per_cpu_usage)
-                mem_usage = stats["memory_stats"].get("usage", 0)
-                mem_limit = stats["memory_stats"].get("limit", 1)
-                mem_percent = round((mem_usage / mem_limit) * 100, 2)
-                net_io = _extract_network_io(stats)
-                blk_io = _extract_blk_io(stats)
-                uptime_seconds = int((datetime.now(timezone.utc) - started_dt).total_seconds())
-                await websocket.send_json({
-                    "cpu_percent": round(cpu_percent, 2),
-                    "cpu_cores": cpu_cores,
-                    "per_cpu_usage": per_cpu_usage,
-                    "memory_usage": mem_usage,
-                    "memory_limit": mem_limit,
-                    "memory_percent": mem_percent,
-                    "network_rx": net_io["rx"],
-                    "network_tx": net_io["tx"],
-                    "blk_read": blk_io["read"],
-                    "blk_write": blk_io["write"],
-                    "uptime_seconds": uptime_seconds,
-                })
-                await asyncio.sleep(1)
-
-            except (StopIteration, asyncio.CancelledError, WebSocketDisconnect):
+                status = pacer.take_status()
+                if status is not None:
+                    await websocket.send_json(status)
+                if pacer.paused:
+                    if subscription is not None:
+                        stats_hub.unsubscribe(subscription)
+                        subscription = None
+                    await pacer.wait(None, receiver)
+                    continue
+
+                if subscription is None:
+                    # one shared upstream stream per container, however many sockets watch it
+                    subscription = stats_hub.subscribe(container["Id"])
+                next_sample = asyncio.ensure_future(subscription.get())
+                await asyncio.wait({next_sample, receiver}, return_when=asyncio.FIRST_COMPLETED)
+                if not next_sample.done():
+                    next_sample.cancel()
+                    break
+                # skip anything that queued up while we waited; only the newest sample is sent
+                stats = next_sample.result()
+                while stats is not END_OF_STREAM and len(subscription):
+                    stats = subscription.get_nowait()
+                if stats is END_OF_STREAM:
+                    logger.info(f"Stats stream ended for container {container_id}")
+                    break
+
+                sent_at = loop.time()
+                await send_frame(websocket, codec, build_stats_frame(stats, started_dt))
+                pacer.record_send(loop.time() - sent_at)
+                await pacer.wait(max(0.0, pacer.interval - (loop.time() - sent_at)), receiver)
+
+            except (asyncio.CancelledError, WebSocketDisconnect):
                 logger.info(f"Stats stream stopped for container {container_id}")
                 break
             except Exception as e:
@@ -163,12 +356,86 @@ async def stream_container_stats(websocket: WebSocket, container_id: str):
         except RuntimeError:
             pass
     finally:
+        if receiver is not None:
+            receiver.cancel()
+        if subscription is not None:
+            stats_hub.unsubscribe(subscription)
+        try:
+            await websocket.close()
+        except RuntimeError:
+            pass
+
+
+@app.websocket("/ws/stats")
+async def stream_host_stats(
+    websocket: WebSocket,
+    interval: float = Query(1.0, ge=MIN_INTERVAL, le=MAX_INTERVAL, description="Seconds between frames"),
+    threshold: float = Query(STATS_FEED_DELTA, ge=0, le=1, description="Relative change needed to resend a row"),
+    containers: Optional[str] = Query(None, description="Comma-separated names/IDs; all running containers if omitted"),
+    format: Optional[str] = Query(None, description="Frame encoding: json, msgpack or binary"),
+):
+    """
+    One socket for every container: a `hello` message with the row layout,
+    then `stats` frames holding only rows that are new or changed, plus
+    `removed` IDs. Send `{"subscribe": ["web", "db"]}` (or `null` for all)
+    to change the set mid-stream, and the same pacing messages as the
+    per-container socket.
+    """
+    codec = await accept_stats_socket(websocket, format)
+    if codec is None:
+        return
+    session = FeedSession(threshold)
+    session.subscribe(containers.split(",") if containers else None)
+    pacer = StreamPacer(interval)
+    loop = asyncio.get_running_loop()
+
+    rejected: List[str] = []
+
+    def handle(message):
+        if isinstance(message, dict) and "subscribe" in message:
+            if valid_subscription(message["subscribe"]):
+                session.subscribe(message["subscribe"])
+            else:
+                rejected.append("subscribe must be a list of container names/IDs or null")
+            # send the new subset (or the error) now rather than after the current interval
+            pacer.wake()
+        pacer.apply(message)
+
+    receiver = asyncio.create_task(receive_controls(websocket, handle))
+    try:
+        await websocket.send_json({"type": "hello", "columns": list(STATS_FEED_COLUMNS), "interval": interval})
+        while not receiver.done():
+            while rejected:
+                await websocket.send_json({"error": rejected.pop(0)})
+            status = pacer.take_status()
+            if status is not None:
+                await websocket.send_json(status)
+            if pacer.paused:
+                await pacer.wait(None, receiver)
+                continue
+            frame = session.frame(stats_feed.snapshot())
+            if frame is not None:
+                sent_at = loop.time()
+                await send_frame(websocket, codec, frame)
+                pacer.record_send(loop.time() - sent_at)
+            await pacer.wait(pacer.interval, receiver)
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.warning(f"Host stats stream error: {e}")
+    finally:
+        receiver.cancel()
         try:
             await websocket.close()
         except RuntimeError:
             pass
 
 
+@app.get("/docker/stats-hub", response_model=StatsHubInfo, operation_id="getStatsHubInfo")
+def get_stats_hub_info() -> StatsHubInfo:
+    return StatsHubInfo(**stats_hub.stats())
+
+
 @app.get(
     "/containers/{container_id}/logs",
     response_model=ContainerLogsResponse,
@@ -184,18 +451,18 @@ def get_container_logs(
 
 
 @app.post("/containers/{container_id}/start", response_model=GenericMessageResponse, operation_id="startContainer")
-def start_container(container_id: str):
-    return start_container_command(container_id)
+async def start_container(container_id: str):
+    return await start_container_command_async(container_id)
 
 
 @app.post("/containers/{container_id}/stop", response_model=GenericMessageResponse, operation_id="stopContainer")
-def stop_container(container_id: str):
-    return stop_container_command(container_id)
+async def stop_container(container_id: str):
+    return await stop_container_command_async(container_id)
 
 
 @app.post("/containers/{container_id}/restart", response_model=GenericMessageResponse, operation_id="restartContainer")
-def restart_container(container_id: str):
-    return restart_container_command(container_id)
+async def restart_container(container_id: str):
+    return await restart_container_command_async(container_id)
 
 
 @app.delete(
@@ -212,8 +479,17 @@ def delete_container(
 
 
 @app.get("/images", response_model=List[DockerImageSummary], operation_id="listDockerImages")
-def list_docker_images():
-    return get_docker_images_query()
+def list_docker_images(
+        sort_by: Optional[Literal["size", "created"]] = Query(None, description="Sort images by size or creation time"),
+        order: Literal["asc", "desc"] = Query("desc", description="Sort direction"),
+        dangling: Optional[bool] = Query(None, description="Only untagged (true) or only tagged (false) images"),
+        in_use: Optional[bool] = Query(None, description="Only images used (true) or unused (false) by containers"),
+        limit: Optional[int] = Query(None, ge=1, description="Maximum number of images to return"),
+        offset: int = Query(0, ge=0, description="Number of images to skip"),
+):
+    return get_docker_images_query(
+        sort_by=sort_by, order=order, dangling=dangling, in_use=in_use, limit=limit, offset=offset
+    )
 
 
 @app.get("/volumes", response_model=List[DockerVolumeSummary], operation_id="listDockerVolumes")
@@ -383,34 +659,40 @@ def list_docker_networks_lite():
     return list_docker_networks_lite_query()
 
 
+def _open_exec_socket(container_id: str):
+    client = get_docker_client()
+    container = client.containers.get(container_id)
+
+    exec_id = client.api.exec_create(
+        container.id,
+        cmd="/bin/bash",
+        stdin=True,
+        tty=True,
+        stdout=True,
+        stderr=True,
+    )
+
+    return client.api.exec_start(exec_id["Id"], detach=False, tty=True, socket=True)
+
+
 @app.websocket("/ws/containers/{container_id}/terminal")
 async def websocket_container_terminal(websocket: WebSocket, container_id: str):
     await websocket.accept()
-    client = docker.from_env()
     loop = asyncio.get_event_loop()
     output_queue = asyncio.Queue()
     websocket_closed = False
 
     try:
-        container = client.containers.get(container_id)
-
-        exec_id = client.api.exec_create(
-            container.id,
-            cmd="/bin/bash",
-            stdin=True,
-            tty=True,
-            stdout=True,
-            stderr=True,
-        )
-
-        sock = client.api.exec_start(exec_id["Id"], detach=False, tty=True, socket=True)
+        # daemon calls block, so keep them off the event loop
+        sock = await asyncio.to_thread(_open_exec_socket, container_id)
 
         def read_from_docker_socket():
             try:
                 while True:
                     data = sock.recv(1024)
-                    if data:
-                        asyncio.run_coroutine_threadsafe(output_queue.put(data), loop)
+                    if not data:
+                        break
+                    asyncio.run_coroutine_threadsafe(output_queue.put(data), loop)
             except Exception:
                 pass
 
@@ -421,7 +703,7 @@ async def websocket_container_terminal(websocket: WebSocket, container_id: str):
             while True:
                 try:
                     text = await websocket.receive_text()
-                    sock.send(text.encode())
+                    await asyncio.to_thread(sock.sendall, text.encode())
                 except WebSocketDisconnect:
                     return "disconnected"
 